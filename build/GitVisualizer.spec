@@ -0,0 +1,89 @@
+# -*- mode: python ; coding: utf-8 -*-
+# PyInstaller spec pro GitVisualizer.exe
+# Použití: python build/build.py (nebo pyinstaller --noconfirm build/GitVisualizer.spec)
+# Cesty jsou relativní k této složce (SPECPATH), takže nezáleží na pracovním adresáři.
+
+import os
+from PyInstaller.utils.hooks import collect_all
+
+ROOT = os.path.abspath(os.path.join(SPECPATH, '..'))
+
+# Skryté importy pro kompletní funkcionalitu
+hiddenimports = [
+    'tkinter',
+    'tkinter.ttk',
+    'tkinter.messagebox',
+    'tkinter.filedialog',
+    'tkinter.constants',
+    'tkinter.font',
+    'tkinter.scrolledtext',
+    'tkinter.simpledialog',
+    '_tkinter',
+    'tkinterdnd2',
+    'git',
+    'git.exc',
+    'gitdb',
+    'PIL',
+    'PIL.Image',
+    'PIL.ImageTk',
+    'requests',
+    'auth',
+    'auth.github_auth',
+    'auth.token_storage',
+]
+datas = []
+binaries = []
+
+# Zabalit všechny git dependencies
+for package in ('git', 'gitdb'):
+    package_datas, package_binaries, package_hiddenimports = collect_all(package)
+    datas += package_datas
+    binaries += package_binaries
+    hiddenimports += package_hiddenimports
+
+a = Analysis(
+    [os.path.join(ROOT, 'src', 'main.py')],
+    pathex=[os.path.join(ROOT, 'src')],
+    binaries=binaries,
+    datas=datas,
+    hiddenimports=hiddenimports,
+    hookspath=[],
+    hooksconfig={},
+    runtime_hooks=[],
+    # Exclude nepotřebné moduly pro menší velikost
+    excludes=[
+        'matplotlib',
+        'numpy',
+        'scipy',
+        'pandas',
+        'jupyter',
+        'IPython',
+        'pytest',
+        'sphinx',
+    ],
+    noarchive=False,
+)
+pyz = PYZ(a.pure)
+
+# Jeden .exe soubor bez console okna
+exe = EXE(
+    pyz,
+    a.scripts,
+    a.binaries,
+    a.datas,
+    [],
+    name='GitVisualizer',
+    debug=False,
+    bootloader_ignore_signals=False,
+    strip=False,
+    upx=True,
+    upx_exclude=[],
+    runtime_tmpdir=None,
+    console=False,
+    disable_windowed_traceback=False,
+    argv_emulation=False,
+    target_arch=None,
+    codesign_identity=None,
+    entitlements_file=None,
+    icon=[os.path.join(SPECPATH, 'icon.ico')],
+)
@@ -42,7 +42,7 @@ echo.
 
 REM Spustit build script
 echo Spoustim build proces...
-python build\build.py
+python build\build.py %*
 
 echo.
 echo Build dokoncen! Vysledek je v dist\ slozce.
@@ -3,123 +3,196 @@
 Build script pro vytvoření GitVisualizer.exe pomocí PyInstaller
 """
 
+import argparse
+import hashlib
+import json
 import os
 import sys
 import subprocess
-import shutil
+from concurrent.futures import ThreadPoolExecutor
+from importlib.metadata import version as package_version, PackageNotFoundError
 from pathlib import Path
 
-def main():
-    print("GitVisualizer Build Script")
-    print("=" * 40)
+BUILD_CACHE_PATH = Path("build/.build-cache.json")
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="Build GitVisualizer.exe pomoci PyInstaller")
+    parser.add_argument(
+        "--full-rebuild",
+        action="store_true",
+        help="Smazat build/temp a spustit PyInstaller s --clean (bez cache)"
+    )
+    parser.add_argument(
+        "--smoke-test",
+        action="store_true",
+        help="Po buildu zkusit spustit vysledny .exe"
+    )
+    return parser.parse_args()
+
+def load_build_cache():
+    """Načte cache výsledků kontrol z předchozích buildů."""
+    try:
+        with open(BUILD_CACHE_PATH, encoding="utf-8") as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
 
-    # Kontrola, že jsme ve správné složce (root projektu)
-    if not os.path.exists("src/main.py"):
-        print("CHYBA: src/main.py nenalezen. Spust script z root slozky projektu.")
-        sys.exit(1)
+def save_build_cache(cache):
+    try:
+        with open(BUILD_CACHE_PATH, "w", encoding="utf-8") as f:
+            json.dump(cache, f)
+    except OSError as e:
+        print(f"VAROVANI: Nelze ulozit build cache: {e}")
+
+def interpreter_cache_key():
+    """Klíč cache - změní se při přeinstalaci/aktualizaci Pythonu."""
+    mtime = os.path.getmtime(sys.executable)
+    return hashlib.sha1((sys.executable + str(mtime)).encode()).hexdigest()
 
-    # Kontrola tkinter
+def check_tkinter():
     try:
-        import tkinter
+        import tkinter  # noqa: F401
         print("OK: tkinter dostupny")
     except ImportError:
         print("CHYBA: tkinter neni dostupny. Nainstaluj Python s tkinter support.")
         sys.exit(1)
 
-    # Kontrola PyInstaller verze
+def check_pyinstaller():
+    """Zkontroluje verzi PyInstalleru bez spouštění dalšího procesu."""
     try:
-        result = subprocess.run(["pyinstaller", "--version"], capture_output=True, check=True, text=True)
-        version = result.stdout.strip()
-        print(f"OK: PyInstaller {version} nalezen")
-
-        # Zkontrolovat že máme alespoň verzi 6.x pro správný tkinter support
-        major_version = int(version.split('.')[0])
-        if major_version < 6:
-            print(f"Aktualizuji PyInstaller z verze {version} na nejnovejsi...")
-            subprocess.run([sys.executable, "-m", "pip", "install", "--upgrade", "pyinstaller"], check=True)
-            print("OK: PyInstaller aktualizovan")
-
-    except (subprocess.CalledProcessError, FileNotFoundError):
+        pyi_version = package_version("pyinstaller")
+    except PackageNotFoundError:
         print("PyInstaller nenalezen. Instaluji nejnovejsi verzi...")
         subprocess.run([sys.executable, "-m", "pip", "install", "pyinstaller"], check=True)
         print("OK: PyInstaller nainstalan")
+        return
+
+    print(f"OK: PyInstaller {pyi_version} nalezen")
+
+    # Zkontrolovat že máme alespoň verzi 6.x pro správný tkinter support
+    major_version = int(pyi_version.split('.')[0])
+    if major_version < 6:
+        print(f"Aktualizuji PyInstaller z verze {pyi_version} na nejnovejsi...")
+        subprocess.run([sys.executable, "-m", "pip", "install", "--upgrade", "pyinstaller"], check=True)
+        print("OK: PyInstaller aktualizovan")
+
+def fast_rmtree(path):
+    """Smaže adresářový strom jedním průchodem přes os.scandir (bez lstat per položka)."""
+    with os.scandir(path) as entries:
+        for entry in entries:
+            if entry.is_dir(follow_symlinks=False):
+                fast_rmtree(entry.path)
+            else:
+                os.unlink(entry.path)
+    os.rmdir(path)
+
+def safe_remove(path, is_file=False):
+    """Pokus o smazání s chytrou error handling - neexistující cesta není chyba."""
+    try:
+        if is_file:
+            os.remove(path)
+        else:
+            fast_rmtree(path)
+        return True
+    except FileNotFoundError:
+        return True
+    except OSError:
+        # PermissionError, zamčený soubor na Windows, neprázdná složka po souběhu...
+        return False
+
+def remove_dist():
+    """Smaže dist/ - na Windows přímo přes Win32 API (onefile build = jediný .exe).
+
+    Returns:
+        False pokud soubor nelze smazat (např. běžící .exe), jinak True
+    """
+    if sys.platform != "win32":
+        return safe_remove("dist")
+
+    import ctypes
+    kernel32 = ctypes.WinDLL("kernel32", use_last_error=True)
+    ERROR_FILE_NOT_FOUND = 2
+    ERROR_PATH_NOT_FOUND = 3
+
+    if not kernel32.DeleteFileW(str(Path("dist/GitVisualizer.exe"))):
+        error = ctypes.get_last_error()
+        if error not in (ERROR_FILE_NOT_FOUND, ERROR_PATH_NOT_FOUND):
+            # ERROR_SHARING_VIOLATION / ERROR_ACCESS_DENIED - .exe je spuštěný
+            return False
+
+    if kernel32.RemoveDirectoryW("dist"):
+        return True
+    if ctypes.get_last_error() in (ERROR_FILE_NOT_FOUND, ERROR_PATH_NOT_FOUND):
+        return True
+
+    # dist/ obsahuje i jiné soubory - obecný fallback
+    return safe_remove("dist")
+
+def main():
+    args = parse_args()
+
+    print("GitVisualizer Build Script")
+    print("=" * 40)
+
+    # Kontrola, že jsme ve správné složce (root projektu)
+    if not os.path.exists("src/main.py"):
+        print("CHYBA: src/main.py nenalezen. Spust script z root slozky projektu.")
+        sys.exit(1)
+
+    # Kontrola tkinteru - přeskočit pokud už proběhla se stejným interpretem.
+    # PyInstaller se kontroluje vždy: může být odinstalován nebo downgradován
+    # bez změny interpretu a čtení metadat je levné
+    cache = load_build_cache()
+    cache_key = interpreter_cache_key()
+    tkinter_checked = cache.get("tkinter_check") == cache_key
+    if tkinter_checked:
+        print("OK: Kontrola tkinter preskocena (cache)")
 
     # Vyčištění předchozích buildů
     print("\nMazani predchozich buildu...")
 
-    # Pokus o smazání s chytrou error handling
-    def safe_remove(path, is_file=False):
-        try:
-            if is_file:
-                os.remove(path)
-            else:
-                shutil.rmtree(path)
-            return True
-        except (PermissionError, FileNotFoundError):
-            return False
-
-    if os.path.exists("dist"):
-        if not safe_remove("dist"):
+    cleanup_targets = []
+    # build/temp obsahuje analysis cache PyInstalleru - mazat jen při plném rebuildu
+    if args.full_rebuild:
+        cleanup_targets.append(("build/temp", False))
+
+    # Kontroly a mazání jsou nezávislé IO/subprocess úlohy - spustit souběžně
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        check_futures = [executor.submit(check_pyinstaller)]
+        if not tkinter_checked:
+            check_futures.append(executor.submit(check_tkinter))
+        dist_future = executor.submit(remove_dist)
+        cleanup_futures = [
+            executor.submit(safe_remove, path, is_file)
+            for path, is_file in cleanup_targets
+        ]
+
+        # result() znovu vyhodí případnou výjimku (včetně sys.exit) z vlákna
+        for future in check_futures:
+            future.result()
+
+        if not dist_future.result():
             print("VAROVANI: Nelze smazat dist/ - mozna je .exe spusteny. Pokracuji...")
+        for future in cleanup_futures:
+            future.result()
 
-    if os.path.exists("build/temp"):
-        safe_remove("build/temp")
-
-    # Absolutní cesta k ikoně (relativní cesta nefunguje s custom workpath)
-    icon_path = str(Path("build/icon.ico").resolve())
+    if not tkinter_checked:
+        cache["tkinter_check"] = cache_key
+        save_build_cache(cache)
 
-    # PyInstaller parametry
+    # PyInstaller parametry - konfigurace buildu (hidden imports, excludes, ikona)
+    # je v build/GitVisualizer.spec, takže PyInstaller nemusí spec generovat z CLI
     pyinstaller_args = [
         "pyinstaller",
-        "--onefile",                    # Jeden .exe soubor
-        "--windowed",                   # Bez console okna
-        "--name=GitVisualizer",         # Název výsledného .exe
-        f"--icon={icon_path}",          # Ikona pro .exe
-        "--distpath=dist",              # Výstupní složka
-        "--workpath=build/temp",        # Dočasná složka
-        "--specpath=build/temp",        # Složka pro .spec soubor
-        "--clean",                      # Vyčistit cache
         "--noconfirm",                  # Přepsat bez dotazu
-
-        # Skryté importy pro kompletní funkcionalitu
-        "--hidden-import=tkinter",
-        "--hidden-import=tkinter.ttk",
-        "--hidden-import=tkinter.messagebox",
-        "--hidden-import=tkinter.filedialog",
-        "--hidden-import=tkinter.constants",
-        "--hidden-import=tkinter.font",
-        "--hidden-import=tkinter.scrolledtext",
-        "--hidden-import=tkinter.simpledialog",
-        "--hidden-import=_tkinter",
-        "--hidden-import=tkinterdnd2",
-        "--hidden-import=git",
-        "--hidden-import=git.exc",
-        "--hidden-import=gitdb",
-        "--hidden-import=PIL",
-        "--hidden-import=PIL.Image",
-        "--hidden-import=PIL.ImageTk",
-        "--hidden-import=requests",
-        "--hidden-import=auth",
-        "--hidden-import=auth.github_auth",
-        "--hidden-import=auth.token_storage",
-
-        # Zabalit všechny git dependencies
-        "--collect-all=git",
-        "--collect-all=gitdb",
-
-        # Exclude nepotřebné moduly pro menší velikost
-        "--exclude-module=matplotlib",
-        "--exclude-module=numpy",
-        "--exclude-module=scipy",
-        "--exclude-module=pandas",
-        "--exclude-module=jupyter",
-        "--exclude-module=IPython",
-        "--exclude-module=pytest",
-        "--exclude-module=sphinx",
-
-        "src/main.py"                   # Vstupní soubor
+        "--distpath=dist",              # Výstupní složka
+        "--workpath=build/temp",        # Dočasná složka (cache analýzy)
+        "build/GitVisualizer.spec"      # Spec soubor
     ]
 
+    if args.full_rebuild:
+        pyinstaller_args.insert(1, "--clean")  # Vyčistit cache
+
     print("\nSpoustim PyInstaller...")
     print("Parametry:", " ".join(pyinstaller_args[1:]))
 
@@ -134,19 +207,20 @@ def main():
             print(f"Vysledny soubor: {exe_path}")
             print(f"Velikost: {size_mb:.1f} MB")
 
-            # Jednoduchý test spuštění
-            print("\nTestovani .exe souboru...")
-            try:
-                # Spustit a okamžitě ukončit (jen test že se spustí)
-                proc = subprocess.Popen([str(exe_path)], stdout=subprocess.PIPE, stderr=subprocess.PIPE)
-                # Počkat chvilku a ukončit
-                import time
-                time.sleep(2)
-                proc.terminate()
-                proc.wait(timeout=5)
-                print("OK: .exe soubor se spousta spravne")
-            except Exception as e:
-                print(f"VAROVANI: Test spusteni selhal: {e}")
+            # Jednoduchý test spuštění (volitelný - stojí několik sekund)
+            if args.smoke_test:
+                print("\nTestovani .exe souboru...")
+                try:
+                    # Spustit a okamžitě ukončit (jen test že se spustí)
+                    proc = subprocess.Popen([str(exe_path)], stdout=subprocess.PIPE, stderr=subprocess.PIPE)
+                    # Počkat chvilku a ukončit
+                    import time
+                    time.sleep(2)
+                    proc.terminate()
+                    proc.wait(timeout=5)
+                    print("OK: .exe soubor se spousta spravne")
+                except Exception as e:
+                    print(f"VAROVANI: Test spusteni selhal: {e}")
 
         else:
             print("CHYBA: .exe soubor nebyl vytvoren")
@@ -158,16 +232,9 @@ def main():
 
     print("\nBuild dokoncen!")
 
-    # Cleanup build/temp
-    print("Mazani docasnych build souboru...")
-    if os.path.exists("build/temp"):
-        if safe_remove("build/temp"):
-            print("OK: build/temp/ smazan")
-        else:
-            print("VAROVANI: Nelze smazat build/temp/ - smazte rucne")
-
     print(f"\nSpustitelny soubor: dist\\GitVisualizer.exe")
     print("Pro vytvoreni dalsiho buildu spust: build\\build-exe.bat")
+    print("Pro plny rebuild bez cache spust: build\\build-exe.bat --full-rebuild")
 
 if __name__ == "__main__":
     main()
@@ -1,6 +1,10 @@
 import tkinter as tk
 from tkinter import ttk, filedialog, messagebox
+import functools
 import os
+import re
+import stat
+from urllib.parse import urlparse
 try:
     from tkinterdnd2 import DND_FILES, TkinterDnD
 except ImportError:
@@ -12,11 +16,55 @@ from utils.theme_manager import get_theme_manager
 
 logger = get_logger(__name__)
 
+# Git SSH format: git@github.com:user/repo.git
+_SSH_URL_RE = re.compile(r'^git@([\w\.-]+):([\w\-/]+)(\.git)?$', re.IGNORECASE)
+
+# Whitelist důvěryhodných SSH hostů
+_TRUSTED_SSH_HOSTS = frozenset({'github.com', 'gitlab.com', 'bitbucket.org'})
+
+# Whitelist důvěryhodných HTTP(S) hostů
+_TRUSTED_HOSTS = frozenset({
+    'github.com', 'gitlab.com', 'bitbucket.org',
+    'gitea.io', 'codeberg.org', 'sr.ht'  # Další známé Git hosty
+})
+
+# Přípony ve tvaru ".host" - '.' + testovaný host pak jedním voláním endswith
+# pokryje exact match i libovolnou subdoménu
+_TRUSTED_SSH_SUFFIXES = tuple('.' + host for host in _TRUSTED_SSH_HOSTS)
+_TRUSTED_SUFFIXES = tuple('.' + host for host in _TRUSTED_HOSTS)
+
+
+@functools.lru_cache(maxsize=64)
+def _has_git_entry(folder_path: str, mtime_ns: int) -> bool:
+    """Zjistí zda složka obsahuje .git (složku nebo gitfile).
+
+    Výsledek je cachovaný podle mtime složky - vytvoření/smazání .git
+    mtime změní, takže opakovaný drop stejné složky nepotřebuje další stat.
+    """
+    try:
+        os.stat(os.path.join(folder_path, '.git'))
+        return True
+    except OSError:
+        return False
+
+
+def _is_trusted_host(host: str, trusted_suffixes: tuple) -> bool:
+    """Vrátí True pro důvěryhodný host nebo jeho subdoménu."""
+    return ('.' + host).endswith(trusted_suffixes)
+
 
 class DragDropFrame(ttk.Frame):
+    # Systémová barva pozadí ttk.Frame (sdílená mezi instancemi, mění se jen se změnou tématu)
+    _BG_CACHE = None
+
     def __init__(self, parent, on_drop_callback=None):
         super().__init__(parent)
         self.on_drop_callback = on_drop_callback
+        self._resize_job = None
+        self._last_size = None
+        # ID položek drop area na canvasu (vytvořeny při prvním vykreslení)
+        self._rect_id = self._label_win = self._browse_win = self._url_win = None
+        self._rect_colors = None
         self.setup_ui()
 
     def setup_ui(self):
@@ -24,8 +72,9 @@ class DragDropFrame(ttk.Frame):
         self.rowconfigure(0, weight=1)
 
         # Získat systémovou barvu ttk.Frame pro pozadí
-        style = ttk.Style()
-        bg_color = style.lookup('TFrame', 'background')
+        if DragDropFrame._BG_CACHE is None:
+            DragDropFrame._BG_CACHE = ttk.Style().lookup('TFrame', 'background')
+        bg_color = DragDropFrame._BG_CACHE
 
         # Použít Canvas pro možnost nastavit background color
         self.drop_canvas = tk.Canvas(
@@ -65,57 +114,94 @@ class DragDropFrame(ttk.Frame):
         self.bind_drop_events()
 
     def _center_widgets(self, event=None):
-        """Vycentruje widgety na canvas při resize."""
+        """Naplánuje vycentrování widgetů při resize.
+
+        Configure eventy chodí při tažení okna v dávkách, takže se překreslení
+        odkládá (debounce) a provede se jen pro finální velikost.
+        """
+        if self._resize_job is not None:
+            self.after_cancel(self._resize_job)
+        self._resize_job = self.after(16, self._do_center)
+
+    def _do_center(self, force=False):
+        """Vycentruje widgety na canvas.
+
+        Args:
+            force: Překreslit i když se velikost canvasu nezměnila (např. změna tématu)
+        """
+        self._resize_job = None
+
         canvas_width = self.drop_canvas.winfo_width()
         canvas_height = self.drop_canvas.winfo_height()
 
-        center_x = canvas_width // 2
-        center_y = canvas_height // 2
+        if not force and (canvas_width, canvas_height) == self._last_size:
+            return
+        self._last_size = (canvas_width, canvas_height)
 
-        # Vymazat vše
-        self.drop_canvas.delete('all')
+        center_x = canvas_width // 2
 
         # Modrá varianta - interaktivní accent
         padding = 5
 
         # Get theme colors
         tm = get_theme_manager()
+        fill = tm.get_color('drop_area_bg')
+        outline = tm.get_color('drop_area_outline')
+
+        # Symetrické rozložení:
+        # Vzdálenost od horní hrany k labelu = vzdálenost mezi labelem a tlačítky
+        padding_inner = 5  # Padding rámečku
+        top_margin = (canvas_height - padding_inner * 2) / 3  # 1/3 dostupné výšky
+
+        label_y = int(padding_inner + top_margin)
+        button_y = int(padding_inner + 2 * top_margin)
+
+        # Tlačítka vedle sebe
+        button_spacing = 20  # Mezera mezi tlačítky
+        browse_x = center_x - 75 - button_spacing // 2
+        url_x = center_x + 75 + button_spacing // 2
+
+        if self._rect_id is not None:
+            # Položky už existují - jen je přesunout (levnější než delete + create)
+            self.drop_canvas.coords(
+                self._rect_id,
+                padding, padding, canvas_width - padding, canvas_height - padding
+            )
+            # Barvy přenastavit jen při změně tématu, ne při každém resize
+            if (fill, outline) != self._rect_colors:
+                self.drop_canvas.itemconfig(self._rect_id, fill=fill, outline=outline)
+                self._rect_colors = (fill, outline)
+            self.drop_canvas.coords(self._label_win, center_x, label_y)
+            self.drop_canvas.coords(self._browse_win, browse_x, button_y)
+            self.drop_canvas.coords(self._url_win, url_x, button_y)
+            return
 
         # Světle modrá plocha s čárkovaným modrým rámečkem
-        self.drop_canvas.create_rectangle(
+        self._rect_id = self.drop_canvas.create_rectangle(
             padding, padding,
             canvas_width - padding, canvas_height - padding,
-            fill=tm.get_color('drop_area_bg'),
-            outline=tm.get_color('drop_area_outline'),
+            fill=fill,
+            outline=outline,
             width=2,
             dash=(5, 3)  # Čárkovaná čára (5px čárka, 3px mezera)
         )
-
-        # Symetrické rozložení:
-        # Vzdálenost od horní hrany k labelu = vzdálenost mezi labelem a tlačítky
-        padding_inner = 5  # Padding rámečku
-        top_margin = (canvas_height - padding_inner * 2) / 3  # 1/3 dostupné výšky
-
-        label_y = padding_inner + top_margin
-        button_y = label_y + top_margin
+        self._rect_colors = (fill, outline)
 
         # Umístit label
-        self.drop_canvas.create_window(
-            center_x, int(label_y),
+        self._label_win = self.drop_canvas.create_window(
+            center_x, label_y,
             window=self.drop_label,
             anchor='center'
         )
 
-        # Umístit tlačítka vedle sebe
-        button_spacing = 20  # Mezera mezi tlačítky
-
-        self.drop_canvas.create_window(
-            center_x - 75 - button_spacing // 2, int(button_y),
+        # Umístit tlačítka
+        self._browse_win = self.drop_canvas.create_window(
+            browse_x, button_y,
             window=self.browse_button,
             anchor='center'
         )
-        self.drop_canvas.create_window(
-            center_x + 75 + button_spacing // 2, int(button_y),
+        self._url_win = self.drop_canvas.create_window(
+            url_x, button_y,
             window=self.url_button,
             anchor='center'
         )
@@ -152,19 +238,13 @@ class DragDropFrame(ttk.Frame):
         - HTTP(S) URL z důvěryhodných hostů (GitHub, GitLab, Bitbucket)
         - Git SSH format (git@host:user/repo.git)
         """
-        from urllib.parse import urlparse
-        import re
-
         text = text.strip()
 
-        # Git SSH format: git@github.com:user/repo.git
-        ssh_pattern = r'^git@([\w\.-]+):([\w\-/]+)(\.git)?$'
-        ssh_match = re.match(ssh_pattern, text, re.IGNORECASE)
+        ssh_match = _SSH_URL_RE.match(text)
         if ssh_match:
             host = ssh_match.group(1).lower()
-            # Whitelist důvěryhodných SSH hostů
-            trusted_ssh_hosts = {'github.com', 'gitlab.com', 'bitbucket.org'}
-            if host in trusted_ssh_hosts or any(host.endswith(f'.{trusted}') for trusted in trusted_ssh_hosts):
+            # Exact match nebo subdoména důvěryhodného hostu
+            if _is_trusted_host(host, _TRUSTED_SSH_SUFFIXES):
                 return True
             logger.warning(f"Untrusted SSH host: {host}")
             return False
@@ -178,18 +258,11 @@ class DragDropFrame(ttk.Frame):
                 logger.debug(f"Invalid URL scheme: {parsed.scheme}")
                 return False
 
-            # Whitelist důvěryhodných hostů
-            trusted_hosts = {
-                'github.com', 'gitlab.com', 'bitbucket.org',
-                'gitea.io', 'codeberg.org', 'sr.ht'  # Další známé Git hosty
-            }
-
             netloc = parsed.netloc.lower()
 
             # Exact match nebo subdoména důvěryhodného hostu
-            for trusted_host in trusted_hosts:
-                if netloc == trusted_host or netloc.endswith(f'.{trusted_host}'):
-                    return True
+            if _is_trusted_host(netloc, _TRUSTED_SUFFIXES):
+                return True
 
             logger.warning(f"Untrusted Git host: {netloc}")
             return False
@@ -208,16 +281,15 @@ class DragDropFrame(ttk.Frame):
         """Apply current theme colors to widgets."""
         tm = get_theme_manager()
 
-        # Update canvas background
-        style = ttk.Style()
-        bg_color = style.lookup('TFrame', 'background')
-        self.drop_canvas.config(bg=bg_color)
+        # Update canvas background (téma se změnilo - obnovit cache)
+        DragDropFrame._BG_CACHE = ttk.Style().lookup('TFrame', 'background')
+        self.drop_canvas.config(bg=DragDropFrame._BG_CACHE)
 
         # Update label background color
         self.drop_label.config(background=tm.get_color('drop_area_bg'))
 
         # Update drop area colors and redraw
-        self._center_widgets()
+        self._do_center(force=True)
 
     def browse_folder(self):
         folder_path = filedialog.askdirectory(
@@ -335,50 +407,30 @@ class DragDropFrame(ttk.Frame):
 
         result = [None]
 
-        # Setup "soft modal" behavior
-        parent = self.winfo_toplevel()
-
-        # Zachytit kliknutí na parent → vrátit focus na dialog
-        def on_parent_interaction(event):
-            if dialog.winfo_exists():
-                dialog.focus_force()
-                dialog.lift()
-
-        parent.bind('<Button-1>', on_parent_interaction, add='+')
-
-        # Focus monitoring - udržet focus v rámci dialogu
-        # Také kontrolovat jestli parent ještě existuje
-        def maintain_focus():
+        # Setup "soft modal" behavior - udržet focus v rámci dialogu.
+        # Řízeno událostí <FocusOut> místo periodického pollingu.
+        def restore_focus():
             if not dialog.winfo_exists():
                 return
 
-            # Kontrola: žije ještě parent?
-            try:
-                if not parent.winfo_exists():
-                    dialog.destroy()
-                    return
-            except Exception as e:
-                logger.debug(f"Parent window check failed: {e}")
-                dialog.destroy()
-                return
-
             # Získat aktuální widget s focusem
             current_focus = dialog.focus_displayof()
 
             # Pokud focus není v rámci dialogu (je None nebo mimo dialog),
             # vrátit ho na entry pole (ne na dialog jako takový)
             if current_focus is None or not str(current_focus).startswith(str(dialog)):
+                dialog.lift()
                 entry.focus_set()
 
-            dialog.after(100, maintain_focus)
+        # FocusOut z jakéhokoli widgetu dialogu (bindtags obsahují toplevel);
+        # kontrola až v after_idle, kdy už je focus přesunutý na nový widget
+        dialog.bind('<FocusOut>', lambda e: dialog.after_idle(restore_focus))
 
-        # Nastavit iniciální focus na entry po zobrazení dialogu
-        dialog.after(50, lambda: entry.focus_set())
-        maintain_focus()
+        # Nastavit iniciální focus na entry
+        entry.focus_set()
 
         # Cleanup
         def cleanup_and_close():
-            parent.unbind('<Button-1>')
             dialog.destroy()
 
         def on_ok():
@@ -444,12 +496,18 @@ class DragDropFrame(ttk.Frame):
             self.on_drop_callback(url)
 
     def process_folder(self, folder_path):
-        if not os.path.isdir(folder_path):
+        # Jeden stat na cestu (na síťových discích je každý stat drahý)
+        try:
+            folder_stat = os.stat(folder_path)
+        except OSError:
+            folder_stat = None
+
+        if folder_stat is None or not stat.S_ISDIR(folder_stat.st_mode):
             messagebox.showerror(t('error'), t('invalid_folder'))
             return
 
-        git_folder = os.path.join(folder_path, '.git')
-        if not os.path.exists(git_folder):
+        # .git může být složka nebo soubor (gitfile u worktree/submodulů)
+        if not _has_git_entry(folder_path, folder_stat.st_mtime_ns):
             messagebox.showerror(t('error'), t('not_git_repo'))
             return
 
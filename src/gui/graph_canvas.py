@@ -1,3 +1,4 @@
+import time
 import tkinter as tk
 from tkinter import ttk
 from typing import List, Dict, Callable
@@ -12,6 +13,8 @@ from utils.theme_manager import get_theme_manager
 
 
 class GraphCanvas(ttk.Frame):
+    MOMENTUM_FRAME_TIME = 0.016  # Cílová délka snímku momentum animace (s)
+
     def __init__(self, parent, on_drop_callback: Callable[[str], None] = None):
         super().__init__(parent)
         self.commits: List[Commit] = []
@@ -23,6 +26,25 @@ class GraphCanvas(ttk.Frame):
         self.scroll_velocity = 0  # Aktuální rychlost scrollování
         self.last_scroll_time = 0  # Čas posledního scroll eventu
         self.scroll_timeout_id = None  # ID timeoutu pro reset velocity
+        self._pending_wheel_delta = 0  # Součet wheel delt od posledního zpracování
+        self._wheel_flush_id = None  # ID naplánovaného zpracování wheel delt
+        self._last_tick = 0.0  # perf_counter posledního kroku momentum animace
+        # Pozice a výška viewportu (zlomky scrollregionu) sledované v Pythonu,
+        # aby momentum animace nemusela v každém kroku volat yview()
+        self._cur_top = 0.0
+        self._viewport_h = 1.0
+        # Pozice (zlomek) v okamžiku scan_mark a posun od ní v pixelech;
+        # None = mark je potřeba nastavit znovu
+        self._scan_origin_top = None
+        self._scan_offset = 0
+
+        # Naparsovaný scrollregion (x1, y1, x2, y2) - mění se jen při nastavení
+        # scrollregion, takže scroll handlery nemusí volat cget + parsovat string
+        self._scroll_bounds = None
+        # Velikost canvasu z posledního <Configure> - bez winfo_* volání při scrollu
+        self._canvas_width = 0
+        self._canvas_height = 0
+        self._separator_redraw_pending = False  # Naplánované přesunutí záhlaví (after_idle)
 
         self.setup_ui()
 
@@ -38,10 +60,16 @@ class GraphCanvas(ttk.Frame):
         tm = get_theme_manager()
         self.canvas = tk.Canvas(
             self.canvas_frame,
-            bg=tm.get_color('canvas_bg'),
-            scrollregion=(0, 0, 1000, 1000)
+            bg=tm.get_color('canvas_bg')
         )
+        self._set_scrollregion(0, 0, 1000, 1000)
         self.canvas.grid(row=0, column=0, sticky='nsew')
+        # Přímé Tcl volání pro momentum animaci - bez Python wrapperu yview_moveto
+        self._tk_call = self.canvas.tk.call
+        self._canvas_path = str(self.canvas)
+        # Krok animace registrovaný jako Tcl příkaz jednou - after() by při každém
+        # snímku registroval a po zavolání mazal nový příkaz
+        self._momentum_step_cmd = self.register(self._perform_momentum_step)
 
         self.v_scrollbar = ttk.Scrollbar(
             self.canvas_frame,
@@ -76,68 +104,40 @@ class GraphCanvas(ttk.Frame):
                 self.canvas.drop_target_register(DND_FILES)
             self.canvas.dnd_bind('<<Drop>>', self.on_drop)
 
-        # Schedule initial scrollbar visibility check
-        self.after(100, self._update_scrollbars_visibility)
+        # Viditelnost scrollbarů se poprvé vyhodnotí v on_canvas_resize,
+        # jakmile canvas dostane skutečnou velikost (<Configure>)
+
+    def _set_scrollregion(self, x1, y1, x2, y2):
+        """Nastaví scrollregion canvasu a uloží jeho hranice pro scroll handlery."""
+        self.canvas.configure(scrollregion=(x1, y1, x2, y2))
+        self._scroll_bounds = (x1, y1, x2, y2)
 
     def _can_scroll_vertically(self) -> bool:
         """Check if vertical scrolling is needed"""
         # Použít scrollregion místo bbox pro konzistenci s bounds checking
-        scrollregion = self.canvas.cget('scrollregion')
-        if not scrollregion:
+        bounds = self._scroll_bounds
+        if bounds is None:
             return False
 
-        try:
-            # Parse scrollregion string "x1 y1 x2 y2"
-            coords = [float(x) for x in scrollregion.split()]
-            if len(coords) != 4:
-                return False
-
-            content_height = coords[3] - coords[1]
-            canvas_height = self.canvas.winfo_height()
-            # Přidat threshold 10px - scrollbar se zobrazí jen když je rozdíl výrazný
-            return content_height > canvas_height + 10
-        except (ValueError, IndexError):
-            # Fallback na bbox pokud parsing selže
-            bbox = self.canvas.bbox('all')
-            if not bbox:
-                return False
-            content_height = bbox[3] - bbox[1]
-            canvas_height = self.canvas.winfo_height()
-            # Přidat threshold 10px - scrollbar se zobrazí jen když je rozdíl výrazný
-            return content_height > canvas_height + 10
+        content_height = bounds[3] - bounds[1]
+        # Přidat threshold 10px - scrollbar se zobrazí jen když je rozdíl výrazný
+        return content_height > self._canvas_height + 10
 
     def _can_scroll_horizontally(self) -> bool:
         """Check if horizontal scrolling is needed"""
         # Použít scrollregion místo bbox pro konzistenci s bounds checking
-        scrollregion = self.canvas.cget('scrollregion')
-        if not scrollregion:
+        bounds = self._scroll_bounds
+        if bounds is None:
             return False
 
-        try:
-            # Parse scrollregion string "x1 y1 x2 y2"
-            coords = [float(x) for x in scrollregion.split()]
-            if len(coords) != 4:
-                return False
-
-            content_width = coords[2] - coords[0]
-            canvas_width = self.canvas.winfo_width()
-            # Přidat threshold 10px - scrollbar se zobrazí jen když je rozdíl výrazný
-            return content_width > canvas_width + 10
-        except (ValueError, IndexError):
-            # Fallback na bbox pokud parsing selže
-            bbox = self.canvas.bbox('all')
-            if not bbox:
-                return False
-            content_width = bbox[2] - bbox[0]
-            canvas_width = self.canvas.winfo_width()
-            # Přidat threshold 10px - scrollbar se zobrazí jen když je rozdíl výrazný
-            return content_width > canvas_width + 10
+        content_width = bounds[2] - bounds[0]
+        # Přidat threshold 10px - scrollbar se zobrazí jen když je rozdíl výrazný
+        return content_width > self._canvas_width + 10
 
     def _update_scrollbars_visibility(self):
         """Show/hide scrollbars based on content size"""
-        # Wait for the canvas to be properly sized
-        if self.canvas.winfo_width() <= 1 or self.canvas.winfo_height() <= 1:
-            self.canvas.after(10, self._update_scrollbars_visibility)
+        # Canvas ještě nemá skutečnou velikost - zavolá nás <Configure> (on_canvas_resize)
+        if self._canvas_width <= 1 or self._canvas_height <= 1:
             return
 
         if self._can_scroll_vertically():
@@ -152,67 +152,74 @@ class GraphCanvas(ttk.Frame):
 
     def _on_v_scroll(self, *args):
         """Handle vertical scrollbar with bounds checking"""
-        if not self._can_scroll_vertically():
+        position = self._scroll_view('y', args)
+        if position is None:
             return
 
-        if args[0] == 'moveto':
-            position = float(args[1])
-            # Ensure position is within bounds [0, 1]
-            position = max(0, min(1, position))
-            self.canvas.yview_moveto(position)
-            self._update_column_separators()
-        elif args[0] == 'scroll':
-            delta = int(args[1])
-            units = args[2]
-
-            current_top, current_bottom = self.canvas.yview()
-
-            if units == 'units':
-                scroll_amount = delta * 0.005  # 0.5% per unit for very smooth scrolling
-            else:  # pages
-                scroll_amount = delta * (current_bottom - current_top)
-
-            new_top = current_top + scroll_amount
-            new_top = max(0, min(1 - (current_bottom - current_top), new_top))
-
-            self.canvas.yview_moveto(new_top)
-            self._update_column_separators()
+        self._cur_top = position
+        self._scan_origin_top = None
+        self._schedule_separator_redraw()
 
     def _on_h_scroll(self, *args):
         """Handle horizontal scrollbar with bounds checking"""
-        if not self._can_scroll_horizontally():
-            return
+        # Separátory jsou svislé - horizontální scroll je nepotřebuje přepočítat
+        self._scroll_view('x', args)
+
+    def _scroll_view(self, axis: str, args):
+        """Společná obsluha scrollbaru pro osu 'x' nebo 'y'.
+
+        Returns:
+            Nová pozice (zlomek scrollregionu) nebo None, pokud se nescrollovalo
+        """
+        if axis == 'y':
+            if not self._can_scroll_vertically():
+                return None
+            view, moveto = self.canvas.yview, self.canvas.yview_moveto
+        else:
+            if not self._can_scroll_horizontally():
+                return None
+            view, moveto = self.canvas.xview, self.canvas.xview_moveto
 
         if args[0] == 'moveto':
-            position = float(args[1])
             # Ensure position is within bounds [0, 1]
-            position = max(0, min(1, position))
-            self.canvas.xview_moveto(position)
+            position = max(0, min(1, float(args[1])))
         elif args[0] == 'scroll':
             delta = int(args[1])
             units = args[2]
 
-            current_left, current_right = self.canvas.xview()
+            current_start, current_end = view()
 
             if units == 'units':
                 scroll_amount = delta * 0.005  # 0.5% per unit for very smooth scrolling
             else:  # pages
-                scroll_amount = delta * (current_right - current_left)
+                scroll_amount = delta * (current_end - current_start)
 
-            new_left = current_left + scroll_amount
-            new_left = max(0, min(1 - (current_right - current_left), new_left))
+            position = current_start + scroll_amount
+            position = max(0, min(1 - (current_end - current_start), position))
+        else:
+            return None
 
-            self.canvas.xview_moveto(new_left)
+        moveto(position)
+        return position
 
     def update_graph(self, commits: List[Commit]):
         self.commits = commits
         self.canvas.delete('all')
 
+        # Zastavit rozběhnutou momentum animaci - nový obsah začíná nahoře.
+        # Ne přes after_cancel(), ten by smazal i registrovaný _momentum_step_cmd
+        if self.scroll_animation_id is not None:
+            self._tk_call('after', 'cancel', self.scroll_animation_id)
+            self.scroll_animation_id = None
+        self.scroll_velocity = 0
+        self._scan_origin_top = None
+        self._scan_offset = 0
+
         if not commits:
             self._update_scrollbars_visibility()
             return
 
-        self.graph_drawer.draw_graph(self.canvas, commits)
+        extent = self.graph_drawer.draw_graph(self.canvas, commits)
 
         # Nastavit event handlery pro změnu velikosti sloupců
         self.graph_drawer.setup_column_resize_events(
@@ -220,73 +227,53 @@ class GraphCanvas(ttk.Frame):
             on_resize_callback=self.update_scrollregion_and_scrollbars
         )
 
-        # Počkat až se vše vykreslí, pak spočítat skutečné rozměry
-        self.canvas.update_idletasks()
-
-        # Použít bbox bez záhlaví pro skutečné rozměry obsahu
-        bbox = self._get_content_bbox_without_header()
-        if bbox:
+        # Rozměry obsahu (bez záhlaví) vrací přímo draw_graph z layoutu -
+        # není potřeba procházet všechny položky canvasu přes bbox
+        if extent:
             # Přidat malý buffer okolo obsahu
             buffer = 20
-            scroll_x1 = max(0, bbox[0] - buffer)
-            scroll_y1 = max(0, bbox[1] - buffer)
-            scroll_x2 = bbox[2] + buffer
-            scroll_y2 = bbox[3] + buffer
-            self.canvas.configure(scrollregion=(scroll_x1, scroll_y1, scroll_x2, scroll_y2))
+            scroll_x1 = max(0, extent[0] - buffer)
+            scroll_y1 = max(0, extent[1] - buffer)
+            scroll_x2 = extent[2] + buffer
+            scroll_y2 = extent[3] + buffer
+            self._set_scrollregion(scroll_x1, scroll_y1, scroll_x2, scroll_y2)
         else:
-            # Fallback pro případ prázdného obsahu
-            max_x = max(commit.x for commit in commits) + 100
-            max_y = max(commit.y for commit in commits) + 100
-            self.canvas.configure(scrollregion=(0, 0, max_x, max_y))
-
-        # Update scrollbars visibility after setting content
-        self.canvas.update_idletasks()
-        self._update_scrollbars_visibility()
-
+            # Fallback pro případ prázdného obsahu - jeden průchod pro obě osy
+            max_x = max_y = 0
+            for commit in commits:
+                if commit.x > max_x:
+                    max_x = commit.x
+                if commit.y > max_y:
+                    max_y = commit.y
+            self._set_scrollregion(0, 0, max_x + 100, max_y + 100)
 
         # Auto-scroll to top when loading new repository content
         self.canvas.yview_moveto(0)  # Scroll to top
         self.canvas.xview_moveto(0)  # Reset horizontal scroll as well
 
+        # Update scrollbars visibility after setting content - bez update_idletasks,
+        # velikost canvasu je z <Configure> a pozice pohledu se mění synchronně
+        self._update_scrollbars_visibility()
+        self._sync_view_position()
+
         # Update column headers to reflect new scroll position
         self._update_column_separators()
 
     def _get_content_bbox_without_header(self):
         """Vrátí bbox všech objektů kromě column_header."""
-        all_items = self.canvas.find_all()
-
         # Filtrovat objekty - vzít jen ty které NEMAJÍ tag "column_header"
-        content_items = []
-        for item in all_items:
-            tags = self.canvas.gettags(item)
-            if "column_header" not in tags:
-                content_items.append(item)
+        header_items = set(self.canvas.find_withtag("column_header"))
+        content_items = [item for item in self.canvas.find_all() if item not in header_items]
 
         if not content_items:
             return None
 
-        # Spočítat společný bbox všech content objektů
-        bboxes = []
-        for item in content_items:
-            item_bbox = self.canvas.bbox(item)
-            if item_bbox:  # Může být None pro neviditelné objekty
-                bboxes.append(item_bbox)
-
-        if not bboxes:
-            return None
-
-        # Najít min/max souřadnice
-        min_x = min(b[0] for b in bboxes)
-        min_y = min(b[1] for b in bboxes)
-        max_x = max(b[2] for b in bboxes)
-        max_y = max(b[3] for b in bboxes)
-
-        return (min_x, min_y, max_x, max_y)
+        # Společný bbox všech content objektů spočítá Tk jedním voláním
+        # (neviditelné objekty bez bbox ignoruje, None pokud žádný nemá bbox)
+        return self.canvas.bbox(*content_items)
 
     def update_scrollregion_and_scrollbars(self):
         """Aktualizuje scrollregion a viditelnost scrollbarů po změně obsahu."""
-        self.canvas.update_idletasks()
-
         # Aktualizovat scrollregion podle obsahu BEZ záhlaví
         # (záhlaví je floating element a nemá ovlivňovat scrollregion)
         bbox = self._get_content_bbox_without_header()
@@ -296,7 +283,7 @@ class GraphCanvas(ttk.Frame):
             scroll_y1 = max(0, bbox[1] - buffer)
             scroll_x2 = bbox[2] + buffer
             scroll_y2 = bbox[3] + buffer
-            self.canvas.configure(scrollregion=(scroll_x1, scroll_y1, scroll_x2, scroll_y2))
+            self._set_scrollregion(scroll_x1, scroll_y1, scroll_x2, scroll_y2)
 
         # Aktualizovat viditelnost scrollbarů
         self._update_scrollbars_visibility()
@@ -309,14 +296,30 @@ class GraphCanvas(ttk.Frame):
 
     def on_mousewheel(self, event):
         if event.delta:
-            delta = -1 * (event.delta / 120)
+            # Celočíselné dělení se zaokrouhlením k nule (stejně jako dřívější int(delta / 120))
+            if event.delta > 0:
+                delta = -(event.delta // 120)
+            else:
+                delta = -event.delta // 120
         else:
             delta = -1 if event.num == 4 else 1
 
+        # Sečíst delty a zpracovat je najednou - trackpady posílají desítky eventů za sekundu
+        self._pending_wheel_delta += delta
+        if self._wheel_flush_id is None:
+            self._wheel_flush_id = self.after(10, self._flush_wheel)
+
+    def _flush_wheel(self):
+        """Zpracuje nasbírané wheel eventy jako jeden scroll krok."""
+        self._wheel_flush_id = None
+        delta = self._pending_wheel_delta
+        self._pending_wheel_delta = 0
+        if not delta:
+            return
+
         # Only scroll if content is larger than visible area
         if self._can_scroll_vertically():
-            import time
-            current_time = time.time()
+            current_time = time.perf_counter()
             time_since_last_scroll = current_time - self.last_scroll_time
 
             # Základní scroll krok - začíná pomalu
@@ -327,7 +330,7 @@ class GraphCanvas(ttk.Frame):
                 # Uživatel nepřetržitě scrolluje - postupně zrychlovat
                 # Čím rychleji scrolluje (kratší interval), tím více momentu přidáme
                 acceleration_factor = max(1.2, 2.0 - time_since_last_scroll * 8)  # 1.2 až ~2.0x
-                scroll_increment = int(delta) * base_scroll_amount * acceleration_factor
+                scroll_increment = delta * base_scroll_amount * acceleration_factor
 
                 # Přidat k existující velocity (s omezením max rychlosti)
                 self.scroll_velocity += scroll_increment
@@ -336,7 +339,7 @@ class GraphCanvas(ttk.Frame):
                 self.scroll_velocity = max(-max_velocity, min(max_velocity, self.scroll_velocity))
             else:
                 # Pomalé scrollování nebo první scroll po pauze - začít pomalu
-                self.scroll_velocity = int(delta) * base_scroll_amount
+                self.scroll_velocity = delta * base_scroll_amount
 
             self.last_scroll_time = current_time
 
@@ -361,23 +364,39 @@ class GraphCanvas(ttk.Frame):
         if self.scroll_animation_id is not None:
             return
 
+        self._sync_view_position()
+        self._scan_origin_top = None
+        # První krok odpovídá jednomu snímku
+        self._last_tick = time.perf_counter() - self.MOMENTUM_FRAME_TIME
         self._perform_momentum_step()
 
     def _perform_momentum_step(self):
         """Provede jeden krok momentum-based scrollování."""
-        # Pokud je velocity téměř nulová, zastavit animaci
-        if abs(self.scroll_velocity) < 0.0005:
+        # Pokud by krok posunul obsah o méně než 1 pixel, zastavit animaci -
+        # další snímky by nebyly vidět
+        bounds = self._scroll_bounds
+        if abs(self.scroll_velocity) * (bounds[3] - bounds[1]) < 1.0:
             self.scroll_velocity = 0
             self.scroll_animation_id = None
+            # Přesné umístění záhlaví až po dojezdu animace
+            self._update_column_separators()
             return
 
-        current_top, current_bottom = self.canvas.yview()
+        # Škálovat krok podle skutečně uplynulého času - při zpoždění smyčky
+        # se pozice dorovná místo hromadění zpoždění (max 4 snímky najednou)
+        perf_counter = time.perf_counter
+        tk_call = self._tk_call
+        now = perf_counter()
+        frames = min((now - self._last_tick) / self.MOMENTUM_FRAME_TIME, 4.0)
+        self._last_tick = now
+
+        current_top = self._cur_top
 
         # Aplikovat velocity
-        new_position = current_top + self.scroll_velocity
+        new_position = current_top + self.scroll_velocity * frames
 
         # Bounds checking
-        viewport_height = current_bottom - current_top
+        viewport_height = self._viewport_h
         if new_position < 0:
             new_position = 0
             self.scroll_velocity = 0  # Zastavit při dosažení konce
@@ -385,22 +404,44 @@ class GraphCanvas(ttk.Frame):
             new_position = 1 - viewport_height
             self.scroll_velocity = 0  # Zastavit při dosažení konce
 
-        # Aplikovat novou pozici
-        self.canvas.yview_moveto(new_position)
-        self._update_column_separators()
+        # Aplikovat novou pozici - pixelový posun přes scan dragto (gain -1)
+        # relativně k pozici při scan_mark, bez přepočtu zlomků yview
+        if self._scan_origin_top is None:
+            self.canvas.scan_mark(0, 0)
+            self._scan_origin_top = current_top
+            self._scan_offset = 0
+        offset = round((new_position - self._scan_origin_top) * (bounds[3] - bounds[1]))
+        tk_call(self._canvas_path, 'scan', 'dragto', 0, offset, -1)
+        self._cur_top = new_position
+        # Během animace záhlaví jen posunout o stejný offset - přesné umístění
+        # (coords každé položky) se provede až po dojezdu
+        self._shift_column_separators(offset - self._scan_offset)
+        self._scan_offset = offset
 
         # Deceleration - postupné zpomalování (lehký efekt dojezdu)
         # Použít slabší deceleration (15%) pro rychlejší zastavení a lepší kontrolu
-        deceleration = 0.85  # Ponechat 85% rychlosti = 15% útlum
-        self.scroll_velocity *= deceleration
+        deceleration = 0.85  # Ponechat 85% rychlosti za snímek = 15% útlum
+        self.scroll_velocity *= deceleration ** frames
 
-        # Naplánovat další krok animace (přibližně 60 FPS)
-        self.scroll_animation_id = self.after(16, self._perform_momentum_step)
+        # Naplánovat další krok animace (přibližně 60 FPS) - odečíst dobu tohoto kroku
+        elapsed_ms = (perf_counter() - now) * 1000
+        delay = max(1, int(self.MOMENTUM_FRAME_TIME * 1000 - elapsed_ms))
+        self.scroll_animation_id = tk_call('after', delay, self._momentum_step_cmd)
+
+    def _sync_view_position(self):
+        """Načte aktuální pozici a výšku viewportu z canvasu (jedno volání yview)."""
+        current_top, current_bottom = self.canvas.yview()
+        self._cur_top = current_top
+        self._viewport_h = current_bottom - current_top
 
     def on_canvas_resize(self, event):
         """Handler pro změnu velikosti canvasu - aktualizuje záhlaví a scrollbary."""
+        self._canvas_width = event.width
+        self._canvas_height = event.height
+        # Výška viewportu se mění jen se změnou velikosti
+        self._sync_view_position()
         # Překreslit záhlaví při změně šířky okna
-        self._update_column_separators()
+        self._schedule_separator_redraw()
         # Aktualizovat scrollbary při změně velikosti
         self._update_scrollbars_visibility()
 
@@ -410,10 +451,33 @@ class GraphCanvas(ttk.Frame):
         self.canvas.config(bg=tm.get_color('canvas_bg'))
 
         # Redraw graph if loaded
-        if hasattr(self.graph_drawer, '_current_commits') and self.graph_drawer._current_commits:
+        if self.graph_drawer._current_commits:
             self.update_graph(self.graph_drawer._current_commits)
 
+    def _shift_column_separators(self, dy: int):
+        """Posune separátory sloupců o dy pixelů (levná varianta pro animaci)."""
+        if not dy:
+            return
+        if self.graph_drawer._current_commits:
+            self.graph_drawer.shift_column_separators(self.canvas, dy)
+
+    def refresh_column_headers(self):
+        """Překreslí jen záhlaví sloupců (texty záhlaví jsou jediný přeložený obsah grafu)."""
+        self.graph_drawer.redraw_column_headers(self.canvas)
+
+    def _schedule_separator_redraw(self):
+        """Naplánuje aktualizaci záhlaví na idle - rychlé série eventů se sloučí do jedné."""
+        if self._separator_redraw_pending:
+            return
+        self._separator_redraw_pending = True
+        self.canvas.after_idle(self._do_separator_redraw)
+
+    def _do_separator_redraw(self):
+        """Provede naplánovanou aktualizaci záhlaví."""
+        self._separator_redraw_pending = False
+        self._update_column_separators()
+
     def _update_column_separators(self):
         """Aktualizuje pozici separátorů sloupců po scrollování."""
-        if hasattr(self.graph_drawer, '_current_commits') and self.graph_drawer._current_commits:
+        if self.graph_drawer._current_commits:
             self.graph_drawer._draw_column_separators(self.canvas)
@@ -22,6 +22,9 @@ logger = get_logger(__name__)
 class CustomProgressBar(tk.Canvas):
     """Canvas-based progress bar s podporou změny barev"""
 
+    # Prodleva před spuštěním animace - rychlá načtení se obejdou bez periodického překreslování
+    START_DELAY_MS = 250
+
     def __init__(self, parent, **kwargs):
         # Extrahovat custom parametry
         self.mode = kwargs.pop('mode', 'determinate')
@@ -46,6 +49,7 @@ class CustomProgressBar(tk.Canvas):
         self.is_running = False
         self.animation_position = 0
         self.animation_id = None
+        self._start_id = None
 
         self.bind('<Configure>', self._redraw)
         self._redraw()
@@ -61,12 +65,22 @@ class CustomProgressBar(tk.Canvas):
         self._redraw()
 
     def start(self):
-        """Spustit indeterminate mode (animace)"""
+        """Spustit indeterminate mode (animace) po krátké prodlevě"""
+        if self.is_running or self._start_id:
+            return
+        self._start_id = self.after(self.START_DELAY_MS, self._begin_animation)
+
+    def _begin_animation(self):
+        """Spustí animační smyčku, pokud mezitím nepřišel stop()"""
+        self._start_id = None
         self.is_running = True
         self._animate()
 
     def stop(self):
         """Zastavit indeterminate mode"""
+        if self._start_id:
+            self.after_cancel(self._start_id)
+            self._start_id = None
         self.is_running = False
         if self.animation_id:
             self.after_cancel(self.animation_id)
@@ -128,16 +142,21 @@ class MainWindow:
         self.default_width = 600
         self.default_height = 400
 
+        # Rozměry obrazovky - zjistit jednou, každý winfo_screen* je dotaz do Tcl
+        self.screen_width = self.root.winfo_screenwidth()
+        self.screen_height = self.root.winfo_screenheight()
+
         self.root.title(self.default_title)
-        self.root.geometry(f"{self.default_width}x{self.default_height}")
         self.root.minsize(400, 300)
 
+        # Velikost i pozice v jednom geometry() zápisu
         self._center_window(self.default_width, self.default_height)
 
         # UI Components
         self.language_switcher = None  # Vytvoří se v setup_ui()
         self.theme_switcher = None     # Vytvoří se v setup_ui()
         self.stats_display = None      # Vytvoří se v setup_ui()
+        self.graph_canvas = None       # Vytvoří se až při prvním zobrazení grafu
 
         # Repository Manager - handles all repository operations
         self.repo_manager = RepositoryManager(self)
@@ -155,6 +174,14 @@ class MainWindow:
         # Přidat window resize binding pro automatické přepočítání pozice přepínačů
         self.root.bind('<Configure>', self._on_window_resize)
 
+        # Zavření okna nesmí čekat na rozběhnuté načítání repozitáře
+        self.root.protocol("WM_DELETE_WINDOW", self._on_close)
+
+    def _on_close(self):
+        """Called when the window is closed - stops the loader and destroys the root."""
+        self.repo_manager.shutdown()
+        self.root.destroy()
+
     def _on_window_resize(self, event):
         """Called when window is resized - updates positions of switchers."""
         # Aktualizovat pouze pokud je resize na root window (ne na child widgetech)
@@ -164,31 +191,33 @@ class MainWindow:
                 self.theme_switcher.update_position()
 
     def _center_window(self, width: int, height: int):
-        screen_width = self.root.winfo_screenwidth()
-        screen_height = self.root.winfo_screenheight()
-
         # Na Windows je potřeba počítat s taskbarem (obvykle 40-50 pixelů)
         taskbar_height = 50
-        usable_height = screen_height - taskbar_height
+        usable_height = self.screen_height - taskbar_height
 
-        x = max(0, (screen_width - width) // 2)
+        # Vycentrovat; okno větší než obrazovka zarovnat k levému hornímu rohu
+        x = max(0, (self.screen_width - width) // 2)
         y = max(0, (usable_height - height) // 2)
 
-        if x + width > screen_width:
-            x = screen_width - width
-        if y + height > usable_height:
-            y = usable_height - height
-
-        x = max(0, x)
-        y = max(0, y)
-
         self.root.geometry(f"{width}x{height}+{x}+{y}")
 
     def _resize_window_for_content(self, commits):
-        if not commits:
+        """Přizpůsobí okno obsahu - jen pokud se cílová velikost liší od aktuální."""
+        size = self._get_window_size_for_content(commits)
+        if size is None:
             return
 
-        self.root.update_idletasks()
+        window_width, window_height = size
+        if (abs(self.root.winfo_width() - window_width) <= 5
+                and abs(self.root.winfo_height() - window_height) <= 5):
+            return
+
+        self.root.after(50, self._center_window, window_width, window_height)
+
+    def _get_window_size_for_content(self, commits):
+        """Spočítá cílovou velikost okna pro zobrazené commity."""
+        if not commits:
+            return None
 
         canvas = self.graph_canvas.canvas
         table_width = self._calculate_table_width(canvas, commits)
@@ -203,8 +232,8 @@ class MainWindow:
         content_width = table_width + 50
         content_height = (commit_count * commit_height) + header_height + status_height + margins
 
-        screen_width = self.root.winfo_screenwidth()
-        screen_height = self.root.winfo_screenheight()
+        screen_width = self.screen_width
+        screen_height = self.screen_height
 
         # Menší margin pro Windows
         margin_horizontal = 80  # Sníženo ze 100
@@ -220,13 +249,13 @@ class MainWindow:
         window_width = max(window_width, min_reasonable_width)
         window_height = max(window_height, min_reasonable_height)
 
-        self._center_window(window_width, window_height)
+        return window_width, window_height
 
     def _get_accurate_content_width(self, canvas, commits):
         """Získá přesnou šířku obsahu canvas s fallback logikou."""
         # Nejprve zkusit získat skutečné rozměry z canvas
         try:
-            canvas.update_idletasks()  # Zajistit že je vše vykresleno
+            # bbox položek canvasu je k dispozici hned po vytvoření, bez update_idletasks
             bbox = self.graph_canvas._get_content_bbox_without_header()
             if bbox and bbox[2] > bbox[0]:
                 actual_width = bbox[2] - bbox[0]
@@ -237,12 +266,13 @@ class MainWindow:
             pass
 
         # Fallback: použít column_widths pokud jsou dostupné
-        if hasattr(self.graph_canvas.graph_drawer, 'column_widths'):
-            column_widths = self.graph_canvas.graph_drawer.column_widths
+        graph_drawer = self.graph_canvas.graph_drawer
+        if hasattr(graph_drawer, 'column_widths'):
+            column_widths = graph_drawer.column_widths
             if column_widths:
                 table_width = sum(column_widths.values())
-                # Přidat prostor pro graf větví
-                max_branch_lanes = len(set(commit.branch for commit in commits)) if commits else 1
+                # Přidat prostor pro graf větví - počet větví už spočítal drawer při vykreslení
+                max_branch_lanes = len(graph_drawer.branch_lanes) or 1
                 branch_width = max_branch_lanes * 25 + 120  # Konzervativnější odhad
                 return table_width + branch_width
 
@@ -306,8 +336,6 @@ class MainWindow:
         )
         self.drag_drop_frame.grid(row=0, column=0, sticky='nsew')
 
-        self.graph_canvas = GraphCanvas(self.content_frame, on_drop_callback=self.repo_manager.on_repository_selected)
-
         self.status_frame = ttk.Frame(self.main_frame)
         self.status_frame.grid(row=3, column=0, sticky='ew', pady=(25, 0))
         self.status_frame.columnconfigure(1, weight=1)
@@ -359,7 +387,7 @@ class MainWindow:
             self.drag_drop_frame.apply_theme()
 
         # Update graph canvas if exists
-        if hasattr(self, 'graph_canvas'):
+        if self.graph_canvas:
             self.graph_canvas.apply_theme()
 
         logger.info(f"Theme changed to: {theme}")
@@ -393,19 +421,23 @@ class MainWindow:
         # Update drag/drop frame
         self.drag_drop_frame.update_language()
 
-        # Redraw graph canvas if visible (to update column headers)
-        if self.graph_canvas.winfo_viewable() and hasattr(self.graph_canvas, 'graph_drawer'):
-            commits = getattr(self.graph_canvas.graph_drawer, '_current_commits', None)
-            if commits:
-                self.graph_canvas.update_graph(commits)
+        # Překreslit jen záhlaví sloupců - zbytek grafu na jazyku nezávisí
+        if self.graph_canvas and self.graph_canvas.winfo_viewable():
+            self.graph_canvas.refresh_column_headers()
+
+    def _ensure_graph_canvas(self):
+        """Vrátí GraphCanvas, při prvním použití ho vytvoří."""
+        if self.graph_canvas is None:
+            self.graph_canvas = GraphCanvas(self.content_frame, on_drop_callback=self.repo_manager.on_repository_selected)
+        return self.graph_canvas
 
-    def update_graph_with_remote(self, commits):
+    def update_graph_with_remote(self, commits, stats=None):
         self.repo_manager.is_remote_loaded = True  # Označit že jsou načtená remote data
-        self.graph_canvas.update_graph(commits)
+        self._ensure_graph_canvas().update_graph(commits)
 
         # Aktualizovat statistiky pomocí centralizované metody
         if self.stats_display:
-            self.stats_display.update_stats(self.repo_manager.git_repo, self.repo_manager.display_name)
+            self.stats_display.update_stats(self.repo_manager.git_repo, self.repo_manager.display_name, stats)
 
         # Po načtení remote dat vrátit původní text tlačítka
         if self.repo_manager.is_cloned_repo:
@@ -422,10 +454,10 @@ class MainWindow:
         # Zobrazit Refresh tlačítko (pokud už není zobrazené)
         self.refresh_button.grid(row=0, column=2, sticky='e', padx=(10, 0))
 
-        # Kratší delay pro rychlejší response, ale stále zajistit že je obsah vykreslen
-        self.root.after(50, lambda: self._resize_window_for_content(commits))
+        # Přizpůsobit okno obsahu (jen pokud už nemá správnou velikost)
+        self._resize_window_for_content(commits)
 
-    def show_graph(self, commits):
+    def show_graph(self, commits, stats=None):
         # Skrýt přepínač jazyka a přepínač tématu
         if self.language_switcher:
             self.language_switcher.hide()
@@ -433,14 +465,13 @@ class MainWindow:
             self.theme_switcher.hide()
 
         self.drag_drop_frame.grid_remove()
-        self.graph_canvas.grid(row=0, column=0, sticky='nsew')
-        self.graph_canvas.update_graph(commits)
+        graph_canvas = self._ensure_graph_canvas()
+        graph_canvas.grid(row=0, column=0, sticky='nsew')
+        graph_canvas.update_graph(commits)
 
         # Zobrazit název repozitáře s statistikami na jednom řádku a zachovat původní titul okna
+        # (název repozitáře nastavuje StatsDisplay, titul okna zůstává jako název aplikace)
         if self.repo_manager.git_repo and self.repo_manager.git_repo.repo_path:
-            import os
-            repo_name = os.path.basename(self.repo_manager.git_repo.repo_path)
-            # Titul okna zůstává jako název aplikace
             self.root.title(self.default_title)
 
         # Zobrazit header frame a nastavit padding
@@ -448,10 +479,10 @@ class MainWindow:
 
         # Nastavit název repozitáře (tučně) a statistiky (normálně) vedle sebe
         if self.stats_display:
-            self.stats_display.update_stats(self.repo_manager.git_repo, self.repo_manager.display_name)
+            self.stats_display.update_stats(self.repo_manager.git_repo, self.repo_manager.display_name, stats)
 
-        # Kratší delay pro rychlejší response, ale stále zajistit že je obsah vykreslen
-        self.root.after(50, lambda: self._resize_window_for_content(commits))
+        # Přizpůsobit okno obsahu (jen pokud už nemá správnou velikost)
+        self._resize_window_for_content(commits)
 
         self.progress.stop()
         tm = self.theme_manager
@@ -469,7 +500,7 @@ class MainWindow:
 
     def show_repository_selection(self):
         # Reset GraphDrawer state to clear column widths and cached data
-        if hasattr(self, 'graph_canvas') and hasattr(self.graph_canvas, 'graph_drawer'):
+        if self.graph_canvas:
             self.graph_canvas.graph_drawer.reset()
 
         # Close repository and cleanup temp files
@@ -481,7 +512,8 @@ class MainWindow:
         if self.theme_switcher:
             self.theme_switcher.show()
 
-        self.graph_canvas.grid_remove()
+        if self.graph_canvas:
+            self.graph_canvas.grid_remove()
         self.drag_drop_frame.grid(row=0, column=0, sticky='nsew')
 
         # Skrýt celý header frame
@@ -1,6 +1,8 @@
 """Repository manager component for loading and managing Git repositories."""
 
 import threading
+import queue
+from concurrent.futures import Future
 import os
 import tempfile
 import glob
@@ -16,6 +18,51 @@ from utils.translations import t
 logger = get_logger(__name__)
 
 
+class _LoaderThread:
+    """Jediné daemon vlákno pro načítání repozitářů.
+
+    Na rozdíl od ThreadPoolExecutor nebrání ukončení procesu - rozběhnuté
+    načítání se při zavření aplikace nečeká.
+    """
+
+    def __init__(self, name: str):
+        self._queue = queue.SimpleQueue()
+        self._thread = threading.Thread(target=self._run, name=name, daemon=True)
+        self._thread.start()
+
+    def submit(self, func, *args) -> Future:
+        """Zařadí func(*args) do fronty a vrátí Future, kterou lze zrušit dokud úloha nezačne."""
+        future = Future()
+        self._queue.put((future, func, args))
+        return future
+
+    def shutdown(self):
+        """Zruší čekající úlohy a ukončí vlákno, na běžící úlohu nečeká."""
+        while True:
+            try:
+                item = self._queue.get_nowait()
+            except queue.Empty:
+                break
+            if item is not None:
+                item[0].cancel()
+        self._queue.put(None)
+
+    def _run(self):
+        while True:
+            item = self._queue.get()
+            if item is None:
+                return
+            future, func, args = item
+            if not future.set_running_or_notify_cancel():
+                continue  # Zrušeno novějším požadavkem
+            try:
+                result = func(*args)
+            except BaseException as e:
+                future.set_exception(e)
+            else:
+                future.set_result(result)
+
+
 class RepositoryManager:
     """Component for managing Git repository operations including cloning, loading, and refreshing."""
 
@@ -38,6 +85,10 @@ class RepositoryManager:
         self.display_name = None  # Reálný název repozitáře (pro klonované repo)
         self.token_storage = TokenStorage()  # GitHub token storage
 
+        # Jediné worker vlákno pro načítání - serializuje loadery nad stejným GitRepository
+        self._loader = _LoaderThread('gitvys-loader')
+        self._pending_load = None  # Future posledního odeslaného načítání
+
         # Vyčistit staré temp složky z předchozích sessions
         self._cleanup_old_temp_clones()
 
@@ -79,12 +130,21 @@ class RepositoryManager:
             self.parent.progress.config(value=50, color=tm.get_color('progress_color_success'))
             self.parent.progress.start()
 
-            thread = threading.Thread(
-                target=self.load_repository,
-                args=(repo_path,),
-                daemon=True
-            )
-            thread.start()
+            self._submit_load(self.load_repository, repo_path)
+
+    def _submit_load(self, func, *args):
+        """
+        Odešle načítání do loader vlákna.
+
+        Pokud předchozí načítání ještě nezačalo, zruší se - běžet má jen poslední požadavek.
+
+        Args:
+            func: Metoda načítání (load_repository, refresh_local_repository, ...)
+            *args: Argumenty pro func
+        """
+        if self._pending_load is not None:
+            self._pending_load.cancel()
+        self._pending_load = self._loader.submit(func, *args)
 
     def _is_git_url(self, text: str) -> bool:
         """
@@ -239,12 +299,7 @@ class RepositoryManager:
         self.current_temp_clone = path  # Uložit cestu k aktuálnímu temp klonu
         self.parent.update_status(t('loading_cloned'))
 
-        thread = threading.Thread(
-            target=self.load_repository,
-            args=(path,),
-            daemon=True
-        )
-        thread.start()
+        self._submit_load(self.load_repository, path)
 
     def _cleanup_old_temp_clones(self):
         """Při startu smaže všechny temp složky z předchozích sessions."""
@@ -346,15 +401,33 @@ class RepositoryManager:
                 self.root.after(0, self.parent.show_error, t('no_commits'))
                 return
 
-            merge_branches = self.git_repo.get_merge_branches()
-            layout = GraphLayout(commits, merge_branches=merge_branches)
-            positioned_commits = layout.calculate_positions()
+            positioned_commits = self._layout_commits(commits)
+            stats = self.git_repo.get_repository_stats()
 
-            self.root.after(0, self.parent.show_graph, positioned_commits)
+            self.root.after(0, self.parent.show_graph, positioned_commits, stats)
 
         except Exception as e:
             self.root.after(0, self.parent.show_error, t('error_loading_repo', str(e)))
 
+    def _layout_commits(self, commits):
+        """
+        Spočítá pozice commitů (volá se z worker vlákna).
+
+        Před výpočtem layoutu pošle do GUI průběžný stav, aby uživatel
+        věděl, že parsování skončilo a běží rozložení grafu.
+
+        Args:
+            commits: Naparsované commity
+
+        Returns:
+            Commity s vypočtenými pozicemi
+        """
+        self.root.after(0, self.parent.update_status, t('calculating_layout', len(commits)))
+
+        merge_branches = self.git_repo.get_merge_branches()
+        layout = GraphLayout(commits, merge_branches=merge_branches)
+        return layout.calculate_positions()
+
     def refresh_repository(self):
         """Obnoví repozitář podle aktuálního stavu (lokální vs remote)."""
         if not self.git_repo:
@@ -370,11 +443,7 @@ class RepositoryManager:
             self.parent.progress.config(color=tm.get_color('progress_color_success'))
             self.parent.progress.start()
 
-            thread = threading.Thread(
-                target=self.refresh_local_repository,
-                daemon=True
-            )
-            thread.start()
+            self._submit_load(self.refresh_local_repository)
 
     def refresh_local_repository(self):
         """Obnoví lokální repozitář data."""
@@ -385,11 +454,10 @@ class RepositoryManager:
                 self.root.after(0, self.parent.show_error, t('no_commits'))
                 return
 
-            merge_branches = self.git_repo.get_merge_branches()
-            layout = GraphLayout(commits, merge_branches=merge_branches)
-            positioned_commits = layout.calculate_positions()
+            positioned_commits = self._layout_commits(commits)
+            stats = self.git_repo.get_repository_stats()
 
-            self.root.after(0, self.parent.show_graph, positioned_commits)
+            self.root.after(0, self.parent.show_graph, positioned_commits, stats)
 
         except Exception as e:
             self.root.after(0, self.parent.show_error, t('error_loading_repo', str(e)))
@@ -405,11 +473,7 @@ class RepositoryManager:
         self.parent.progress.config(color=tm.get_color('progress_color_success'))
         self.parent.progress.start()
 
-        thread = threading.Thread(
-            target=self.load_remote_repository,
-            daemon=True
-        )
-        thread.start()
+        self._submit_load(self.load_remote_repository)
 
     def load_remote_repository(self):
         """Načte remote repozitář data."""
@@ -420,15 +484,19 @@ class RepositoryManager:
                 self.root.after(0, self.parent.show_error, t('no_commits'))
                 return
 
-            merge_branches = self.git_repo.get_merge_branches()
-            layout = GraphLayout(commits, merge_branches=merge_branches)
-            positioned_commits = layout.calculate_positions()
+            positioned_commits = self._layout_commits(commits)
+            stats = self.git_repo.get_repository_stats()
 
-            self.root.after(0, self.parent.update_graph_with_remote, positioned_commits)
+            self.root.after(0, self.parent.update_graph_with_remote, positioned_commits, stats)
 
         except Exception as e:
             self.root.after(0, self.parent.show_error, t('error_loading_remote', str(e)))
 
+    def shutdown(self):
+        """Ukončí loader vlákno při zavření aplikace - čekající načítání zruší, běžící nečeká."""
+        self._pending_load = None
+        self._loader.shutdown()
+
     def close_repository(self):
         """Zavře aktuální repozitář a vyčistí temp soubory."""
         # Zavřít GitPython repo aby uvolnil file handles
@@ -3,7 +3,7 @@
 import tkinter as tk
 from tkinter import ttk
 import os
-from utils.translations import get_translation_manager
+from utils.translations import get_translation_manager, t
 from utils.theme_manager import get_theme_manager
 
 
@@ -63,13 +63,14 @@ class StatsDisplay:
 
         return self.info_frame, self.repo_name_label, self.stats_label
 
-    def update_stats(self, git_repo, display_name=None):
+    def update_stats(self, git_repo, display_name=None, stats=None):
         """
         Update repository statistics display with current language.
 
         Args:
             git_repo: GitRepository instance
             display_name: Optional display name for cloned repos
+            stats: Optional precomputed stats (from the loader thread)
         """
         if not git_repo:
             self.repo_name_label.config(text="")
@@ -80,25 +81,36 @@ class StatsDisplay:
         repo_name = display_name if display_name else os.path.basename(git_repo.repo_path)
         self.repo_name_label.config(text=repo_name)
 
-        # Získat statistiky
-        stats = git_repo.get_repository_stats()
+        # Získat statistiky - pokud je loader nespočítal předem, spočítat je teď
+        if stats is None:
+            stats = git_repo.get_repository_stats()
+        self.stats_label.config(text=self._format_stats(stats))
 
-        authors_text = f"{stats['authors']} {self.tm.get_plural(stats['authors'], 'author')}"
-        branches_text = f"{stats['branches']} {self.tm.get_plural(stats['branches'], 'branch')}"
-        commits_text = f"{stats['commits']} {self.tm.get_plural(stats['commits'], 'commit')}"
+    def _format_stats(self, stats):
+        """
+        Sestaví text statistik v aktuálním jazyce.
+
+        Args:
+            stats: Slovník z GitRepository.get_repository_stats()
+
+        Returns:
+            str: Statistiky oddělené čárkou
+        """
+        get_plural = self.tm.get_plural
+        parts = [
+            f"{stats['authors']} {get_plural(stats['authors'], 'author')}",
+            f"{stats['branches']} {get_plural(stats['branches'], 'branch')}",
+        ]
 
         # Zobrazit tagy jen pokud nějaké existují
         if stats['tags'] > 0:
-            from utils.translations import t
             if stats['remote_tags'] > 0:
-                tags_text = t('tags_format', stats['local_tags'], stats['remote_tags'])
+                parts.append(t('tags_format', stats['local_tags'], stats['remote_tags']))
             else:
-                tags_text = f"{stats['tags']} {self.tm.get_plural(stats['tags'], 'tag')}"
-            stats_text = f"{authors_text}, {branches_text}, {tags_text}, {commits_text}"
-        else:
-            stats_text = f"{authors_text}, {branches_text}, {commits_text}"
+                parts.append(f"{stats['tags']} {get_plural(stats['tags'], 'tag')}")
 
-        self.stats_label.config(text=stats_text)
+        parts.append(f"{stats['commits']} {get_plural(stats['commits'], 'commit')}")
+        return ", ".join(parts)
 
     def _show_repo_path_tooltip(self, event):
         """Zobrazí tooltip s cestou k repozitáři."""
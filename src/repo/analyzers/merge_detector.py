@@ -48,6 +48,9 @@ class MergeDetector:
         # Find merge commits (more than 1 parent)
         merge_commits = [commit for commit in self.commits if len(commit.parents) >= 2]
 
+        # Main line of branches with HEAD - loaded once, only when some merge needs it
+        commits_in_branches_with_head = None
+
         for merge_commit in merge_commits:
             try:
                 if len(merge_commit.parents) < 2:
@@ -76,7 +79,8 @@ class MergeDetector:
                             # If we found commits in merge branch
                             if merge_branch_commits:
                                 # Get commits in main line of branches with HEAD
-                                commits_in_branches_with_head = self.get_commits_in_branches_with_head()
+                                if commits_in_branches_with_head is None:
+                                    commits_in_branches_with_head = self.get_commits_in_branches_with_head()
 
                                 # Filter commits - remove those in path to HEAD
                                 filtered_commits = [c for c in merge_branch_commits
@@ -168,44 +172,9 @@ class MergeDetector:
         full_hash_map = {}
         if self.repo:
             try:
-                seen_commits = set()
-
-                # 1. First local branches
-                try:
-                    for head in self.repo.heads:
-                        try:
-                            for commit in self.repo.iter_commits(head):
-                                if commit.hexsha not in seen_commits:
-                                    seen_commits.add(commit.hexsha)
-                                    short_hash = commit.hexsha[:8]
-                                    full_hash_map[short_hash] = commit.hexsha
-                        except Exception as e:
-                            logger.warning(f"Failed to iterate commits for local branch {head.name}: {e}")
-                            continue
-                except Exception as e:
-                    logger.warning(f"Failed to access local branches: {e}")
-
-                # 2. Then remote branches (except /HEAD)
-                try:
-                    if hasattr(self.repo, 'remotes') and self.repo.remotes:
-                        remote_refs = list(self.repo.remote().refs)
-                        for remote_ref in remote_refs:
-                            # Skip HEAD reference
-                            if remote_ref.name.endswith('/HEAD'):
-                                continue
-
-                            try:
-                                for commit in self.repo.iter_commits(remote_ref):
-                                    if commit.hexsha not in seen_commits:
-                                        seen_commits.add(commit.hexsha)
-                                        short_hash = commit.hexsha[:8]
-                                        full_hash_map[short_hash] = commit.hexsha
-                            except Exception as e:
-                                logger.warning(f"Failed to iterate commits for remote ref {remote_ref.name}: {e}")
-                                continue
-                except Exception as e:
-                    logger.debug(f"Failed to access remote refs: {e}")
-
+                # Local and origin remote branches in one rev-list call
+                for full_hash in self.repo.git.rev_list('--branches', '--remotes=origin').split():
+                    full_hash_map[full_hash[:8]] = full_hash
             except Exception as e:
                 logger.warning(f"Failed to build full hash map: {e}")
         return full_hash_map
@@ -250,18 +219,10 @@ class MergeDetector:
         commits_in_branches_with_head = set()
         if self.repo:
             try:
-                for branch_head in self.repo.heads:
-                    try:
-                        commit = branch_head.commit
-                        while commit:
-                            commits_in_branches_with_head.add(commit.hexsha[:8])
-                            if commit.parents:
-                                commit = commit.parents[0]  # Only first parent
-                            else:
-                                break
-                    except Exception as e:
-                        logger.warning(f"Failed to traverse branch {branch_head.name}: {e}")
-                        continue
+                # Only first parents from all local branch heads, read by git instead of
+                # decoding commit objects one by one
+                output = self.repo.git.rev_list('--first-parent', '--branches')
+                commits_in_branches_with_head = {full_hash[:8] for full_hash in output.split()}
             except Exception as e:
                 logger.warning(f"Failed to get branches with HEAD: {e}")
         return commits_in_branches_with_head
@@ -0,0 +1,107 @@
+"""CommitCache - on-disk cache of parsed commits."""
+
+import hashlib
+import os
+import pickle
+from pathlib import Path
+from typing import List, Optional
+from utils.data_structures import Commit
+from utils.logging_config import get_logger
+
+logger = get_logger(__name__)
+
+# Bump when Commit or the parsing output changes so old cache files are ignored
+CACHE_FORMAT_VERSION = 3
+
+# Maximum number of cache files kept (oldest are removed first)
+MAX_CACHE_FILES = 20
+
+if os.name == 'nt':  # Windows
+    DEFAULT_CACHE_DIR = Path(os.environ.get('USERPROFILE', '~')) / '.gitvys' / 'cache'
+else:  # Linux/Mac
+    DEFAULT_CACHE_DIR = Path.home() / '.gitvys' / 'cache'
+
+
+class CommitCache:
+    """Stores parsed commits per repository so an unchanged repository is not parsed again."""
+
+    def __init__(self, cache_dir: Optional[Path] = None):
+        """Initialize CommitCache.
+
+        Args:
+            cache_dir: Directory for cache files (defaults to ~/.gitvys/cache)
+        """
+        self.cache_dir = Path(cache_dir) if cache_dir else DEFAULT_CACHE_DIR
+
+    def load(self, name: str, key: str) -> Optional[List[Commit]]:
+        """Load cached commits if they were stored under the same key.
+
+        Args:
+            name: Cache entry identity (repository path and parse mode)
+            key: Snapshot key of repository refs
+
+        Returns:
+            List of commits, or None on cache miss
+        """
+        cache_file = self._cache_file(name)
+        try:
+            if not cache_file.exists():
+                return None
+            with cache_file.open('rb') as f:
+                payload = pickle.load(f)
+        except Exception as e:
+            logger.debug(f"Failed to read commit cache {cache_file}: {e}")
+            return None
+
+        if payload.get('version') != CACHE_FORMAT_VERSION or payload.get('key') != key:
+            return None
+
+        logger.info(f"Loaded {len(payload['commits'])} commits from cache")
+        return payload['commits']
+
+    def save(self, name: str, key: str, commits: List[Commit]) -> bool:
+        """Store commits under given key.
+
+        Args:
+            name: Cache entry identity (repository path and parse mode)
+            key: Snapshot key of repository refs
+            commits: Parsed commits
+
+        Returns:
+            True if commits were stored, False on error
+        """
+        cache_file = self._cache_file(name)
+        try:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            payload = {'version': CACHE_FORMAT_VERSION, 'key': key, 'commits': commits}
+            tmp_file = cache_file.with_suffix('.tmp')
+            with tmp_file.open('wb') as f:
+                pickle.dump(payload, f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp_file, cache_file)
+        except Exception as e:
+            logger.debug(f"Failed to write commit cache {cache_file}: {e}")
+            return False
+
+        self._prune()
+        return True
+
+    def _cache_file(self, name: str) -> Path:
+        """Get cache file path for given entry identity.
+
+        Args:
+            name: Cache entry identity
+
+        Returns:
+            Path to cache file
+        """
+        digest = hashlib.sha1(name.encode('utf-8')).hexdigest()
+        return self.cache_dir / f"{digest}.pkl"
+
+    def _prune(self):
+        """Remove oldest cache files above MAX_CACHE_FILES."""
+        try:
+            cache_files = sorted(self.cache_dir.glob('*.pkl'), key=lambda p: p.stat().st_mtime, reverse=True)
+            for old_file in cache_files[MAX_CACHE_FILES:]:
+                old_file.unlink()
+        except Exception as e:
+            logger.debug(f"Failed to prune commit cache: {e}")
@@ -1,6 +1,6 @@
 """BranchAnalyzer - handles branch analysis and relationship detection."""
 
-from typing import Dict, Set
+from typing import Dict, List, Optional, Set, Tuple
 from git import Repo
 from utils.logging_config import get_logger
 
@@ -18,52 +18,38 @@ class BranchAnalyzer:
         """
         self.repo = repo
 
-    def build_commit_branch_map(self) -> Dict[str, str]:
+    def build_commit_branch_map(self, parent_map: Optional[Dict[str, List[str]]] = None) -> Dict[str, str]:
         """Build map of commit_hash -> branch_name for fast lookup.
 
+        Each commit belongs to the first branch that reaches it, with main/master
+        processed before other branches.
+
+        Args:
+            parent_map: Parents of all commits on local branches, if already read
+                (loaded with `git rev-list` otherwise)
+
         Returns:
             Dictionary mapping commit hash to branch name
         """
         commit_to_branch = {}
 
         try:
-            # First process main branches with priority
-            main_branches = ['main', 'master']
-            other_branches = []
-
-            # Work with local heads (branches)
-            for head in self.repo.heads:
-                branch_name = head.name
-                if branch_name in main_branches:
-                    # Process main branches immediately
-                    try:
-                        for commit in self.repo.iter_commits(head):
-                            commit_to_branch[commit.hexsha] = branch_name
-                    except Exception as e:
-                        logger.warning(f"Failed to iterate commits for branch {branch_name}: {e}")
-                        continue
-                else:
-                    other_branches.append((head, branch_name))
-
-            # Then process other branches, but only commits that don't have a branch yet
-            for head, branch_name in other_branches:
-                try:
-                    for commit in self.repo.iter_commits(head):
-                        commit_hash = commit.hexsha
-                        if commit_hash not in commit_to_branch:
-                            commit_to_branch[commit_hash] = branch_name
-                except Exception as e:
-                    logger.warning(f"Failed to iterate commits for branch {branch_name}: {e}")
-                    continue
-
-        except Exception:
-            pass
+            if parent_map is None:
+                parent_map = self._load_parent_map('--branches')
+            self._assign_branches(self._get_local_tips(), parent_map, commit_to_branch)
+        except Exception as e:
+            logger.warning(f"Failed to build commit-branch map: {e}")
 
         return commit_to_branch
 
-    def build_commit_branch_map_with_remote(self) -> tuple[Dict[str, str], Dict[str, str]]:
+    def build_commit_branch_map_with_remote(
+            self, parent_map: Optional[Dict[str, List[str]]] = None) -> tuple[Dict[str, str], Dict[str, str]]:
         """Build maps of commit_hash -> branch_name for local and remote branches.
 
+        Args:
+            parent_map: Parents of all commits on local and origin branches, if already
+                read (loaded with `git rev-list` otherwise)
+
         Returns:
             Tuple of (local_commit_map, remote_commit_map)
         """
@@ -71,57 +57,109 @@ class BranchAnalyzer:
         remote_commit_map = {}
 
         try:
-            # 1. Prioritize local branches
-            main_branches = ['main', 'master']
-            other_local_branches = []
+            if parent_map is None:
+                parent_map = self._load_parent_map('--branches', '--remotes')
 
-            for head in self.repo.heads:
-                branch_name = head.name
-                if branch_name in main_branches:
-                    try:
-                        for commit in self.repo.iter_commits(head):
-                            local_commit_map[commit.hexsha] = branch_name
-                    except Exception as e:
-                        logger.warning(f"Failed to iterate commits for main branch {branch_name}: {e}")
-                        continue
-                else:
-                    other_local_branches.append((head, branch_name))
-
-            for head, branch_name in other_local_branches:
-                try:
-                    for commit in self.repo.iter_commits(head):
-                        if commit.hexsha not in local_commit_map:
-                            local_commit_map[commit.hexsha] = branch_name
-                except Exception as e:
-                    logger.warning(f"Failed to iterate commits for local branch {branch_name}: {e}")
-                    continue
+            # 1. Prioritize local branches
+            self._assign_branches(self._get_local_tips(), parent_map, local_commit_map)
 
             # 2. Remote branches - only for commits without local branch
+            remote_tips = []
             try:
-                remote_refs = list(self.repo.remote().refs)
-                for remote_ref in remote_refs:
+                for remote_ref in self.repo.remote().refs:
                     # Skip HEAD ref
                     if remote_ref.name.endswith('/HEAD'):
                         continue
-
                     try:
-                        for commit in self.repo.iter_commits(remote_ref):
-                            if commit.hexsha not in local_commit_map:
-                                remote_commit_map[commit.hexsha] = remote_ref.name
+                        remote_tips.append((remote_ref.commit.hexsha, remote_ref.name))
                     except Exception as e:
-                        logger.warning(f"Failed to iterate commits for remote ref {remote_ref.name}: {e}")
+                        logger.warning(f"Failed to resolve remote ref {remote_ref.name}: {e}")
                         continue
             except Exception as e:
                 # If remote doesn't exist, continue with local branches only
                 logger.debug(f"Failed to access remote refs: {e}")
-                pass
+
+            # Later remote refs take precedence over earlier ones
+            remote_tips.reverse()
+            self._assign_branches(remote_tips, parent_map, remote_commit_map, exclude=local_commit_map)
 
         except Exception as e:
             logger.warning(f"Failed to build commit-branch map with remote: {e}")
-            pass
 
         return local_commit_map, remote_commit_map
 
+    def _get_local_tips(self) -> List[Tuple[str, str]]:
+        """Get (tip_hash, branch_name) for local branches, main/master first.
+
+        If both main and master exist, the one listed later in repo.heads takes
+        shared history, as it did when main branches were walked in order.
+
+        Returns:
+            List of branch tips in assignment priority order
+        """
+        main_tips = []
+        other_tips = []
+
+        for head in self.repo.heads:
+            try:
+                tip = (head.commit.hexsha, head.name)
+            except Exception as e:
+                logger.warning(f"Failed to resolve branch {head.name}: {e}")
+                continue
+            if head.name in ('main', 'master'):
+                main_tips.append(tip)
+            else:
+                other_tips.append(tip)
+
+        # Later main branches take precedence over earlier ones
+        main_tips.reverse()
+        return main_tips + other_tips
+
+    def _load_parent_map(self, *rev_args: str) -> Dict[str, List[str]]:
+        """Load parent hashes of all commits reachable from given refs.
+
+        Uses a single `git rev-list --parents` call instead of walking
+        commit objects branch by branch.
+
+        Args:
+            rev_args: Arguments selecting refs (e.g. '--branches', '--remotes')
+
+        Returns:
+            Dictionary mapping commit hash to list of parent hashes
+        """
+        parent_map = {}
+        output = self.repo.git.rev_list('--parents', *rev_args)
+        for line in output.splitlines():
+            hashes = line.split()
+            if hashes:
+                parent_map[hashes[0]] = hashes[1:]
+        return parent_map
+
+    @staticmethod
+    def _assign_branches(tips: List[Tuple[str, str]], parent_map: Dict[str, List[str]],
+                         commit_to_branch: Dict[str, str], exclude: Dict[str, str] = None):
+        """Assign branch names to commits reachable from tips.
+
+        Tips are processed in order and a commit keeps the first name that reaches
+        it. The walk stops at already assigned commits - their ancestors were
+        assigned by the same walk - so every commit is visited once.
+
+        Args:
+            tips: List of (tip_hash, branch_name) in priority order
+            parent_map: Dictionary mapping commit hash to parent hashes
+            commit_to_branch: Map to fill (will be updated)
+            exclude: Commits already assigned elsewhere, not descended into
+        """
+        exclude = exclude or {}
+        for tip_hash, branch_name in tips:
+            stack = [tip_hash]
+            while stack:
+                commit_hash = stack.pop()
+                if commit_hash in commit_to_branch or commit_hash in exclude:
+                    continue
+                commit_to_branch[commit_hash] = branch_name
+                stack.extend(parent_map.get(commit_hash, ()))
+
     def build_branch_availability_map(self, include_remote: bool = True) -> Dict[str, str]:
         """Build map of branch_name -> availability (local_only/remote_only/both).
 
@@ -1,7 +1,8 @@
 """CommitParser - handles parsing of commits from Git repository."""
 
+import sys
 from datetime import datetime, timezone
-from typing import List, Dict, Optional
+from typing import List, Dict, NamedTuple, Optional
 from git import Repo
 from utils.data_structures import Commit, Tag
 from utils.logging_config import get_logger
@@ -10,6 +11,21 @@ from visualization.colors import get_branch_color
 
 logger = get_logger(__name__)
 
+# git log format: fields separated by US (0x1f), records by NUL (-z)
+_LOG_FORMAT = '%H%x1f%P%x1f%an%x1f%ae%x1f%cI%x1f%B'
+# --no-show-signature: log.showSignature=true would prepend gpg output to signed records
+_LOG_ARGS = ('-z', '--no-show-signature', f'--format={_LOG_FORMAT}')
+
+
+class RawCommit(NamedTuple):
+    """Commit fields read from `git log` output."""
+    hexsha: str
+    parents: List[str]
+    author_name: str
+    author_email: str
+    committed_datetime: datetime
+    message: str
+
 
 class CommitParser:
     """Handles parsing of commits from Git repository."""
@@ -24,7 +40,7 @@ class CommitParser:
 
     def parse_commits(self, commit_to_branch: Dict[str, str], commit_to_tags: Dict[str, List[Tag]],
                       branch_availability: Dict[str, str], branch_colors: Dict[str, str],
-                      used_colors: set) -> List[Commit]:
+                      used_colors: set, raw_commits: Optional[List[RawCommit]] = None) -> List[Commit]:
         """Parse commits from local branches.
 
         Args:
@@ -33,66 +49,72 @@ class CommitParser:
             branch_availability: Map of branch name to availability status
             branch_colors: Map of branch name to color (will be updated)
             used_colors: Set of already used colors (will be updated)
+            raw_commits: Commits from read_commits(), if already read
 
         Returns:
             List of parsed Commit objects
         """
         commits = []
-        seen_commits = set()
+        self._assign_branch_colors(self._get_refs(), set(commit_to_branch.values()),
+                                   branch_colors, used_colors)
+        now = datetime.now(timezone.utc)
+        share = {}.setdefault  # One shared instance per repeated string (authors, emails, dates)
+        author_shorts = {}
+
+        if raw_commits is None:
+            raw_commits = self.read_commits()
 
         # Iterate only over local branches
-        for head in self.repo.heads:
-            try:
-                for commit in self.repo.iter_commits(head):
-                    if commit.hexsha in seen_commits:
-                        continue
-                    seen_commits.add(commit.hexsha)
+        for commit in raw_commits:
+            branch_name = commit_to_branch.get(commit.hexsha, 'unknown')
 
-                    branch_name = commit_to_branch.get(commit.hexsha, 'unknown')
-
-                    if branch_name not in branch_colors:
-                        branch_colors[branch_name] = get_branch_color(branch_name, used_colors)
-
-                    full_message = commit.message.strip()
-                    message_lines = full_message.split('\n', 1)
-                    subject = message_lines[0]
-                    description = message_lines[1].strip() if len(message_lines) > 1 else ""
-
-                    # Get tags for this commit
-                    commit_tags = commit_to_tags.get(commit.hexsha, [])
-
-                    # Determine branch availability
-                    branch_avail = branch_availability.get(branch_name, 'local_only')
-
-                    commit_obj = Commit(
-                        hash=commit.hexsha[:8],
-                        message=subject,
-                        short_message=self.truncate_message(subject, MESSAGE_MAX_LENGTH),
-                        author=commit.author.name,
-                        author_short=self.truncate_name(commit.author.name),
-                        author_email=commit.author.email,
-                        date=commit.committed_datetime,
-                        date_relative=self.get_relative_date(commit.committed_datetime),
-                        date_short=self.get_full_date(commit.committed_datetime),
-                        parents=[parent.hexsha[:8] for parent in commit.parents],
-                        branch=branch_name,
-                        branch_color=branch_colors[branch_name],
-                        tags=commit_tags,
-                        branch_availability=branch_avail
-                    )
-                    commit_obj.description = description
-                    commit_obj.description_short = self.truncate_description(description)
-                    commits.append(commit_obj)
-            except Exception as e:
-                logger.warning(f"Failed to process commit from branch {head.name}: {e}")
-                continue
+            # Branches without a ref (e.g. 'unknown') get a color on first appearance
+            branch_color = branch_colors.get(branch_name)
+            if branch_color is None:
+                branch_color = branch_colors[branch_name] = get_branch_color(branch_name, used_colors)
+
+            full_message = commit.message.strip()
+            subject, _, description = full_message.partition('\n')
+            description = description.strip()
+
+            # Get tags for this commit
+            commit_tags = commit_to_tags.get(commit.hexsha, [])
+
+            # Determine branch availability
+            branch_avail = branch_availability.get(branch_name, 'local_only')
+
+            author = share(commit.author_name, commit.author_name)
+            author_short = author_shorts.get(author)
+            if author_short is None:
+                author_short = author_shorts[author] = self.truncate_name(author)
+            date_relative = self.get_relative_date(commit.committed_datetime, now)
+
+            commit_obj = Commit(
+                hash=sys.intern(commit.hexsha[:8]),
+                message=subject,
+                short_message=self.truncate_message(subject, MESSAGE_MAX_LENGTH),
+                author=author,
+                author_short=author_short,
+                author_email=share(commit.author_email, commit.author_email),
+                date=commit.committed_datetime,
+                date_relative=share(date_relative, date_relative),
+                date_short=self.get_full_date(commit.committed_datetime),
+                parents=tuple([sys.intern(parent[:8]) for parent in commit.parents]),
+                branch=branch_name,
+                branch_color=branch_color,
+                tags=commit_tags,
+                branch_availability=branch_avail
+            )
+            commit_obj.description = description
+            commit_obj.description_short = self.truncate_description(description)
+            commits.append(commit_obj)
 
         return commits
 
     def parse_commits_with_remote(self, local_commit_map: Dict[str, str], remote_commit_map: Dict[str, str],
                                    commit_to_tags: Dict[str, List[Tag]], branch_availability: Dict[str, str],
                                    branch_divergences: Dict[str, Dict], branch_colors: Dict[str, str],
-                                   used_colors: set) -> List[Commit]:
+                                   used_colors: set, raw_commits: Optional[List[RawCommit]] = None) -> List[Commit]:
         """Parse commits including remote branches from origin.
 
         Args:
@@ -103,6 +125,7 @@ class CommitParser:
             branch_divergences: Map of branch name to divergence info
             branch_colors: Map of branch name to color (will be updated)
             used_colors: Set of already used colors (will be updated)
+            raw_commits: Commits from read_commits(include_remote=True), if already read
 
         Returns:
             List of parsed Commit objects
@@ -117,45 +140,16 @@ class CommitParser:
                 'remote': div_info.get('remote_head')
             }
 
-        # Safely iterate over all commits (local + remote, without broken refs)
-        seen_commits = set()
-        all_commits_to_process = []
-
-        # 1. First local branches
-        try:
-            for head in self.repo.heads:
-                try:
-                    for commit in self.repo.iter_commits(head):
-                        if commit.hexsha not in seen_commits:
-                            seen_commits.add(commit.hexsha)
-                            all_commits_to_process.append(commit)
-                except Exception as e:
-                    logger.warning(f"Failed to iterate commits for local branch {head.name}: {e}")
-                    continue
-        except Exception as e:
-            logger.warning(f"Failed to access local branches: {e}")
-
-        # 2. Then remote branches (except /HEAD)
-        try:
-            if hasattr(self.repo, 'remotes') and self.repo.remotes:
-                remote_refs = list(self.repo.remote().refs)
-                for remote_ref in remote_refs:
-                    # Skip HEAD reference
-                    if remote_ref.name.endswith('/HEAD'):
-                        continue
-
-                    try:
-                        for commit in self.repo.iter_commits(remote_ref):
-                            if commit.hexsha not in seen_commits:
-                                seen_commits.add(commit.hexsha)
-                                all_commits_to_process.append(commit)
-                    except Exception as e:
-                        logger.warning(f"Failed to iterate commits for remote ref {remote_ref.name}: {e}")
-                        continue
-        except Exception as e:
-            logger.debug(f"Failed to access remote refs: {e}")
+        # Local and origin remote branches in one git log call (without broken refs)
+        all_commits_to_process = raw_commits if raw_commits is not None else self.read_commits(include_remote=True)
+        self._assign_branch_colors(self._get_refs(include_remote=True),
+                                   set(local_commit_map.values()) | set(remote_commit_map.values()),
+                                   branch_colors, used_colors)
+        now = datetime.now(timezone.utc)
+        share = {}.setdefault  # One shared instance per repeated string (authors, emails, dates)
+        author_shorts = {}
 
-        # 3. Process all found commits
+        # Process all found commits
         for commit in all_commits_to_process:
             # Prioritize local branch
             if commit.hexsha in local_commit_map:
@@ -168,13 +162,14 @@ class CommitParser:
                 branch_name = 'unknown'
                 is_remote = False
 
-            if branch_name not in branch_colors:
-                branch_colors[branch_name] = get_branch_color(branch_name, used_colors)
+            # Branches without a ref (e.g. 'unknown') get a color on first appearance
+            branch_color = branch_colors.get(branch_name)
+            if branch_color is None:
+                branch_color = branch_colors[branch_name] = get_branch_color(branch_name, used_colors)
 
             full_message = commit.message.strip()
-            message_lines = full_message.split('\n', 1)
-            subject = message_lines[0]
-            description = message_lines[1].strip() if len(message_lines) > 1 else ""
+            subject, _, description = full_message.partition('\n')
+            description = description.strip()
 
             # Get tags for this commit
             commit_tags = commit_to_tags.get(commit.hexsha, [])
@@ -208,19 +203,25 @@ class CommitParser:
                     is_branch_head = True
                     branch_head_type = "remote"
 
+            author = share(commit.author_name, commit.author_name)
+            author_short = author_shorts.get(author)
+            if author_short is None:
+                author_short = author_shorts[author] = self.truncate_name(author)
+            date_relative = self.get_relative_date(commit.committed_datetime, now)
+
             commit_obj = Commit(
-                hash=commit.hexsha[:8],
+                hash=sys.intern(commit.hexsha[:8]),
                 message=subject,
                 short_message=self.truncate_message(subject, MESSAGE_MAX_LENGTH),
-                author=commit.author.name,
-                author_short=self.truncate_name(commit.author.name),
-                author_email=commit.author.email,
+                author=author,
+                author_short=author_short,
+                author_email=share(commit.author_email, commit.author_email),
                 date=commit.committed_datetime,
-                date_relative=self.get_relative_date(commit.committed_datetime),
+                date_relative=share(date_relative, date_relative),
                 date_short=self.get_full_date(commit.committed_datetime),
-                parents=[parent.hexsha[:8] for parent in commit.parents],
+                parents=tuple([sys.intern(parent[:8]) for parent in commit.parents]),
                 branch=branch_name,
-                branch_color=branch_colors[branch_name],
+                branch_color=branch_color,
                 is_remote=is_remote,
                 tags=commit_tags,
                 branch_availability=branch_avail,
@@ -233,6 +234,121 @@ class CommitParser:
 
         return commits
 
+    def read_commits(self, include_remote: bool = False) -> List[RawCommit]:
+        """Read all commits of local branches, optionally with origin remote branches.
+
+        The result can be passed to parse_commits/parse_commits_with_remote and its
+        parents reused for branch mapping, so history is read only once.
+
+        Args:
+            include_remote: Whether to include origin remote branches
+
+        Returns:
+            List of RawCommit, each commit once
+        """
+        if include_remote:
+            return self._read_commits('--branches', '--remotes=origin')
+        return self._read_commits('--branches')
+
+    def _read_commits(self, *rev_args: str) -> List[RawCommit]:
+        """Read commits reachable from given refs with a single `git log` call.
+
+        Falls back to reading each ref separately if the combined call fails
+        (e.g. because of a broken ref), so valid branches are still shown.
+
+        Args:
+            rev_args: Arguments selecting refs (e.g. '--branches', '--remotes=origin')
+
+        Returns:
+            List of RawCommit, each commit once
+        """
+        try:
+            return self._parse_log_output(self.repo.git.log(*rev_args, *_LOG_ARGS))
+        except Exception as e:
+            logger.warning(f"Failed to read commits for {' '.join(rev_args)}, reading refs one by one: {e}")
+
+        refs = self._get_refs(include_remote=any(arg.startswith('--remotes') for arg in rev_args))
+
+        commits = []
+        seen_commits = set()
+        for ref in refs:
+            try:
+                output = self.repo.git.log(ref.path, *_LOG_ARGS)
+            except Exception as e:
+                logger.warning(f"Failed to iterate commits for {ref.name}: {e}")
+                continue
+            for commit in self._parse_log_output(output):
+                if commit.hexsha not in seen_commits:
+                    seen_commits.add(commit.hexsha)
+                    commits.append(commit)
+        return commits
+
+    def _get_refs(self, include_remote: bool = False) -> list:
+        """Get local branch heads, optionally followed by origin remote refs (without /HEAD).
+
+        Args:
+            include_remote: Whether to include origin remote refs
+
+        Returns:
+            List of refs in ref name order, local first
+        """
+        try:
+            refs = list(self.repo.heads)
+        except Exception as e:
+            logger.warning(f"Failed to access local branches: {e}")
+            refs = []
+
+        if include_remote:
+            try:
+                refs += [ref for ref in self.repo.remote().refs if not ref.name.endswith('/HEAD')]
+            except Exception as e:
+                logger.debug(f"Failed to access remote refs: {e}")
+        return refs
+
+    @staticmethod
+    def _assign_branch_colors(refs: list, branch_names: set, branch_colors: Dict[str, str],
+                              used_colors: set):
+        """Assign branch colors in ref order.
+
+        Colors depend on the order in which they are handed out, so following
+        refs (not commit dates) keeps them stable when a new commit is added.
+
+        Args:
+            refs: Refs in display priority order
+            branch_names: Branch names that actually own some commit
+            branch_colors: Map of branch name to color (will be updated)
+            used_colors: Set of already used colors (will be updated)
+        """
+        for ref in refs:
+            name = ref.name
+            if name in branch_names and name not in branch_colors:
+                branch_colors[name] = get_branch_color(name, used_colors)
+
+    @staticmethod
+    def _parse_log_output(output: str) -> List[RawCommit]:
+        """Parse `git log -z` output produced with _LOG_FORMAT.
+
+        Args:
+            output: Raw git log output
+
+        Returns:
+            List of RawCommit
+        """
+        commits = []
+        for record in output.split('\0'):
+            if not record:
+                continue
+            hexsha, parents, author_name, author_email, date, message = record.lstrip('\n').split('\x1f', 5)
+            commits.append(RawCommit(
+                hexsha=hexsha,
+                parents=parents.split(),
+                author_name=author_name,
+                author_email=author_email,
+                committed_datetime=datetime.fromisoformat(date),
+                message=message
+            ))
+        return commits
+
     def truncate_message(self, message: str, max_length: int) -> str:
         """Truncate message to max length.
 
@@ -276,9 +392,10 @@ class CommitParser:
         if not description:
             return ""
 
-        # Take only first line
-        first_line = description.split('\n')[0].strip()
-        has_more_lines = '\n' in description
+        # Take only first line (partition does not split the rest of the body)
+        first_line, newline, _ = description.partition('\n')
+        first_line = first_line.strip()
+        has_more_lines = bool(newline)
 
         # Determine if we need ellipsis
         needs_ellipsis = False
@@ -304,17 +421,22 @@ class CommitParser:
 
         return first_line
 
-    def get_relative_date(self, date: datetime) -> str:
+    def get_relative_date(self, date: datetime, now: Optional[datetime] = None) -> str:
         """Get relative date string (e.g., '2 days ago').
 
         Args:
             date: Date to convert
+            now: Current UTC time (pass once per parse to avoid a clock read per commit)
 
         Returns:
             Relative date string
         """
-        now = datetime.now(timezone.utc)
-        diff = now - date.replace(tzinfo=timezone.utc)
+        if now is None:
+            now = datetime.now(timezone.utc)
+        if date.tzinfo is None:
+            # Naive date - treat as UTC
+            date = date.replace(tzinfo=timezone.utc)
+        diff = now - date
 
         if diff.days > 7:
             return f"{diff.days // 7} týdnů"
@@ -336,7 +458,7 @@ class CommitParser:
         Returns:
             Short date string
         """
-        return date.strftime("%d.%m")
+        return f"{date.day:02d}.{date.month:02d}"
 
     def get_full_date(self, date: datetime) -> str:
         """Get full date string (DD.MM.YYYY @ HH:MM).
@@ -347,4 +469,5 @@ class CommitParser:
         Returns:
             Full date string
         """
-        return date.strftime("%d.%m.%Y @ %H:%M")
+        # Same output as strftime("%d.%m.%Y @ %H:%M"), about 2x faster per commit
+        return f"{date.day:02d}.{date.month:02d}.{date.year} @ {date.hour:02d}:{date.minute:02d}"
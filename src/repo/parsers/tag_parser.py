@@ -62,6 +62,11 @@ class TagParser:
         local_tags = self.build_commit_tag_map()
         commit_to_tags.update(local_tags)
 
+        # Tag names per commit for O(1) duplicate checks
+        commit_to_tag_names = {
+            commit_hash: {tag.name for tag in tags} for commit_hash, tags in commit_to_tags.items()
+        }
+
         # Then remote tags (only if commit doesn't have local tag yet)
         try:
             # Remote tags are in refs/remotes/origin/tags/* or loaded via remote
@@ -90,13 +95,13 @@ class TagParser:
                         message=""
                     )
 
-                    if tag_commit.hexsha not in commit_to_tags:
-                        commit_to_tags[tag_commit.hexsha] = []
+                    commit_tags = commit_to_tags.setdefault(tag_commit.hexsha, [])
+                    existing_names = commit_to_tag_names.setdefault(tag_commit.hexsha, set())
 
                     # Add only if there isn't already a local tag with same name
-                    existing_names = [t.name for t in commit_to_tags[tag_commit.hexsha]]
                     if tag_name not in existing_names:
-                        commit_to_tags[tag_commit.hexsha].append(tag_obj)
+                        commit_tags.append(tag_obj)
+                        existing_names.add(tag_obj.name)
                 except Exception as e:
                     logger.warning(f"Failed to process remote tag {remote_ref.name}: {e}")
                     continue
@@ -1,10 +1,14 @@
+import hashlib
+import os
 from datetime import datetime, timezone
+from operator import attrgetter
 from typing import List, Dict, Optional
 from git import Repo, InvalidGitRepositoryError
 from utils.data_structures import Commit, Branch, Tag, MergeBranch
 from utils.logging_config import get_logger
 from repo.parsers import CommitParser, BranchAnalyzer, TagParser
 from repo.analyzers import MergeDetector
+from repo.commit_cache import CommitCache
 
 logger = get_logger(__name__)
 
@@ -24,15 +28,18 @@ class GitRepository:
         self.branch_analyzer: Optional[BranchAnalyzer] = None
         self.tag_parser: Optional[TagParser] = None
         self.merge_detector: Optional[MergeDetector] = None
+        self.commit_cache: Optional[CommitCache] = None
 
     def load_repository(self) -> bool:
         try:
-            self.repo = Repo(self.repo_path)
+            # Path comes from a dialog or drag & drop - open it literally, without env var expansion
+            self.repo = Repo(self.repo_path, search_parent_directories=False, expand_vars=False)
 
             # Initialize components
             self.commit_parser = CommitParser(self.repo)
             self.branch_analyzer = BranchAnalyzer(self.repo)
             self.tag_parser = TagParser(self.repo)
+            self.commit_cache = CommitCache()
 
             return True
         except InvalidGitRepositoryError:
@@ -43,19 +50,28 @@ class GitRepository:
         if not self.repo:
             return []
 
-        # Delegate to components
-        commit_to_branch = self.branch_analyzer.build_commit_branch_map()
-        commit_to_tags = self.tag_parser.build_commit_tag_map()
-        branch_availability = self.branch_analyzer.build_branch_availability_map(include_remote=False)
-
-        # Prepare color tracking
-        used_colors = set()
-        branch_colors = {}
-
-        # Delegate commit parsing to CommitParser
-        commits = self.commit_parser.parse_commits(
-            commit_to_branch, commit_to_tags, branch_availability, branch_colors, used_colors
-        )
+        cache_key = self._get_cache_key()
+        commits = self._load_cached_commits('local', cache_key)
+        if commits is None:
+            # Read history once - its parents also drive branch assignment
+            raw_commits = self.commit_parser.read_commits()
+            parent_map = {commit.hexsha: commit.parents for commit in raw_commits}
+
+            # Delegate to components
+            commit_to_branch = self.branch_analyzer.build_commit_branch_map(parent_map)
+            commit_to_tags = self.tag_parser.build_commit_tag_map()
+            branch_availability = self.branch_analyzer.build_branch_availability_map(include_remote=False)
+
+            # Prepare color tracking
+            used_colors = set()
+            branch_colors = {}
+
+            # Delegate commit parsing to CommitParser
+            commits = self.commit_parser.parse_commits(
+                commit_to_branch, commit_to_tags, branch_availability, branch_colors, used_colors,
+                raw_commits=raw_commits
+            )
+            self._store_cached_commits('local', cache_key, commits)
 
         # Add uncommitted changes
         uncommitted_info = self.get_uncommitted_changes()
@@ -68,7 +84,7 @@ class GitRepository:
         self.merge_branches = merge_branches
         self.merge_detector.apply_merge_branch_styling(all_commits, merge_branches)
 
-        all_commits.sort(key=lambda c: c.date, reverse=True)
+        all_commits.sort(key=attrgetter('date'), reverse=True)
 
         self.commits = all_commits
         return all_commits
@@ -78,26 +94,35 @@ class GitRepository:
         if not self.repo:
             return []
 
-        # Delegate to components
-        local_commit_map, remote_commit_map = self.branch_analyzer.build_commit_branch_map_with_remote()
-        commit_to_tags = self.tag_parser.build_commit_tag_map_with_remote()
-        branch_availability = self.branch_analyzer.build_branch_availability_map()
-
-        # Detect divergences for all branches
-        all_branch_names = self.branch_analyzer.get_all_branch_names()
-        branch_divergences = {}
-        for branch_name in all_branch_names:
-            branch_divergences[branch_name] = self.branch_analyzer.detect_branch_divergence(branch_name)
-
-        # Prepare color tracking
-        used_colors = set()
-        branch_colors = {}
-
-        # Delegate commit parsing to CommitParser
-        commits = self.commit_parser.parse_commits_with_remote(
-            local_commit_map, remote_commit_map, commit_to_tags,
-            branch_availability, branch_divergences, branch_colors, used_colors
-        )
+        cache_key = self._get_cache_key()
+        commits = self._load_cached_commits('remote', cache_key)
+        if commits is None:
+            # Read history once - its parents also drive branch assignment
+            raw_commits = self.commit_parser.read_commits(include_remote=True)
+            parent_map = {commit.hexsha: commit.parents for commit in raw_commits}
+
+            # Delegate to components
+            local_commit_map, remote_commit_map = self.branch_analyzer.build_commit_branch_map_with_remote(parent_map)
+            commit_to_tags = self.tag_parser.build_commit_tag_map_with_remote()
+            branch_availability = self.branch_analyzer.build_branch_availability_map()
+
+            # Detect divergences for all branches
+            all_branch_names = self.branch_analyzer.get_all_branch_names()
+            branch_divergences = {}
+            for branch_name in all_branch_names:
+                branch_divergences[branch_name] = self.branch_analyzer.detect_branch_divergence(branch_name)
+
+            # Prepare color tracking
+            used_colors = set()
+            branch_colors = {}
+
+            # Delegate commit parsing to CommitParser
+            commits = self.commit_parser.parse_commits_with_remote(
+                local_commit_map, remote_commit_map, commit_to_tags,
+                branch_availability, branch_divergences, branch_colors, used_colors,
+                raw_commits=raw_commits
+            )
+            self._store_cached_commits('remote', cache_key, commits)
 
         # Add uncommitted changes
         uncommitted_info = self.get_uncommitted_changes()
@@ -110,11 +135,41 @@ class GitRepository:
         self.merge_branches = merge_branches
         self.merge_detector.apply_merge_branch_styling(all_commits, merge_branches)
 
-        all_commits.sort(key=lambda c: c.date, reverse=True)
+        all_commits.sort(key=attrgetter('date'), reverse=True)
 
         self.commits = all_commits
         return all_commits
 
+    def _get_cache_key(self) -> Optional[str]:
+        """Snapshot key of all refs and HEAD - changes whenever a branch, remote or tag moves."""
+        try:
+            refs = self.repo.git.show_ref('--head')
+            return hashlib.sha1(refs.encode('utf-8')).hexdigest()
+        except Exception as e:
+            # Empty repository (no refs) or git error - don't use cache
+            logger.debug(f"Failed to read refs for commit cache: {e}")
+            return None
+
+    def _cache_name(self, mode: str) -> str:
+        """Cache entry identity for this repository and parse mode."""
+        return f"{os.path.abspath(self.repo_path)}|{mode}"
+
+    def _load_cached_commits(self, mode: str, cache_key: Optional[str]) -> Optional[List[Commit]]:
+        """Load commits parsed earlier for the same refs, with relative dates refreshed."""
+        if not self.commit_cache or not cache_key:
+            return None
+
+        commits = self.commit_cache.load(self._cache_name(mode), cache_key)
+        if commits is not None:
+            now = datetime.now(timezone.utc)
+            for commit in commits:
+                commit.date_relative = self.commit_parser.get_relative_date(commit.date, now)
+        return commits
+
+    def _store_cached_commits(self, mode: str, cache_key: Optional[str], commits: List[Commit]):
+        """Store freshly parsed commits (before merge styling modifies them)."""
+        if self.commit_cache and cache_key and commits:
+            self.commit_cache.save(self._cache_name(mode), cache_key, commits)
 
     def get_uncommitted_changes(self) -> Dict[str, any]:
         """Detekuje uncommitted změny (staged a working directory)."""
@@ -228,7 +283,7 @@ class GitRepository:
                 date=now,
                 date_relative="",  # Prázdné pole
                 date_short="",  # Prázdné pole
-                parents=[head_commit.hash] if head_commit else [],  # Parent je HEAD commit větve
+                parents=(head_commit.hash,) if head_commit else (),  # Parent je HEAD commit větve
                 branch=current_branch,
                 branch_color=branch_color,
                 is_uncommitted=True,
@@ -1,6 +1,6 @@
 from dataclasses import dataclass
 from datetime import datetime
-from typing import List
+from typing import List, Tuple
 
 
 @dataclass
@@ -21,7 +21,7 @@ class Commit:
     date: datetime
     date_relative: str
     date_short: str
-    parents: List[str]
+    parents: Tuple[str, ...]  # Internované krátké hashe - sdílené s Commit.hash rodičů
     branch: str
     branch_color: str
     x: int = 0
@@ -25,6 +25,7 @@ TRANSLATIONS = {
         'loading_cloned': 'Načítám naklonovaný repozitář...',
         'loading_remote_branches': 'Načítám remote větve...',
         'loading': 'Načítám...',
+        'calculating_layout': 'Počítám rozložení grafu ({} commitů)...',
         'loaded_commits': 'Načteno {} commitů',
         'loaded_commits_remote': 'Načteno {} commitů (včetně remote)',
         'error': 'Chyba',
@@ -110,6 +111,7 @@ TRANSLATIONS = {
         'loading_cloned': 'Loading cloned repository...',
         'loading_remote_branches': 'Loading remote branches...',
         'loading': 'Loading...',
+        'calculating_layout': 'Calculating graph layout ({} commits)...',
         'loaded_commits': 'Loaded {} commits',
         'loaded_commits_remote': 'Loaded {} commits (including remote)',
         'error': 'Error',
@@ -324,7 +326,7 @@ class TranslationManager:
             # Czech has 3 plural forms
             if count == 1:
                 key = f'{key_base}_1'
-            elif count in [2, 3, 4]:
+            elif 2 <= count <= 4:
                 key = f'{key_base}_2_4'
             else:
                 key = f'{key_base}_5'
@@ -1,15 +1,15 @@
 """Color utilities for visualization components."""
 
 import colorsys
+from functools import lru_cache
 from utils.logging_config import get_logger
 
 logger = get_logger(__name__)
 
 
+@lru_cache(maxsize=512)
 def hsl_to_hex(h: float, s: float, l: float) -> str:
     """Převede HSL hodnoty na hex barvu."""
-    import colorsys
-
     # Převést na RGB (0-1 rozsah)
     r, g, b = colorsys.hls_to_rgb(h / 360, l / 100, s / 100)
 
@@ -114,18 +114,21 @@ def get_branch_color(branch_name: str, used_colors: set) -> str:
             return color
 
 
+# 7 pevných sémantických barev - spočítané jednou při importu
+_SEMANTIC_COLORS = frozenset([
+    hsl_to_hex(210, 80, 50),  # main/master - azurová modrá
+    hsl_to_hex(150, 80, 50),  # develop - světle zelená
+    hsl_to_hex(240, 80, 50),  # staging - modrá
+    hsl_to_hex(90, 80, 50),   # feature - žluto-zelená
+    hsl_to_hex(330, 80, 50),  # hotfix - růžová
+    hsl_to_hex(0, 80, 50),    # bugfix - červená
+    hsl_to_hex(270, 80, 50),  # release - fialová
+])
+
+
 def _is_semantic_color(color: str) -> bool:
     """Zkontroluje zda je barva sémantická (jedna ze 7 pevných sémantických barev)."""
-    semantic_colors = [
-        hsl_to_hex(210, 80, 50),  # main/master - azurová modrá
-        hsl_to_hex(150, 80, 50),  # develop - světle zelená
-        hsl_to_hex(240, 80, 50),  # staging - modrá
-        hsl_to_hex(90, 80, 50),   # feature - žluto-zelená
-        hsl_to_hex(330, 80, 50),  # hotfix - růžová
-        hsl_to_hex(0, 80, 50),    # bugfix - červená
-        hsl_to_hex(270, 80, 50),  # release - fialová
-    ]
-    return color in semantic_colors
+    return color in _SEMANTIC_COLORS
 
 
 def normalize_branch_name(branch_name: str) -> str:
@@ -135,9 +138,13 @@ def normalize_branch_name(branch_name: str) -> str:
     return branch_name
 
 
+@lru_cache(maxsize=1024)
 def make_color_pale(color: str, blend_type: str = "remote") -> str:
     """Creates paler version of color using HSL manipulation.
 
+    Results are cached - the drawers call this for every remote commit
+    on each redraw, but there are only a few distinct branch colors.
+
     Args:
         color: Color to make pale (hex format like '#FF0000' or named color)
         blend_type: Type of blending - "remote" for mild fading, "merge" for strong fading
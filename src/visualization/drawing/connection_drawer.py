@@ -21,6 +21,12 @@ class ConnectionDrawer:
         self.node_radius = NODE_RADIUS
         self.curve_intensity = 0.8  # Intensity of curve rounding (0-1)
 
+        # Straight vertical segments collected during draw_connections, keyed by
+        # (x, fill, stipple) -> list of (y_top, y_bottom); None = draw immediately
+        self._pending_segments = None
+        # Curves collected during draw_connections, drawn after the straight segments
+        self._pending_curves = None
+
     def draw_connections(self, commits: List[Commit], make_color_pale_callback) -> None:
         """Draws all connections between commits.
 
@@ -31,6 +37,19 @@ class ConnectionDrawer:
         commit_positions = {commit.hash: (commit.x, commit.y) for commit in commits}
         commit_info = {commit.hash: commit for commit in commits}
 
+        # Collect straight segments and emit them merged at the end; curves are
+        # deferred too so they still stack above the straight lane lines
+        self._pending_segments = {}
+        self._pending_curves = []
+        try:
+            self._draw_all_connections(commits, commit_positions, commit_info, make_color_pale_callback)
+        finally:
+            self._flush_vertical_segments()
+            self._flush_curves()
+
+    def _draw_all_connections(self, commits: List[Commit], commit_positions: Dict,
+                              commit_info: Dict, make_color_pale_callback) -> None:
+        """Draws connections for every parent-child pair."""
         for commit in commits:
             if commit.parents:
                 child_pos = commit_positions.get(commit.hash)
@@ -66,9 +85,12 @@ class ConnectionDrawer:
     def _draw_line(self, start: Tuple[int, int], end: Tuple[int, int], color: str,
                    is_remote: bool = False, is_uncommitted: bool = False,
                    is_merge_connection: bool = False, is_branching: bool = False,
-                   make_color_pale_callback=None) -> int:
+                   make_color_pale_callback=None) -> None:
         """Draws a straight or curved line between two points.
 
+        Inside draw_connections the line is only collected; it is drawn when
+        the pending segments and curves are flushed.
+
         Args:
             start: Starting position (x, y)
             end: Ending position (x, y)
@@ -78,9 +100,6 @@ class ConnectionDrawer:
             is_merge_connection: Whether this is a merge connection
             is_branching: Whether this is a branching connection
             make_color_pale_callback: Function to make color pale
-
-        Returns:
-            Canvas item ID
         """
         start_x, start_y = start
         end_x, end_y = end
@@ -101,10 +120,21 @@ class ConnectionDrawer:
 
         # If commits are in different columns (branching), draw smooth curve
         if start_x != end_x:
-            self._draw_bezier_curve(start_x, start_y, end_x, end_y, line_color,
-                                   stipple_pattern, is_merge_connection, is_branching)
+            curve_args = (start_x, start_y, end_x, end_y, line_color,
+                          stipple_pattern, is_merge_connection, is_branching)
+            if self._pending_curves is not None:
+                self._pending_curves.append(curve_args)
+            else:
+                self._draw_bezier_curve(*curve_args)
         else:
             # Straight vertical line for commits in same column
+            if self._pending_segments is not None:
+                key = (start_x, line_color, stipple_pattern)
+                self._pending_segments.setdefault(key, []).append(
+                    (min(start_y, end_y), max(start_y, end_y))
+                )
+                return
+
             line_kwargs = {
                 'fill': line_color,
                 'width': self.line_width
@@ -112,7 +142,46 @@ class ConnectionDrawer:
             if stipple_pattern:
                 line_kwargs['stipple'] = stipple_pattern
 
-            return self.canvas.create_line(start_x, start_y, end_x, end_y, **line_kwargs)
+            self.canvas.create_line(start_x, start_y, end_x, end_y, **line_kwargs)
+
+    def _flush_vertical_segments(self) -> None:
+        """Draws collected vertical segments, merging touching ones in the same lane.
+
+        Chained commits in one lane produce segments that share endpoints, so
+        each run of touching segments with the same style becomes one canvas item.
+        """
+        segments = self._pending_segments
+        self._pending_segments = None
+        if not segments:
+            return
+
+        for (x, fill, stipple), spans in segments.items():
+            line_kwargs = {
+                'fill': fill,
+                'width': self.line_width
+            }
+            if stipple:
+                line_kwargs['stipple'] = stipple
+
+            spans.sort()
+            run_start, run_end = spans[0]
+            for y_top, y_bottom in spans[1:]:
+                if y_top <= run_end:
+                    run_end = max(run_end, y_bottom)
+                else:
+                    self.canvas.create_line(x, run_start, x, run_end, **line_kwargs)
+                    run_start, run_end = y_top, y_bottom
+            self.canvas.create_line(x, run_start, x, run_end, **line_kwargs)
+
+    def _flush_curves(self) -> None:
+        """Draws collected curves in their original order, above the straight segments."""
+        curves = self._pending_curves
+        self._pending_curves = None
+        if not curves:
+            return
+
+        for curve_args in curves:
+            self._draw_bezier_curve(*curve_args)
 
     def _draw_bezier_curve(self, start_x: int, start_y: int, end_x: int, end_y: int,
                            color: str, stipple_pattern=None, is_merge_connection: bool = False,
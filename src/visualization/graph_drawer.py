@@ -1,7 +1,7 @@
 """GraphDrawer - orchestrator for graph rendering components."""
 
 import tkinter as tk
-from typing import List, Dict
+from typing import List, Dict, Optional, Tuple
 from utils.data_structures import Commit
 from utils.logging_config import get_logger
 from utils.theme_manager import get_theme_manager
@@ -60,6 +60,9 @@ class GraphDrawer:
         self.flag_width = None
         self.required_tag_space = None
 
+        # Commits of last draw_graph call (kept for redraws)
+        self._current_commits = None
+
     def reset(self):
         """Resets GraphDrawer state for new repository."""
         # Reset column widths - user-set and calculated
@@ -82,7 +85,7 @@ class GraphDrawer:
         if self.tooltip_manager:
             self.tooltip_manager.hide_tooltip()
 
-    def draw_graph(self, canvas: tk.Canvas, commits: List[Commit]):
+    def draw_graph(self, canvas: tk.Canvas, commits: List[Commit]) -> Optional[Tuple[int, int, int, int]]:
         """Main entry point - orchestrates entire graph rendering.
 
         Delegates to individual components in this order:
@@ -95,9 +98,13 @@ class GraphDrawer:
         Args:
             canvas: Canvas to draw on
             commits: List of commits to draw
+
+        Returns:
+            Content extent (min_x, min_y, max_x, max_y) without header,
+            or None if there is nothing to draw
         """
         if not commits:
-            return
+            return None
 
         # Save commits for potential redraw
         self._current_commits = commits
@@ -151,6 +158,34 @@ class GraphDrawer:
 
         self.column_manager.setup_column_separators(self.column_widths, table_start_x)
 
+        return self.get_content_extent()
+
+    def get_content_extent(self) -> Optional[Tuple[int, int, int, int]]:
+        """Returns extent of drawn content computed from layout (without header).
+
+        Avoids walking canvas items with bbox() - the extent follows from
+        commit positions and column widths.
+
+        Returns:
+            Tuple (min_x, min_y, max_x, max_y) or None if no commits are drawn
+        """
+        commits = self._current_commits
+        if not commits:
+            return None
+
+        min_y = max_y = commits[0].y
+        for commit in commits:
+            if commit.y < min_y:
+                min_y = commit.y
+            elif commit.y > max_y:
+                max_y = commit.y
+
+        # Table columns follow graph column - right edge is end of last column
+        max_x = self._get_table_start_position() + sum(self.column_widths.values())
+
+        # Leftmost items are branch flags at BASE_MARGIN, rows are centered on commit.y
+        return (self.BASE_MARGIN, min_y - self.node_radius, max_x, max_y + self.node_radius)
+
     def _initialize_components(self, canvas: tk.Canvas):
         """Initializes all drawing and UI components.
 
@@ -256,7 +291,7 @@ class GraphDrawer:
 
         # Find rightmost commit (most right drawn branch)
         max_commit_x = 0
-        if hasattr(self, '_current_commits') and self._current_commits:
+        if self._current_commits:
             max_commit_x = max((commit.x for commit in self._current_commits), default=0)
 
         # Width according to rightmost branch: position + space for one branch + space for tags
@@ -341,7 +376,7 @@ class GraphDrawer:
         canvas.delete("column_header")
 
         # Find commits from canvas (if stored there as data)
-        if hasattr(self, '_current_commits') and self._current_commits:
+        if self._current_commits:
             # Recalculate description texts according to new message column width
             self.text_formatter.recalculate_descriptions_for_width(
                 canvas, self._current_commits, self.column_widths
@@ -384,6 +419,26 @@ class GraphDrawer:
         if self.column_manager:
             self.column_manager.move_separators_to_scroll_position(new_y)
 
+    def redraw_column_headers(self, canvas: tk.Canvas):
+        """Redraws only column separators and header (e.g. after language change).
+
+        Args:
+            canvas: Canvas (not used, kept for API consistency)
+        """
+        if self.column_manager and self._current_commits:
+            table_start_x = self._get_table_start_position()
+            self.column_manager.setup_column_separators(self.column_widths, table_start_x)
+
+    def shift_column_separators(self, canvas: tk.Canvas, dy: float):
+        """Shifts separators by a relative vertical offset.
+
+        Args:
+            canvas: Canvas (not used, kept for API consistency)
+            dy: Vertical offset in canvas pixels
+        """
+        if self.column_manager:
+            self.column_manager.shift_separators(dy)
+
     def _draw_column_separators(self, canvas: tk.Canvas):
         """Legacy wrapper for backward compatibility with graph_canvas.py.
 
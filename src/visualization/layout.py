@@ -1,3 +1,4 @@
+from operator import attrgetter
 from typing import List, Dict, Set
 from utils.data_structures import Commit, MergeBranch
 from utils.constants import BRANCH_LANE_SPACING, COMMIT_START_X, COMMIT_VERTICAL_SPACING, COMMIT_START_Y
@@ -19,7 +20,7 @@ class GraphLayout:
             return []
 
         # Seřadit podle času globálně - toto určuje Y pozice
-        all_commits = sorted(self.commits, key=lambda c: c.date, reverse=True)
+        all_commits = sorted(self.commits, key=attrgetter('date'), reverse=True)
 
         # Přiřadit lanes větvím s recyklací
         self._assign_lanes_with_recycling(all_commits)
@@ -186,21 +187,18 @@ class GraphLayout:
     def get_branch_lane(self, branch_name: str) -> int:
         return self.branch_lanes.get(branch_name, 0)
 
-    def _assign_lanes_with_recycling(self, commits: List[Commit]):
-        """Přiřadí lanes větvím s recyklací - uvolňuje lanes po skončení větví."""
+    def _assign_lanes_with_recycling(self, commit_timeline: List[Commit]):
+        """Přiřadí lanes větvím s recyklací - uvolňuje lanes po skončení větví.
+
+        Očekává commity již seřazené od nejnovějšího (časová osa z calculate_positions).
+        """
         # Analyzovat parent-child vztahy
-        branch_relationships = self._analyze_branch_relationships(commits)
+        branch_relationships = self._analyze_branch_relationships(commit_timeline)
         self._add_merge_branches_to_relationships(branch_relationships)
 
-        # Vytvořit časovou osu commitů pro sledování, kdy větve končí
-        commit_timeline = sorted(commits, key=lambda c: c.date, reverse=True)
-
         # Mapa: větev -> index posledního (nejstaršího) commitu této větve
-        branch_last_commit_index = {}
-        for i, commit in enumerate(commit_timeline):
-            branch = commit.branch
-            # Vždy aktualizovat na vyšší index (starší commit)
-            branch_last_commit_index[branch] = max(branch_last_commit_index.get(branch, -1), i)
+        # Indexy rostou, takže poslední zápis je vždy ten nejstarší
+        branch_last_commit_index = {commit.branch: i for i, commit in enumerate(commit_timeline)}
 
         # Sledování aktivních lanes v průběhu času
         active_lanes = {}  # lane_number -> branch_name
@@ -246,13 +244,9 @@ class GraphLayout:
                     if parent_branch in self.branch_lanes:
                         min_lane = max(min_lane, self.branch_lanes[parent_branch] + 1)
 
-                # Najít první volnou lane >= min_lane
-                assigned_lane = None
-
-                # Zkusit použít recyklovanou lane
-                available_free = sorted([l for l in free_lanes if l >= min_lane])
-                if available_free:
-                    assigned_lane = available_free[0]
+                # Zkusit použít recyklovanou lane - první volnou lane >= min_lane
+                assigned_lane = min((l for l in free_lanes if l >= min_lane), default=None)
+                if assigned_lane is not None:
                     free_lanes.remove(assigned_lane)
                 else:
                     # Žádná volná lane, použít novou
@@ -1,7 +1,7 @@
 """ColumnManager - handles column separators, resizing, and drag & drop events."""
 
 import tkinter as tk
-from typing import Dict, Callable, List
+from typing import Dict, Callable, List, Optional, Tuple
 from utils.constants import SEPARATOR_HEIGHT, HEADER_HEIGHT, BASE_MARGIN
 from utils.theme_manager import get_theme_manager
 from utils.logging_config import get_logger
@@ -10,6 +10,23 @@ from utils.translations import t
 logger = get_logger(__name__)
 
 
+def _parse_scrollregion(value: str) -> Optional[Tuple[float, float, float, float]]:
+    """Parses Tk scrollregion string "x1 y1 x2 y2" without building lists.
+
+    Args:
+        value: Value of canvas 'scrollregion' option
+
+    Returns:
+        Tuple (x1, y1, x2, y2) or None if scrollregion is not set
+    """
+    x1, _, rest = value.partition(' ')
+    y1, _, rest = rest.partition(' ')
+    x2, _, y2 = rest.partition(' ')
+    if not y2:
+        return None
+    return float(x1), float(y1), float(x2), float(y2)
+
+
 class ColumnManager:
     """Manages columns - resizing, separators, drag & drop events."""
 
@@ -27,6 +44,7 @@ class ColumnManager:
         self.HEADER_HEIGHT = HEADER_HEIGHT
         self.BASE_MARGIN = BASE_MARGIN
         self.separator_height = SEPARATOR_HEIGHT
+        self._header_y = None  # Current Y of drawn header (None = not drawn)
 
     def setup_column_separators(self, column_widths: Dict, table_start_position: int):
         """Creates separators between columns.
@@ -53,12 +71,33 @@ class ColumnManager:
         self.canvas.bind('<B1-Motion>', self._on_separator_drag)
         self.canvas.bind('<ButtonRelease-1>', self._on_separator_release)
 
+    def shift_separators(self, dy: float):
+        """Shifts separators and header vertically by a relative offset.
+
+        Cheap alternative to move_separators_to_scroll_position() for
+        intermediate scroll steps - two tag moves instead of per-item updates.
+
+        Args:
+            dy: Vertical offset in canvas pixels
+        """
+        self.canvas.move("column_separator", 0, dy)
+        self.canvas.move("column_header", 0, dy)
+        if self._header_y is not None:
+            self._header_y += dy
+
     def move_separators_to_scroll_position(self, new_y: float):
         """Moves existing separators to new Y position when scrolling.
 
         Args:
             new_y: New Y position
         """
+        # Header drawn by this manager keeps its layout - only translate it
+        if self._header_y is not None:
+            dy = new_y - self._header_y
+            if dy:
+                self.shift_separators(dy)
+            return
+
         # Find all objects with separators
         separator_items = self.canvas.find_withtag("column_separator")
         header_items = self.canvas.find_withtag("column_header")
@@ -141,6 +180,7 @@ class ColumnManager:
         # canvasy(0) converts window coordinate 0 to canvas coordinate
         scroll_top = self.canvas.canvasy(0)
         separator_y = scroll_top  # header always at top of visible area
+        self._header_y = separator_y
 
         # Always delete old separators and labels and redraw
         self.canvas.delete("column_separator")
@@ -323,9 +363,9 @@ class ColumnManager:
         if viewport_width > 1:  # winfo_width returns 1 if not yet initialized
             # Get scroll position and calculate right edge of visible viewport
             scroll_x_left, scroll_x_right = self.canvas.xview()
-            scrollregion = self.canvas.cget('scrollregion').split()
-            if scrollregion and len(scrollregion) == 4:
-                total_width = float(scrollregion[2])
+            scrollregion = _parse_scrollregion(self.canvas.cget('scrollregion'))
+            if scrollregion:
+                total_width = scrollregion[2]
                 right_edge = scroll_x_left * total_width + viewport_width
             else:
                 right_edge = current_x + viewport_width
@@ -67,9 +67,10 @@ class TextFormatter:
         if not description:
             return ""
 
-        # Take only first line
-        first_line = description.split('\n')[0].strip()
-        has_more_lines = '\n' in description
+        # Take only first line (partition does not split the rest of the body)
+        first_line, newline, _ = description.partition('\n')
+        first_line = first_line.strip()
+        has_more_lines = bool(newline)
 
         # Determine if we need ellipsis
         needs_ellipsis = False
@@ -167,6 +167,24 @@ class MockRefsDict:
         return len(self._refs)
 
 
+@pytest.fixture
+def git_log_output():
+    """Formatter of mock GitPython commits as the `git log -z` output read by CommitParser."""
+    def format_commits(commits):
+        records = []
+        for commit in commits:
+            records.append("\x1f".join([
+                commit.hexsha,
+                " ".join(parent.hexsha for parent in commit.parents),
+                commit.author.name,
+                commit.author.email,
+                commit.committed_datetime.isoformat(),
+                commit.message,
+            ]))
+        return "\0".join(records)
+    return format_commits
+
+
 @pytest.fixture
 def mock_git_repo():
     """Create a mock GitPython Repo object."""
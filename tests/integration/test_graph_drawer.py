@@ -21,6 +21,7 @@ class TestGraphDrawerIntegration:
         assert drawer.line_width > 0
         assert drawer.font_size > 0
         assert drawer.column_widths == {}
+        assert drawer._current_commits is None
         # Components should be None initially (lazy init)
         assert drawer.connection_drawer is None
         assert drawer.commit_drawer is None
@@ -88,10 +89,30 @@ class TestGraphDrawerIntegration:
         assert drawer.flag_width is None
         assert drawer.required_tag_space is None
 
+    def test_draw_graph_returns_content_extent(self, drawer, canvas, mock_commits):
+        """Test that draw_graph returns extent of drawn content."""
+        extent = drawer.draw_graph(canvas, mock_commits)
+
+        min_x, min_y, max_x, max_y = extent
+        assert min_y == 50 - drawer.node_radius
+        assert max_y == 50 + 4 * 60 + drawer.node_radius
+        assert max_x == drawer._get_table_start_position() + sum(drawer.column_widths.values())
+        assert min_x < max_x
+
+    def test_redraw_column_headers_keeps_commit_items(self, drawer, canvas, mock_commits):
+        """Test that redrawing headers leaves drawn commits untouched."""
+        drawer.draw_graph(canvas, mock_commits)
+        commit_items = set(canvas.find_withtag("commit_text"))
+
+        drawer.redraw_column_headers(canvas)
+
+        assert set(canvas.find_withtag("commit_text")) == commit_items
+        assert len(canvas.find_withtag("column_header")) > 0
+
     def test_draw_graph_empty_commits(self, drawer, canvas):
         """Test drawing graph with empty commit list."""
         # Should not crash
-        drawer.draw_graph(canvas, [])
+        assert drawer.draw_graph(canvas, []) is None
 
         # Should not initialize components for empty list
         assert drawer.connection_drawer is None
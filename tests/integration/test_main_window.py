@@ -34,6 +34,30 @@ class TestMainWindowInitialization:
         # Cleanup
         window.root.destroy()
 
+    @patch('gui.main_window.GraphCanvas')
+    @patch('gui.main_window.get_translation_manager')
+    @patch('gui.main_window.get_theme_manager')
+    @patch('gui.main_window.RepositoryManager')
+    def test_graph_canvas_created_lazily(self, mock_repo_manager, mock_theme_mgr, mock_trans_mgr, mock_graph_canvas, root):
+        """Test that GraphCanvas is not built until a graph is shown."""
+        from gui.main_window import MainWindow
+
+        mock_trans_mgr.return_value = MagicMock()
+        mock_theme_mgr.return_value = MagicMock()
+        mock_theme_mgr.return_value.get_color = MagicMock(return_value='#FFFFFF')
+
+        window = MainWindow()
+
+        assert window.graph_canvas is None
+        mock_graph_canvas.assert_not_called()
+
+        canvas = window._ensure_graph_canvas()
+        assert window._ensure_graph_canvas() is canvas
+        mock_graph_canvas.assert_called_once()
+
+        # Cleanup
+        window.root.destroy()
+
     @patch('gui.main_window.get_translation_manager')
     @patch('gui.main_window.get_theme_manager')
     @patch('gui.main_window.RepositoryManager')
@@ -398,3 +422,63 @@ class TestRepositoryDisplay:
 
         # Cleanup
         window.root.destroy()
+
+
+class TestContentResize:
+    """Tests for fitting the window to loaded content."""
+
+    @patch('gui.main_window.get_translation_manager')
+    @patch('gui.main_window.get_theme_manager')
+    @patch('gui.main_window.RepositoryManager')
+    def test_resize_skipped_when_size_matches(self, mock_repo, mock_theme_mgr, mock_trans_mgr, root):
+        """Test that no geometry change is scheduled when the window already fits."""
+        from gui.main_window import MainWindow
+
+        mock_trans_mgr.return_value = MagicMock()
+        mock_theme_mgr.return_value = MagicMock()
+        mock_theme_mgr.return_value.get_color = MagicMock(return_value='#FFFFFF')
+
+        window = MainWindow()
+        window._get_window_size_for_content = MagicMock(return_value=(800, 600))
+        window.root.winfo_width = MagicMock(return_value=803)
+        window.root.winfo_height = MagicMock(return_value=598)
+        window._center_window = MagicMock()
+
+        with patch.object(window.root, 'after') as mock_after:
+            window._resize_window_for_content([MagicMock()])
+            mock_after.assert_not_called()
+
+        # Cleanup
+        window.root.destroy()
+
+class TestCustomProgressBar:
+    """Tests for CustomProgressBar animation scheduling."""
+
+    def test_start_delays_animation(self, root):
+        """Test that start() only schedules the animation."""
+        from gui.main_window import CustomProgressBar
+
+        bar = CustomProgressBar(root)
+        bar.start()
+
+        assert bar.is_running is False
+        assert bar._start_id is not None
+
+        bar._begin_animation()
+        assert bar.is_running is True
+        assert bar.animation_id is not None
+
+        bar.stop()
+        assert bar.animation_id is None
+
+    def test_stop_before_delay_cancels_animation(self, root):
+        """Test that a fast load never starts the animation loop."""
+        from gui.main_window import CustomProgressBar
+
+        bar = CustomProgressBar(root)
+        bar.start()
+        bar.stop()
+
+        assert bar._start_id is None
+        assert bar.is_running is False
+        assert bar.animation_id is None
@@ -3,6 +3,8 @@
 import pytest
 import tempfile
 import shutil
+import subprocess
+import sys
 from pathlib import Path
 from unittest.mock import Mock, patch, MagicMock
 from repo.repository import GitRepository
@@ -58,6 +60,9 @@ class TestGitRepositoryIntegration:
 
         assert result is True
         assert repo.repo is not None
+        mock_repo_class.assert_called_once_with(
+            temp_git_repo, search_parent_directories=False, expand_vars=False
+        )
 
     def test_load_repository_invalid_path(self):
         """Test loading repository with invalid path."""
@@ -127,6 +132,58 @@ class TestGitRepositoryIntegration:
         # Should return list (may be empty or with merges)
         assert isinstance(merge_branches, list)
 
+    @pytest.mark.skipif(sys.platform == 'win32', reason="fake gpg program is a shell script")
+    def test_signed_commit_gets_branch_with_show_signature(self, temp_git_repo, tmp_path):
+        """Test that log.showSignature=true does not break branch assignment of signed commits."""
+        from repo.commit_cache import CommitCache
+
+        # Fake gpg: prints the usual verification text, no keyring needed
+        fake_gpg = tmp_path / "fake-gpg"
+        fake_gpg.write_text(
+            "#!/bin/sh\n"
+            "echo 'gpg: Signature made Wed Jan  1 00:00:00 2025 UTC' >&2\n"
+            "echo 'gpg: Good signature from \"Test User <test@example.com>\"' >&2\n"
+            "echo '[GNUPG:] GOODSIG 0000000000000000 Test User <test@example.com>'\n"
+        )
+        fake_gpg.chmod(0o755)
+
+        def git(*args, stdin=None):
+            return subprocess.run(['git', *args], cwd=temp_git_repo, input=stdin, text=True,
+                                  capture_output=True, check=True).stdout.strip()
+
+        git('init', '-q', '-b', 'main')
+        git('config', 'user.name', 'Test User')
+        git('config', 'user.email', 'test@example.com')
+        git('config', 'log.showSignature', 'true')
+        git('config', 'gpg.program', str(fake_gpg))
+        git('commit', '-q', '--allow-empty', '-m', 'Base')
+
+        # Signed commit written directly, so no real key is needed
+        signed_hash = git('hash-object', '-t', 'commit', '-w', '--stdin', stdin=(
+            f"tree {git('rev-parse', 'HEAD^{tree}')}\n"
+            f"parent {git('rev-parse', 'HEAD')}\n"
+            "author Test User <test@example.com> 1735689600 +0000\n"
+            "committer Test User <test@example.com> 1735689600 +0000\n"
+            "gpgsig -----BEGIN PGP SIGNATURE-----\n"
+            " \n"
+            " iQEzBAABCAAdFiEE\n"
+            " -----END PGP SIGNATURE-----\n"
+            "\n"
+            "Signed commit\n"
+        ))
+        git('update-ref', 'refs/heads/main', signed_hash)
+        git('commit', '-q', '--allow-empty', '-m', 'Child')
+
+        with patch('repo.repository.CommitCache', lambda: CommitCache(tmp_path / 'cache')):
+            repo = GitRepository(temp_git_repo)
+            assert repo.load_repository()
+            commits = {commit.message: commit for commit in repo.parse_commits()}
+
+        signed = commits['Signed commit']
+        assert signed.hash == signed_hash[:8]
+        assert signed.branch == 'main'
+        assert commits['Child'].parents == (signed.hash,)
+
 
 class TestGitRepositoryFacade:
     """Tests for GitRepository facade pattern (Phase 2 refactoring)."""
@@ -200,6 +257,11 @@ class TestGitRepositoryFacade:
         mock_tag_parser.build_commit_tag_map.assert_called_once()
         mock_branch_analyzer.build_branch_availability_map.assert_called_once()
         mock_commit_parser.parse_commits.assert_called_once()
+
+        # History is read once and shared by branch mapping and parsing
+        mock_commit_parser.read_commits.assert_called_once_with()
+        raw_commits = mock_commit_parser.read_commits.return_value
+        assert mock_commit_parser.parse_commits.call_args.kwargs['raw_commits'] is raw_commits
         mock_merge_detector_class.assert_called_once()
         mock_merge_detector.detect_merge_branches.assert_called_once()
 
@@ -248,6 +310,48 @@ class TestGitRepositoryFacade:
         mock_branch_analyzer.get_all_branch_names.assert_called_once()
         mock_commit_parser.parse_commits_with_remote.assert_called_once()
 
+    @patch('repo.repository.Repo')
+    @patch('repo.repository.CommitParser')
+    @patch('repo.repository.BranchAnalyzer')
+    @patch('repo.repository.TagParser')
+    @patch('repo.repository.MergeDetector')
+    def test_parse_commits_uses_cache_for_unchanged_refs(self, mock_merge_detector_class,
+                                                         mock_tag_parser_class, mock_branch_analyzer_class,
+                                                         mock_commit_parser_class, mock_repo_class,
+                                                         temp_git_repo, tmp_path):
+        """Test that second parse of unchanged repository skips the parsers."""
+        from datetime import datetime, timezone
+        from repo.commit_cache import CommitCache
+
+        mock_repo = MagicMock()
+        mock_repo_class.return_value = mock_repo
+        mock_repo.git.status.return_value = ""
+        mock_repo.git.show_ref.return_value = "abc123 HEAD\nabc123 refs/heads/main"
+
+        commit = Commit(
+            hash="abc12345", message="Test", short_message="Test", author="Test User",
+            author_short="Test User", author_email="test@example.com",
+            date=datetime(2025, 1, 1, tzinfo=timezone.utc), date_relative="old",
+            date_short="01.01.2025 @ 00:00", parents=[], branch="main", branch_color="#FF0000"
+        )
+        mock_commit_parser = mock_commit_parser_class.return_value
+        mock_commit_parser.parse_commits.return_value = [commit]
+        mock_commit_parser.get_relative_date.return_value = "fresh"
+        mock_merge_detector_class.return_value.detect_merge_branches.return_value = []
+
+        with patch('repo.repository.CommitCache', lambda: CommitCache(tmp_path / 'cache')):
+            first = GitRepository(temp_git_repo)
+            first.load_repository()
+            first.parse_commits()
+
+            second = GitRepository(temp_git_repo)
+            second.load_repository()
+            commits = second.parse_commits()
+
+        mock_commit_parser.parse_commits.assert_called_once()
+        assert [c.hash for c in commits] == ["abc12345"]
+        assert commits[0].date_relative == "fresh"
+
     @patch('repo.repository.Repo')
     def test_components_are_none_before_load(self, mock_repo_class, temp_git_repo):
         """Test that component instances are None before loading."""
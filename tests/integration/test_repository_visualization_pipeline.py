@@ -23,7 +23,7 @@ class TestRepositoryVisualizationPipeline:
     """Integration tests for full data pipeline from repository to visualization."""
 
     @pytest.fixture
-    def mock_git_repo(self):
+    def mock_git_repo(self, git_log_output):
         """Mock GitPython repository with realistic commit structure."""
         mock_repo = MagicMock()
 
@@ -76,7 +76,7 @@ class TestRepositoryVisualizationPipeline:
         mock_commit3.parents = [mock_parent2]
         commits.append(mock_commit3)
 
-        mock_repo.iter_commits.return_value = commits
+        mock_repo.git.log.return_value = git_log_output(commits)
         mock_repo.tags = []
         mock_repo.git.status.return_value = ""  # No uncommitted changes
 
@@ -220,7 +220,7 @@ class TestRepositoryVisualizationPipeline:
         mock_repo = MagicMock()
         mock_repo.refs = []
         mock_repo.heads = []
-        mock_repo.iter_commits.return_value = []
+        mock_repo.git.log.return_value = ""
         mock_repo.tags = []
         mock_repo.git.status.return_value = ""
 
@@ -22,64 +22,98 @@ class TestBranchAnalyzerInitialization:
         assert analyzer.repo == mock_git_repo
 
 
+def rev_list_output(parent_map):
+    """Format {commit: [parents]} as `git rev-list --parents` output."""
+    return "\n".join(" ".join([commit] + parents) for commit, parents in parent_map.items())
+
+
+A, B, C, D, E = (ch * 40 for ch in "abcde")
+
+
 class TestBuildCommitBranchMap:
     """Tests for building commit-to-branch mappings."""
 
-    def test_build_basic_map(self, mock_git_repo, mock_git_commits):
+    def test_build_basic_map(self, mock_git_repo):
         """Test building commit-branch map for local branches."""
-        # Setup mock to return commits for main branch
-        mock_git_repo.iter_commits.return_value = mock_git_commits[:3]
+        # main (A) and feature/test (B) both descend from D
+        mock_git_repo.git.rev_list.return_value = rev_list_output({A: [D], B: [D], D: []})
 
         analyzer = BranchAnalyzer(mock_git_repo)
         commit_map = analyzer.build_commit_branch_map()
 
-        # Should map all commits to their branches
-        assert len(commit_map) > 0
-        for commit in mock_git_commits[:3]:
-            assert commit.hexsha in commit_map
+        assert commit_map == {A: "main", D: "main", B: "feature/test"}
 
-    def test_main_branch_priority(self, mock_git_repo, mock_git_commits):
+    def test_main_branch_priority(self, mock_git_repo):
         """Test that main/master branches have priority."""
-        # Setup two branches - main and feature
-        def iter_commits_side_effect(branch):
-            if branch.name == "main":
-                return [mock_git_commits[0]]
-            elif branch.name == "feature/test":
-                return [mock_git_commits[0]]  # Same commit in both branches
-            return []
+        main_head = mock_git_repo.heads["main"]
+        feature_head = mock_git_repo.heads["feature/test"]
+        # Feature listed first, shared ancestor must still go to main
+        mock_git_repo.heads = MockHeadsDict([feature_head, main_head])
+        mock_git_repo.git.rev_list.return_value = rev_list_output({A: [D], B: [D], D: []})
+
+        analyzer = BranchAnalyzer(mock_git_repo)
+        commit_map = analyzer.build_commit_branch_map()
+
+        assert commit_map[D] == "main"
+        assert commit_map[B] == "feature/test"
 
-        mock_git_repo.iter_commits.side_effect = iter_commits_side_effect
+    def test_main_and_master_shared_history(self, mock_git_repo):
+        """Test that with both main and master the later listed one takes shared history."""
+        main_head = mock_git_repo.heads["main"]
+        master_head = MagicMock()
+        master_head.name = "master"
+        master_head.commit.hexsha = C
+        mock_git_repo.heads = MockHeadsDict([main_head, master_head])
+        mock_git_repo.git.rev_list.return_value = rev_list_output({A: [D], C: [D], D: []})
 
         analyzer = BranchAnalyzer(mock_git_repo)
         commit_map = analyzer.build_commit_branch_map()
 
-        # The commit should be mapped to "main" (higher priority)
-        assert commit_map[mock_git_commits[0].hexsha] == "main"
+        assert commit_map == {A: "main", C: "master", D: "master"}
 
-    def test_other_branches(self, mock_git_repo, mock_git_commits):
-        """Test mapping non-main branches."""
-        # Setup feature branch only
-        feature_head = MagicMock()
-        feature_head.name = "feature/test"
+        mock_git_repo.heads = MockHeadsDict([master_head, main_head])
+        commit_map = analyzer.build_commit_branch_map()
 
+        assert commit_map == {A: "main", C: "master", D: "main"}
+
+    def test_other_branches(self, mock_git_repo):
+        """Test mapping non-main branches."""
+        feature_head = mock_git_repo.heads["feature/test"]
         mock_git_repo.heads = MockHeadsDict([feature_head])
-        mock_git_repo.iter_commits.return_value = [mock_git_commits[0]]
+        mock_git_repo.git.rev_list.return_value = rev_list_output({B: []})
 
         analyzer = BranchAnalyzer(mock_git_repo)
         commit_map = analyzer.build_commit_branch_map()
 
-        assert commit_map[mock_git_commits[0].hexsha] == "feature/test"
+        assert commit_map == {B: "feature/test"}
+
+    def test_history_loaded_once(self, mock_git_repo):
+        """Test that history is read with a single rev-list call."""
+        mock_git_repo.git.rev_list.return_value = rev_list_output({A: [D], B: [D], D: []})
+
+        analyzer = BranchAnalyzer(mock_git_repo)
+        analyzer.build_commit_branch_map()
+
+        mock_git_repo.git.rev_list.assert_called_once_with('--parents', '--branches')
+        mock_git_repo.iter_commits.assert_not_called()
+
+    def test_given_parent_map_skips_rev_list(self, mock_git_repo):
+        """Test that an already read parent map is used instead of calling git."""
+        analyzer = BranchAnalyzer(mock_git_repo)
+        commit_map = analyzer.build_commit_branch_map({A: [D], B: [D], D: []})
+
+        assert commit_map[A] == "main"
+        assert commit_map[D] == "main"
+        assert commit_map[B] == "feature/test"
+        mock_git_repo.git.rev_list.assert_not_called()
 
 
 class TestBuildCommitBranchMapWithRemote:
     """Tests for building commit-branch maps with remote branches."""
 
-    def test_build_with_remote_maps(self, mock_git_repo, mock_git_commits):
+    def test_build_with_remote_maps(self, mock_git_repo):
         """Test building separate local and remote maps."""
-        # Setup local branches
-        mock_git_repo.iter_commits.side_effect = lambda branch: (
-            [mock_git_commits[0]] if branch.name == "main" else []
-        )
+        mock_git_repo.git.rev_list.return_value = rev_list_output({A: [], B: [A], C: [A]})
 
         analyzer = BranchAnalyzer(mock_git_repo)
         local_map, remote_map = analyzer.build_commit_branch_map_with_remote()
@@ -89,33 +123,24 @@ class TestBuildCommitBranchMapWithRemote:
         assert isinstance(remote_map, dict)
 
         # Local map should have main commit
-        assert mock_git_commits[0].hexsha in local_map
-        assert local_map[mock_git_commits[0].hexsha] == "main"
+        assert local_map[A] == "main"
+        assert local_map[B] == "feature/test"
 
-    def test_remote_only_commits(self, mock_git_repo, mock_git_commits):
+    def test_remote_only_commits(self, mock_git_repo):
         """Test commits that only exist in remote."""
-        # Setup: local has commit 0, remote has commits 1 and 2
-        def iter_commits_side_effect(branch_or_ref):
-            if hasattr(branch_or_ref, 'name'):
-                if branch_or_ref.name == "main":
-                    return [mock_git_commits[0]]
-                elif branch_or_ref.name == "origin/feature/test":
-                    return [mock_git_commits[1], mock_git_commits[2]]
-            return []
-
-        mock_git_repo.iter_commits.side_effect = iter_commits_side_effect
+        # Local has A and B, origin/feature/test adds C and E on top of A
+        mock_git_repo.git.rev_list.return_value = rev_list_output({A: [], B: [A], C: [E], E: [A]})
 
         analyzer = BranchAnalyzer(mock_git_repo)
         local_map, remote_map = analyzer.build_commit_branch_map_with_remote()
 
-        # Commit 0 should be in local only
-        assert mock_git_commits[0].hexsha in local_map
-        assert mock_git_commits[0].hexsha not in remote_map
+        # Commit A should be in local only
+        assert A in local_map
+        assert A not in remote_map
 
-        # Commits 1 and 2 should be in remote only
-        assert mock_git_commits[1].hexsha in remote_map
-        assert mock_git_commits[2].hexsha in remote_map
-        assert mock_git_commits[1].hexsha not in local_map
+        # Commits C and E should be in remote only
+        assert remote_map == {C: "origin/feature/test", E: "origin/feature/test"}
+        assert C not in local_map
 
 
 class TestBuildBranchAvailabilityMap:
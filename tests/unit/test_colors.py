@@ -136,6 +136,12 @@ class TestGetBranchColor:
         # Check it's valid hex
         int(color[1:], 16)
 
+    def test_color_depends_on_used_colors(self):
+        """Same branch name gets a different color when the palette is already taken."""
+        first = get_branch_color("custom-x", set())
+        used = {first}
+        assert get_branch_color("custom-x", used) != first
+
 
 class TestMakeColorPale:
     """Tests for color paling."""
@@ -179,3 +185,11 @@ class TestMakeColorPale:
         result = make_color_pale("#GGGGGG", "remote")
         # Should either return default or handle gracefully
         assert result.startswith("#")
+
+    def test_results_are_cached(self):
+        """Repeated calls for the same color reuse the cached result."""
+        make_color_pale.cache_clear()
+        first = make_color_pale("#123456", "remote")
+        second = make_color_pale("#123456", "remote")
+        assert first == second
+        assert make_color_pale.cache_info().hits == 1
@@ -6,7 +6,7 @@ import tests.setup_tcl  # noqa: F401
 import pytest
 import tkinter as tk
 from unittest.mock import MagicMock, patch, call
-from visualization.ui.column_manager import ColumnManager
+from visualization.ui.column_manager import ColumnManager, _parse_scrollregion
 
 
 @pytest.fixture
@@ -455,6 +455,49 @@ class TestScrolling:
         mock_canvas.tag_raise.assert_any_call("column_separator")
         mock_canvas.tag_raise.assert_any_call("column_header")
 
+    def test_move_separators_translates_drawn_header(self, column_manager, mock_canvas):
+        """Test that a drawn header is translated by tag instead of per-item coords."""
+        column_manager._header_y = 100
+
+        column_manager.move_separators_to_scroll_position(160)
+
+        mock_canvas.move.assert_any_call("column_separator", 0, 60)
+        mock_canvas.move.assert_any_call("column_header", 0, 60)
+        mock_canvas.find_withtag.assert_not_called()
+        mock_canvas.coords.assert_not_called()
+        assert column_manager._header_y == 160
+
+    def test_move_separators_skips_unchanged_position(self, column_manager, mock_canvas):
+        """Test that moving header to its current position does nothing."""
+        column_manager._header_y = 100
+
+        column_manager.move_separators_to_scroll_position(100)
+
+        mock_canvas.move.assert_not_called()
+        mock_canvas.tag_raise.assert_not_called()
+
+    def test_shift_separators_moves_by_tag(self, column_manager, mock_canvas):
+        """Test that shift_separators translates whole tag groups without per-item calls."""
+        column_manager.shift_separators(12.5)
+
+        mock_canvas.move.assert_any_call("column_separator", 0, 12.5)
+        mock_canvas.move.assert_any_call("column_header", 0, 12.5)
+        mock_canvas.coords.assert_not_called()
+        mock_canvas.find_withtag.assert_not_called()
+
+
+class TestParseScrollregion:
+    """Tests for scrollregion parsing helper."""
+
+    def test_parse_scrollregion_returns_floats(self):
+        """Test that all four scrollregion fields are parsed."""
+        assert _parse_scrollregion("0 5 1000 1200.5") == (0.0, 5.0, 1000.0, 1200.5)
+
+    def test_parse_scrollregion_unset(self):
+        """Test that unset or incomplete scrollregion returns None."""
+        assert _parse_scrollregion("") is None
+        assert _parse_scrollregion("0 0 1000") is None
+
 
 # ===== Edge Cases and Error Handling =====
 
@@ -0,0 +1,89 @@
+"""Unit tests for repo.commit_cache module."""
+
+import pytest
+from datetime import datetime, timezone
+from unittest.mock import patch
+
+from repo.commit_cache import CommitCache
+from utils.data_structures import Commit, Tag
+
+
+@pytest.fixture
+def cache(tmp_path):
+    """Create CommitCache in temporary directory."""
+    return CommitCache(tmp_path / 'cache')
+
+
+@pytest.fixture
+def commits():
+    """Create sample commits for caching."""
+    return [
+        Commit(
+            hash=f"abc1234{i}",
+            message=f"Commit {i}",
+            short_message=f"Commit {i}",
+            author="Test User",
+            author_short="Test User",
+            author_email="test@example.com",
+            date=datetime(2025, 1, i + 1, tzinfo=timezone.utc),
+            date_relative="1 den",
+            date_short="01.01.2025 @ 10:00",
+            parents=[],
+            branch="main",
+            branch_color="#FF0000",
+            tags=[Tag(name="v1.0")] if i == 0 else None
+        )
+        for i in range(3)
+    ]
+
+
+class TestCommitCache:
+    """Tests for storing and loading cached commits."""
+
+    def test_load_missing_returns_none(self, cache):
+        """Test cache miss when nothing was stored."""
+        assert cache.load("/repo|local", "key") is None
+
+    def test_save_and_load_roundtrip(self, cache, commits):
+        """Test that stored commits are loaded back unchanged."""
+        assert cache.save("/repo|local", "key", commits) is True
+
+        loaded = cache.load("/repo|local", "key")
+
+        assert loaded == commits
+        assert loaded[0].tags[0].name == "v1.0"
+
+    def test_key_mismatch_returns_none(self, cache, commits):
+        """Test that moved refs invalidate the cache entry."""
+        cache.save("/repo|local", "old-key", commits)
+
+        assert cache.load("/repo|local", "new-key") is None
+
+    def test_entries_are_separate(self, cache, commits):
+        """Test that different repositories/modes don't share entries."""
+        cache.save("/repo|local", "key", commits)
+
+        assert cache.load("/repo|remote", "key") is None
+        assert cache.load("/other|local", "key") is None
+
+    def test_format_version_mismatch_returns_none(self, cache, commits):
+        """Test that cache files from another format version are ignored."""
+        cache.save("/repo|local", "key", commits)
+
+        with patch('repo.commit_cache.CACHE_FORMAT_VERSION', 999):
+            assert cache.load("/repo|local", "key") is None
+
+    def test_corrupted_file_returns_none(self, cache, commits):
+        """Test that unreadable cache file is treated as a miss."""
+        cache.save("/repo|local", "key", commits)
+        cache._cache_file("/repo|local").write_bytes(b"not a pickle")
+
+        assert cache.load("/repo|local", "key") is None
+
+    def test_prune_keeps_limited_number_of_files(self, cache, commits):
+        """Test that old cache files are removed above the limit."""
+        with patch('repo.commit_cache.MAX_CACHE_FILES', 2):
+            for i in range(4):
+                cache.save(f"/repo{i}|local", "key", commits)
+
+        assert len(list(cache.cache_dir.glob('*.pkl'))) == 2
@@ -20,10 +20,10 @@ class TestCommitParserInitialization:
 class TestParseCommits:
     """Tests for parsing commits from local branches."""
 
-    def test_parse_commits_basic(self, mock_git_repo, mock_git_commits):
+    def test_parse_commits_basic(self, mock_git_repo, mock_git_commits, git_log_output):
         """Test basic commit parsing from local branches."""
-        # Setup mock iteration
-        mock_git_repo.iter_commits.return_value = mock_git_commits[:3]
+        # Setup mock git log output
+        mock_git_repo.git.log.return_value = git_log_output(mock_git_commits[:3])
 
         parser = CommitParser(mock_git_repo)
 
@@ -44,9 +44,9 @@ class TestParseCommits:
         assert all(isinstance(c, Commit) for c in commits)
         assert commits[0].branch == "main"
 
-    def test_parse_commits_with_tags(self, mock_git_repo, mock_git_commits):
+    def test_parse_commits_with_tags(self, mock_git_repo, mock_git_commits, git_log_output):
         """Test parsing commits with tags."""
-        mock_git_repo.iter_commits.return_value = mock_git_commits[:2]
+        mock_git_repo.git.log.return_value = git_log_output(mock_git_commits[:2])
 
         parser = CommitParser(mock_git_repo)
 
@@ -68,9 +68,9 @@ class TestParseCommits:
         assert commits[0].tags[0].name == "v1.0.0"
         assert len(commits[1].tags) == 0
 
-    def test_parse_commits_branch_colors(self, mock_git_repo, mock_git_commits):
+    def test_parse_commits_branch_colors(self, mock_git_repo, mock_git_commits, git_log_output):
         """Test branch color assignment."""
-        mock_git_repo.iter_commits.return_value = mock_git_commits[:2]
+        mock_git_repo.git.log.return_value = git_log_output(mock_git_commits[:2])
 
         parser = CommitParser(mock_git_repo)
 
@@ -94,14 +94,108 @@ class TestParseCommits:
         assert branch_colors["main"] in used_colors
         assert branch_colors["feature/test"] in used_colors
 
+    def test_parse_commits_branch_colors_follow_ref_order(self, mock_git_repo, mock_git_commits, git_log_output):
+        """Test that colors are handed out in ref order, not in commit date order."""
+        from visualization.colors import get_branch_color
+        mock_git_repo.git.log.return_value = git_log_output(mock_git_commits[:2])
+        zeta_head = MagicMock()
+        zeta_head.name = "zeta"
+        alpha_head = MagicMock()
+        alpha_head.name = "alpha"
+        mock_git_repo.heads = [zeta_head, alpha_head]
+
+        parser = CommitParser(mock_git_repo)
+
+        # Newest commit belongs to alpha, but zeta comes first among refs
+        commit_to_branch = {
+            mock_git_commits[0].hexsha: "alpha",
+            mock_git_commits[1].hexsha: "zeta"
+        }
+        branch_colors = {}
+        parser.parse_commits(commit_to_branch, {}, {}, branch_colors, set())
+
+        assert branch_colors["zeta"] == get_branch_color("zeta", set())
+        assert branch_colors["alpha"] != branch_colors["zeta"]
+
+    def test_parse_commits_single_git_log_call(self, mock_git_repo, mock_git_commits, git_log_output):
+        """Test that all local branches are read with one git log call."""
+        mock_git_repo.git.log.return_value = git_log_output(mock_git_commits[:3])
+
+        parser = CommitParser(mock_git_repo)
+        parser.parse_commits({}, {}, {}, {}, set())
+
+        mock_git_repo.git.log.assert_called_once()
+        assert mock_git_repo.git.log.call_args[0][0] == '--branches'
+        mock_git_repo.iter_commits.assert_not_called()
+
+    def test_read_commits_ignores_show_signature_config(self, mock_git_repo, mock_git_commits, git_log_output):
+        """Test that log.showSignature=true does not corrupt hashes of signed commits."""
+        gpg_lines = ("gpg: Signature made Fri Jan  2 10:00:00 2025 UTC\n"
+                     "gpg: Good signature from \"Test User <test@example.com>\"\n")
+        signed_log = git_log_output(mock_git_commits[:1]) + "\0" + gpg_lines + git_log_output(mock_git_commits[1:2])
+
+        def git_log(*args):
+            # Mimic git with log.showSignature=true: gpg output unless disabled per call
+            if '--no-show-signature' in args:
+                return git_log_output(mock_git_commits[:2])
+            return signed_log
+
+        mock_git_repo.git.log.side_effect = git_log
+
+        parser = CommitParser(mock_git_repo)
+        raw_commits = parser.read_commits()
+
+        assert [commit.hexsha for commit in raw_commits] == ["a" * 40, "b" * 40]
+        assert raw_commits[1].parents == ["a" * 40]
+
+    def test_parse_commits_shares_repeated_strings(self, mock_git_repo, mock_git_commits, git_log_output):
+        """Test that commits by the same author share string instances."""
+        mock_git_repo.git.log.return_value = git_log_output(mock_git_commits[:3])
+
+        parser = CommitParser(mock_git_repo)
+        commits = parser.parse_commits({}, {}, {}, {}, set())
+
+        assert commits[0].author is commits[1].author is commits[2].author
+        assert commits[0].author_email is commits[2].author_email
+        assert commits[0].author_short is commits[2].author_short
+
+    def test_parse_commits_parents_share_parent_hash(self, mock_git_repo, mock_git_commits, git_log_output):
+        """Test that parents are a tuple of short hashes shared with the parent commit."""
+        mock_git_repo.git.log.return_value = git_log_output(mock_git_commits[:2])
+
+        parser = CommitParser(mock_git_repo)
+        commits = parser.parse_commits({}, {}, {}, {}, set())
+
+        assert commits[0].parents == ()
+        assert commits[1].parents == ("a" * 8,)
+        assert commits[1].parents[0] is commits[0].hash
+
+    def test_parse_log_output_fields(self):
+        """Test parsing of git log records including merge parents and body."""
+        output = "\x1f".join([
+            "a" * 40, "b" * 40 + " " + "c" * 40, "Jane Doe", "jane@example.com",
+            "2025-01-02T10:00:00+01:00", "Merge feature\n\nDetails\x1fkept\n"
+        ])
+
+        raw_commits = CommitParser._parse_log_output(output + "\0")
+
+        assert len(raw_commits) == 1
+        raw = raw_commits[0]
+        assert raw.hexsha == "a" * 40
+        assert raw.parents == ["b" * 40, "c" * 40]
+        assert raw.author_name == "Jane Doe"
+        assert raw.author_email == "jane@example.com"
+        assert raw.committed_datetime.utcoffset().total_seconds() == 3600
+        assert raw.message == "Merge feature\n\nDetails\x1fkept\n"
+
 
 class TestParseCommitsWithRemote:
     """Tests for parsing commits with remote branches."""
 
-    def test_parse_with_remote_maps(self, mock_git_repo, mock_git_commits):
+    def test_parse_with_remote_maps(self, mock_git_repo, mock_git_commits, git_log_output):
         """Test parsing with separate local and remote maps."""
-        # Mock both local and remote branches
-        mock_git_repo.iter_commits.return_value = mock_git_commits[:3]
+        # Mock git log output for local and remote branches
+        mock_git_repo.git.log.return_value = git_log_output(mock_git_commits[:3])
 
         parser = CommitParser(mock_git_repo)
 
@@ -135,9 +229,9 @@ class TestParseCommitsWithRemote:
         assert commits[1].is_remote is True
         assert commits[2].is_remote is True
 
-    def test_parse_with_branch_head_detection(self, mock_git_repo, mock_git_commits):
+    def test_parse_with_branch_head_detection(self, mock_git_repo, mock_git_commits, git_log_output):
         """Test branch head detection (local/remote/both)."""
-        mock_git_repo.iter_commits.return_value = [mock_git_commits[0]]
+        mock_git_repo.git.log.return_value = git_log_output([mock_git_commits[0]])
 
         parser = CommitParser(mock_git_repo)
 
@@ -251,6 +345,26 @@ class TestDateFormatting:
         relative = parser.get_relative_date(two_weeks_ago)
         assert "týdn" in relative
 
+    def test_get_relative_date_with_given_now(self, mock_git_repo):
+        """Test that passed reference time is used instead of the clock."""
+        parser = CommitParser(mock_git_repo)
+
+        now = datetime(2025, 1, 10, 12, 0, 0, tzinfo=timezone.utc)
+        commit_date = datetime(2025, 1, 10, 9, 0, 0, tzinfo=timezone.utc)
+
+        assert parser.get_relative_date(commit_date, now) == "3 hodin"
+
+    def test_get_relative_date_keeps_commit_timezone(self, mock_git_repo):
+        """Test that the commit's own UTC offset is respected."""
+        from datetime import timedelta
+        parser = CommitParser(mock_git_repo)
+
+        now = datetime(2025, 1, 10, 12, 0, 0, tzinfo=timezone.utc)
+        # 12:30 at +02:00 is 10:30 UTC - 90 minutes ago, not in the future
+        commit_date = datetime(2025, 1, 10, 12, 30, 0, tzinfo=timezone(timedelta(hours=2)))
+
+        assert parser.get_relative_date(commit_date, now) == "1 hodina"
+
     def test_get_short_date(self, mock_git_repo):
         """Test short date formatting."""
         parser = CommitParser(mock_git_repo)
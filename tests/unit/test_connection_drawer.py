@@ -211,6 +211,74 @@ class TestDrawConnections:
             assert second_call[0][2] == '#66cc33'  # Parent2's color
 
 
+    def test_draw_connections_merges_chained_vertical_segments(self, connection_drawer, sample_commits, make_color_pale, mock_canvas):
+        """Test that chained straight segments in one lane become one canvas item."""
+        commit3 = Commit(
+            hash='ghi789',
+            message='Third commit',
+            short_message='Third commit',
+            author='Test User',
+            author_short='Test User',
+            author_email='test@example.com',
+            date=datetime(2025, 1, 3, 10, 0, 0),
+            date_relative='3 days ago',
+            date_short='2025-01-03',
+            parents=['def456'],
+            branch='main',
+            branch_color='#3366cc',
+            x=50,
+            y=170,
+            description='',
+            description_short='',
+            tags=[]
+        )
+
+        connection_drawer.draw_connections(sample_commits + [commit3], make_color_pale)
+
+        mock_canvas.create_line.assert_called_once()
+        assert mock_canvas.create_line.call_args[0] == (50, 50, 50, 170)
+
+    def test_draw_connections_batched_segments_keep_style(self, connection_drawer, sample_commits, make_color_pale, mock_canvas):
+        """Test that batched straight segments keep remote (pale) color."""
+        sample_commits[1].is_remote = True
+
+        connection_drawer.draw_connections(sample_commits, make_color_pale)
+        kwargs = mock_canvas.create_line.call_args[1]
+        assert kwargs['fill'] == '#3366cc_pale'
+
+    def test_draw_connections_draws_curves_above_straight_segments(self, connection_drawer, sample_commits, make_color_pale, mock_canvas):
+        """Test that curves are drawn after the batched straight segments."""
+        branch_commit = Commit(
+            hash='fed321',
+            message='Feature commit',
+            short_message='Feature commit',
+            author='Test User',
+            author_short='Test User',
+            author_email='test@example.com',
+            date=datetime(2025, 1, 2, 12, 0, 0),
+            date_relative='2 days ago',
+            date_short='2025-01-02',
+            parents=['abc123'],
+            branch='feature',
+            branch_color='#66cc33',
+            x=80,
+            y=80,
+            description='',
+            description_short='',
+            tags=[]
+        )
+        order = []
+        mock_canvas.create_line.side_effect = lambda *args, **kwargs: order.append('line')
+
+        with patch.object(connection_drawer, '_draw_bezier_curve',
+                          side_effect=lambda *args: order.append('curve')) as mock_curve:
+            connection_drawer.draw_connections([sample_commits[0], branch_commit, sample_commits[1]],
+                                               make_color_pale)
+
+        mock_curve.assert_called_once()
+        assert order == ['line', 'curve']
+
+
 # ===== Line Drawing Tests =====
 
 class TestDrawLine:
@@ -7,12 +7,14 @@ Critical to test URL whitelist validation to prevent malicious repository clonin
 # MUST BE FIRST - initialize TCL/TK before any other imports
 import tests.setup_tcl  # noqa: F401
 
+import os
+import stat
 import pytest
 from unittest.mock import MagicMock, patch, call
 import tkinter as tk
 from tkinter import ttk
 
-from gui.drag_drop import DragDropFrame
+from gui.drag_drop import DragDropFrame, _has_git_entry
 
 
 # Patch bind_drop_events to avoid tkinterdnd2 registration in tests
@@ -24,6 +26,25 @@ def mock_bind_drop_events():
         yield
 
 
+@pytest.fixture(autouse=True)
+def clear_git_entry_cache():
+    """Clear memoized .git checks so tests don't share results."""
+    _has_git_entry.cache_clear()
+    yield
+    _has_git_entry.cache_clear()
+
+
+def fake_stat(dirs=(), files=()):
+    """Create os.stat replacement that knows only given directories and files."""
+    def _stat(path, *args, **kwargs):
+        if path in dirs:
+            return os.stat_result((stat.S_IFDIR | 0o755,) + (0,) * 9)
+        if path in files:
+            return os.stat_result((stat.S_IFREG | 0o644,) + (0,) * 9)
+        raise FileNotFoundError(path)
+    return _stat
+
+
 class TestDragDropFrameInitialization:
     """Test DragDropFrame initialization."""
 
@@ -193,65 +214,96 @@ class TestFolderProcessing:
     """Test folder validation and processing."""
 
     @patch('gui.drag_drop.messagebox.showerror')
-    @patch('os.path.isdir')
-    def test_process_folder_invalid_directory(self, mock_isdir, mock_error, root):
+    def test_process_folder_invalid_directory(self, mock_error, root):
         """Test error shown for non-existent directory."""
-        mock_isdir.return_value = False
         callback = MagicMock()
         frame = DragDropFrame(root, on_drop_callback=callback)
 
-        frame.process_folder("/invalid/path")
+        with patch('gui.drag_drop.os.stat', side_effect=fake_stat()):
+            frame.process_folder("/invalid/path")
 
         # Should show error, not call callback
         mock_error.assert_called_once()
         callback.assert_not_called()
 
     @patch('gui.drag_drop.messagebox.showerror')
-    @patch('os.path.exists')
-    @patch('os.path.isdir')
-    def test_process_folder_not_git_repo(self, mock_isdir, mock_exists, mock_error, root):
+    def test_process_folder_file_is_not_directory(self, mock_error, root):
+        """Test error shown when dropped path is a file."""
+        callback = MagicMock()
+        frame = DragDropFrame(root, on_drop_callback=callback)
+
+        with patch('gui.drag_drop.os.stat', side_effect=fake_stat(files={"/some/file.txt"})):
+            frame.process_folder("/some/file.txt")
+
+        mock_error.assert_called_once()
+        callback.assert_not_called()
+
+    @patch('gui.drag_drop.messagebox.showerror')
+    def test_process_folder_not_git_repo(self, mock_error, root):
         """Test error shown for folder without .git."""
-        mock_isdir.return_value = True
-        mock_exists.return_value = False  # .git doesn't exist
         callback = MagicMock()
         frame = DragDropFrame(root, on_drop_callback=callback)
 
-        frame.process_folder("/valid/path")
+        with patch('gui.drag_drop.os.stat', side_effect=fake_stat(dirs={"/valid/path"})):
+            frame.process_folder("/valid/path")
 
         # Should show error, not call callback
         mock_error.assert_called_once()
         callback.assert_not_called()
 
-    @patch('os.path.exists')
-    @patch('os.path.isdir')
-    def test_process_folder_valid_git_repo(self, mock_isdir, mock_exists, root):
+    def test_process_folder_valid_git_repo(self, root):
         """Test callback called for valid Git repository."""
-        mock_isdir.return_value = True
-        mock_exists.return_value = True  # .git exists
+        repo = "/valid/git/repo"
         callback = MagicMock()
         frame = DragDropFrame(root, on_drop_callback=callback)
 
-        frame.process_folder("/valid/git/repo")
+        with patch('gui.drag_drop.os.stat',
+                   side_effect=fake_stat(dirs={repo, os.path.join(repo, '.git')})):
+            frame.process_folder(repo)
 
         # Should call callback with folder path
-        callback.assert_called_once_with("/valid/git/repo")
+        callback.assert_called_once_with(repo)
+
+    def test_process_folder_accepts_gitfile(self, root):
+        """Test that .git file (worktree/submodule gitfile) is accepted."""
+        repo = "/worktree"
+        callback = MagicMock()
+        frame = DragDropFrame(root, on_drop_callback=callback)
 
-    @patch('os.path.join')
-    @patch('os.path.exists')
-    @patch('os.path.isdir')
-    def test_process_folder_checks_git_subfolder(self, mock_isdir, mock_exists, mock_join, root):
+        with patch('gui.drag_drop.os.stat',
+                   side_effect=fake_stat(dirs={repo}, files={os.path.join(repo, '.git')})):
+            frame.process_folder(repo)
+
+        callback.assert_called_once_with(repo)
+
+    def test_process_folder_checks_git_subfolder(self, root):
         """Test that .git subfolder is checked."""
-        mock_isdir.return_value = True
-        mock_exists.return_value = True
-        mock_join.return_value = "/repo/.git"
+        repo = "/repo"
         callback = MagicMock()
         frame = DragDropFrame(root, on_drop_callback=callback)
 
-        frame.process_folder("/repo")
+        with patch('gui.drag_drop.os.stat',
+                   side_effect=fake_stat(dirs={repo, os.path.join(repo, '.git')})) as mock_stat:
+            frame.process_folder(repo)
+
+        # Should stat folder and its .git subfolder - nothing else
+        assert mock_stat.call_args_list == [call(repo), call(os.path.join(repo, '.git'))]
 
-        # Should check for .git subfolder
-        mock_join.assert_called_once_with("/repo", ".git")
-        mock_exists.assert_called_once_with("/repo/.git")
+    def test_process_folder_memoizes_git_check(self, root):
+        """Test that repeated drop of unchanged folder skips the .git stat."""
+        repo = "/repo"
+        callback = MagicMock()
+        frame = DragDropFrame(root, on_drop_callback=callback)
+
+        with patch('gui.drag_drop.os.stat',
+                   side_effect=fake_stat(dirs={repo, os.path.join(repo, '.git')})) as mock_stat:
+            frame.process_folder(repo)
+            frame.process_folder(repo)
+
+        assert mock_stat.call_args_list == [
+            call(repo), call(os.path.join(repo, '.git')), call(repo)
+        ]
+        assert callback.call_count == 2
 
 
 class TestURLProcessing:
@@ -466,6 +518,57 @@ class TestTheme:
             assert mock_tm.return_value.get_color.called
 
 
+class TestCentering:
+    """Test debounced centering of drop area widgets."""
+
+    def test_center_widgets_debounces_configure_events(self, root):
+        """Test that a burst of Configure events schedules only one redraw."""
+        frame = DragDropFrame(root)
+
+        with patch.object(frame, 'after', side_effect=['job1', 'job2']) as mock_after, \
+                patch.object(frame, 'after_cancel') as mock_cancel:
+            frame._center_widgets()
+            frame._center_widgets()
+
+        assert mock_after.call_count == 2
+        mock_cancel.assert_called_once_with('job1')
+        assert frame._resize_job == 'job2'
+
+    def test_do_center_skips_unchanged_size(self, root):
+        """Test that redraw is skipped when canvas size did not change."""
+        frame = DragDropFrame(root)
+        frame._do_center()
+
+        with patch.object(frame.drop_canvas, 'create_window') as mock_create:
+            frame._do_center()
+            mock_create.assert_not_called()
+
+            frame._do_center(force=True)
+            mock_create.assert_not_called()
+
+    def test_do_center_reuses_canvas_items(self, root):
+        """Test that redraw moves existing items instead of recreating them."""
+        frame = DragDropFrame(root)
+        frame._do_center()
+        rect_id = frame._rect_id
+        items_before = frame.drop_canvas.find_all()
+
+        frame._do_center(force=True)
+
+        assert frame._rect_id == rect_id
+        assert frame.drop_canvas.find_all() == items_before
+
+    def test_do_center_skips_itemconfig_when_colors_unchanged(self, root):
+        """Test that resize only moves the drop area without restyling it."""
+        frame = DragDropFrame(root)
+        frame._do_center()
+
+        with patch.object(frame.drop_canvas, 'itemconfig') as mock_itemconfig:
+            frame._do_center(force=True)
+
+        mock_itemconfig.assert_not_called()
+
+
 class TestLanguage:
     """Test language updates."""
 
@@ -497,21 +600,19 @@ class TestDragDropFrameIntegration:
         frame = DragDropFrame(root, on_drop_callback=callback)
 
         # Valid URL should work
-        with patch('os.path.isdir', return_value=False):  # Not a folder
-            with patch.object(frame, '_is_git_url', return_value=True):
-                frame.process_url("https://github.com/user/repo.git")
+        with patch.object(frame, '_is_git_url', return_value=True):
+            frame.process_url("https://github.com/user/repo.git")
 
         callback.assert_called_once_with("https://github.com/user/repo.git")
 
-    @patch('os.path.exists')
-    @patch('os.path.isdir')
-    def test_full_folder_workflow(self, mock_isdir, mock_exists, root):
+    def test_full_folder_workflow(self, root):
         """Test complete workflow: folder validation → callback."""
-        mock_isdir.return_value = True
-        mock_exists.return_value = True
+        repo = "/valid/git/repo"
         callback = MagicMock()
         frame = DragDropFrame(root, on_drop_callback=callback)
 
-        frame.process_folder("/valid/git/repo")
+        with patch('gui.drag_drop.os.stat',
+                   side_effect=fake_stat(dirs={repo, os.path.join(repo, '.git')})):
+            frame.process_folder(repo)
 
-        callback.assert_called_once_with("/valid/git/repo")
+        callback.assert_called_once_with(repo)
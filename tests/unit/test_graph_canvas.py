@@ -80,9 +80,9 @@ class TestCanScroll:
         """Test vertical scroll detection with content larger than canvas."""
         canvas = GraphCanvas(root)
 
-        # Mock canvas size and scrollregion
-        canvas.canvas.winfo_height = MagicMock(return_value=500)
-        canvas.canvas.cget = MagicMock(return_value="0 0 800 1000")  # 1000px tall content
+        # Mock canvas size and cached scrollregion
+        canvas._canvas_height = 500
+        canvas._scroll_bounds = (0, 0, 800, 1000)  # 1000px tall content
 
         # Should be able to scroll (1000 > 500 + 10)
         assert canvas._can_scroll_vertically() is True
@@ -91,9 +91,9 @@ class TestCanScroll:
         """Test vertical scroll detection with content smaller than canvas."""
         canvas = GraphCanvas(root)
 
-        # Mock canvas size and scrollregion
-        canvas.canvas.winfo_height = MagicMock(return_value=500)
-        canvas.canvas.cget = MagicMock(return_value="0 0 800 400")  # 400px tall content
+        # Mock canvas size and cached scrollregion
+        canvas._canvas_height = 500
+        canvas._scroll_bounds = (0, 0, 800, 400)  # 400px tall content
 
         # Should NOT be able to scroll (400 < 500)
         assert canvas._can_scroll_vertically() is False
@@ -102,9 +102,9 @@ class TestCanScroll:
         """Test horizontal scroll detection with content wider than canvas."""
         canvas = GraphCanvas(root)
 
-        # Mock canvas size and scrollregion
-        canvas.canvas.winfo_width = MagicMock(return_value=600)
-        canvas.canvas.cget = MagicMock(return_value="0 0 1200 800")  # 1200px wide content
+        # Mock canvas size and cached scrollregion
+        canvas._canvas_width = 600
+        canvas._scroll_bounds = (0, 0, 1200, 800)  # 1200px wide content
 
         # Should be able to scroll (1200 > 600 + 10)
         assert canvas._can_scroll_horizontally() is True
@@ -113,9 +113,9 @@ class TestCanScroll:
         """Test horizontal scroll detection with content narrower than canvas."""
         canvas = GraphCanvas(root)
 
-        # Mock canvas size and scrollregion
-        canvas.canvas.winfo_width = MagicMock(return_value=600)
-        canvas.canvas.cget = MagicMock(return_value="0 0 500 800")  # 500px wide content
+        # Mock canvas size and cached scrollregion
+        canvas._canvas_width = 600
+        canvas._scroll_bounds = (0, 0, 500, 800)  # 500px wide content
 
         # Should NOT be able to scroll (500 < 600)
         assert canvas._can_scroll_horizontally() is False
@@ -124,20 +124,29 @@ class TestCanScroll:
         """Test scroll detection with empty scrollregion."""
         canvas = GraphCanvas(root)
 
-        # Mock empty scrollregion
-        canvas.canvas.cget = MagicMock(return_value="")
+        # No scrollregion set
+        canvas._scroll_bounds = None
 
         # Should NOT be able to scroll
         assert canvas._can_scroll_vertically() is False
         assert canvas._can_scroll_horizontally() is False
 
+    def test_set_scrollregion_caches_bounds(self, root):
+        """Test that setting scrollregion caches parsed bounds."""
+        canvas = GraphCanvas(root)
+
+        canvas._set_scrollregion(0, 0, 800, 1000)
+
+        assert canvas._scroll_bounds == (0, 0, 800, 1000)
+        assert [float(v) for v in canvas.canvas.cget('scrollregion').split()] == [0, 0, 800, 1000]
+
     def test_can_scroll_with_threshold(self, root):
         """Test that 10px threshold is applied."""
         canvas = GraphCanvas(root)
 
         # Mock canvas size and content just at threshold
-        canvas.canvas.winfo_height = MagicMock(return_value=500)
-        canvas.canvas.cget = MagicMock(return_value="0 0 800 505")  # 505px tall (only 5px more)
+        canvas._canvas_height = 500
+        canvas._scroll_bounds = (0, 0, 800, 505)  # 505px tall (only 5px more)
 
         # Should NOT be able to scroll (505 < 500 + 10)
         assert canvas._can_scroll_vertically() is False
@@ -151,9 +160,9 @@ class TestUpdateScrollbarsVisibility:
         canvas = GraphCanvas(root)
 
         # Mock canvas size and large vertical content
-        canvas.canvas.winfo_width = MagicMock(return_value=600)
-        canvas.canvas.winfo_height = MagicMock(return_value=500)
-        canvas.canvas.cget = MagicMock(return_value="0 0 800 1000")
+        canvas._canvas_width = 600
+        canvas._canvas_height = 500
+        canvas._scroll_bounds = (0, 0, 800, 1000)
 
         # Mock grid/grid_remove
         canvas.v_scrollbar.grid = MagicMock()
@@ -170,9 +179,9 @@ class TestUpdateScrollbarsVisibility:
         canvas = GraphCanvas(root)
 
         # Mock canvas size and small content
-        canvas.canvas.winfo_width = MagicMock(return_value=600)
-        canvas.canvas.winfo_height = MagicMock(return_value=500)
-        canvas.canvas.cget = MagicMock(return_value="0 0 500 400")
+        canvas._canvas_width = 600
+        canvas._canvas_height = 500
+        canvas._scroll_bounds = (0, 0, 500, 400)
 
         # Mock grid_remove
         canvas.v_scrollbar.grid_remove = MagicMock()
@@ -184,6 +193,22 @@ class TestUpdateScrollbarsVisibility:
         canvas.v_scrollbar.grid_remove.assert_called_once()
         canvas.h_scrollbar.grid_remove.assert_called_once()
 
+    def test_update_scrollbars_visibility_does_not_poll_unsized_canvas(self, root):
+        """Test that an unsized canvas waits for <Configure> instead of polling."""
+        canvas = GraphCanvas(root)
+
+        canvas._canvas_width = 1
+        canvas._canvas_height = 1
+        canvas.canvas.after = MagicMock()
+        canvas.after = MagicMock()
+        canvas.v_scrollbar.grid = MagicMock()
+
+        canvas._update_scrollbars_visibility()
+
+        canvas.canvas.after.assert_not_called()
+        canvas.after.assert_not_called()
+        canvas.v_scrollbar.grid.assert_not_called()
+
 
 class TestVerticalScroll:
     """Test vertical scrolling."""
@@ -195,14 +220,34 @@ class TestVerticalScroll:
         # Mock scroll capability
         canvas._can_scroll_vertically = MagicMock(return_value=True)
         canvas.canvas.yview_moveto = MagicMock()
-        canvas._update_column_separators = MagicMock()
+        canvas.canvas.after_idle = MagicMock()
 
         # Scroll to 50%
         canvas._on_v_scroll('moveto', '0.5')
 
-        # Verify scroll applied
+        # Verify scroll applied and header update deferred to idle
         canvas.canvas.yview_moveto.assert_called_once_with(0.5)
+        canvas.canvas.after_idle.assert_called_once_with(canvas._do_separator_redraw)
+
+    def test_on_v_scroll_coalesces_separator_updates(self, root):
+        """Test that rapid scrollbar events schedule a single header update."""
+        canvas = GraphCanvas(root)
+
+        canvas._can_scroll_vertically = MagicMock(return_value=True)
+        canvas.canvas.yview_moveto = MagicMock()
+        canvas.canvas.after_idle = MagicMock()
+        canvas._update_column_separators = MagicMock()
+
+        for position in ('0.1', '0.2', '0.3'):
+            canvas._on_v_scroll('moveto', position)
+
+        canvas.canvas.after_idle.assert_called_once()
+        canvas._update_column_separators.assert_not_called()
+
+        # Idle callback performs the update once and allows a new schedule
+        canvas._do_separator_redraw()
         canvas._update_column_separators.assert_called_once()
+        assert canvas._separator_redraw_pending is False
 
     def test_on_v_scroll_moveto_bounds_checking(self, root):
         """Test vertical scroll moveto with out-of-bounds values."""
@@ -289,6 +334,22 @@ class TestHorizontalScroll:
         # Should NOT scroll
         canvas.canvas.xview_moveto.assert_not_called()
 
+    def test_on_h_scroll_units_does_not_update_separators(self, root):
+        """Test horizontal scroll units without touching column separators."""
+        canvas = GraphCanvas(root)
+
+        canvas._can_scroll_horizontally = MagicMock(return_value=True)
+        canvas.canvas.xview = MagicMock(return_value=(0.2, 0.6))
+        canvas.canvas.xview_moveto = MagicMock()
+        canvas._update_column_separators = MagicMock()
+
+        # Scroll by one page
+        canvas._on_h_scroll('scroll', '1', 'pages')
+
+        canvas.canvas.xview_moveto.assert_called_once()
+        assert canvas.canvas.xview_moveto.call_args[0][0] == pytest.approx(0.6)
+        canvas._update_column_separators.assert_not_called()
+
 
 class TestMouseWheel:
     """Test mousewheel scrolling with momentum."""
@@ -306,6 +367,7 @@ class TestMouseWheel:
 
         # Scroll
         canvas.on_mousewheel(event)
+        canvas._flush_wheel()
 
         # Should start momentum scroll
         canvas._start_momentum_scroll.assert_called_once()
@@ -325,6 +387,7 @@ class TestMouseWheel:
 
         # Try to scroll
         canvas.on_mousewheel(event)
+        canvas._flush_wheel()
 
         # Should NOT start momentum scroll
         canvas._start_momentum_scroll.assert_not_called()
@@ -340,13 +403,15 @@ class TestMouseWheel:
         event = MagicMock()
         event.delta = 120
         canvas.on_mousewheel(event)
+        canvas._flush_wheel()
 
         initial_velocity = canvas.scroll_velocity
 
         # Quick second scroll (within 100ms)
         import time
-        canvas.last_scroll_time = time.time()
+        canvas.last_scroll_time = time.perf_counter()
         canvas.on_mousewheel(event)
+        canvas._flush_wheel()
 
         # Velocity should have increased (acceleration)
         assert abs(canvas.scroll_velocity) > abs(initial_velocity)
@@ -364,14 +429,39 @@ class TestMouseWheel:
         canvas.scroll_velocity = 0.15  # Start with high velocity
 
         import time
-        canvas.last_scroll_time = time.time()
+        canvas.last_scroll_time = time.perf_counter()
 
         # Scroll again
         canvas.on_mousewheel(event)
+        canvas._flush_wheel()
 
         # Velocity should be capped at 0.2 (max_velocity)
         assert abs(canvas.scroll_velocity) <= 0.2
 
+    def test_on_mousewheel_accumulates_burst(self, root):
+        """Test that a burst of wheel events is processed as one step."""
+        canvas = GraphCanvas(root)
+
+        canvas._can_scroll_vertically = MagicMock(return_value=True)
+        canvas._start_momentum_scroll = MagicMock()
+        canvas.after = MagicMock(return_value='flush_job')
+
+        event = MagicMock()
+        event.delta = -120  # Scroll down
+        for _ in range(3):
+            canvas.on_mousewheel(event)
+
+        # Only one flush scheduled, nothing processed yet
+        canvas.after.assert_called_once_with(10, canvas._flush_wheel)
+        canvas._start_momentum_scroll.assert_not_called()
+        assert canvas._pending_wheel_delta == 3
+
+        canvas._flush_wheel()
+
+        canvas._start_momentum_scroll.assert_called_once()
+        assert canvas._pending_wheel_delta == 0
+        assert canvas.scroll_velocity == pytest.approx(3 * 0.005)
+
 
 class TestMomentumScroll:
     """Test momentum-based scrolling."""
@@ -384,17 +474,19 @@ class TestMomentumScroll:
         canvas.scroll_velocity = 0.01
 
         # Mock canvas methods
-        canvas.canvas.yview = MagicMock(return_value=(0.2, 0.7))  # Current viewport
-        canvas.canvas.yview_moveto = MagicMock()
+        canvas._cur_top, canvas._viewport_h = 0.2, 0.5  # Current viewport
+        canvas._tk_call = MagicMock()
         canvas._update_column_separators = MagicMock()
 
-        # Perform step
-        canvas._perform_momentum_step()
+        # Perform step - exactly one frame elapsed
+        canvas._last_tick = 1.0
+        with patch('gui.graph_canvas.time.perf_counter', return_value=1.016):
+            canvas._perform_momentum_step()
 
         # Should apply velocity and move
-        canvas.canvas.yview_moveto.assert_called_once()
-        # New position should be 0.2 + 0.01 = 0.21
-        assert canvas.canvas.yview_moveto.call_args[0][0] == pytest.approx(0.21, abs=0.001)
+        # New position should be 0.2 + 0.01 = 0.21, i.e. 10 px of 1000 px scrollregion
+        canvas._tk_call.assert_any_call(canvas._canvas_path, 'scan', 'dragto', 0, 10, -1)
+        assert canvas._cur_top == pytest.approx(0.21, abs=0.001)
 
     def test_perform_momentum_step_deceleration(self, root):
         """Test that momentum decelerates over time."""
@@ -404,16 +496,90 @@ class TestMomentumScroll:
         canvas.scroll_velocity = 0.1
 
         # Mock canvas methods
-        canvas.canvas.yview = MagicMock(return_value=(0.2, 0.7))
-        canvas.canvas.yview_moveto = MagicMock()
+        canvas._cur_top, canvas._viewport_h = 0.2, 0.5
+        canvas._tk_call = MagicMock()
         canvas._update_column_separators = MagicMock()
 
-        # Perform step
-        canvas._perform_momentum_step()
+        # Perform step - exactly one frame elapsed
+        canvas._last_tick = 1.0
+        with patch('gui.graph_canvas.time.perf_counter', return_value=1.016):
+            canvas._perform_momentum_step()
 
         # Velocity should be reduced (0.85 deceleration factor)
         assert canvas.scroll_velocity == pytest.approx(0.1 * 0.85, abs=0.001)
 
+    def test_perform_momentum_step_scales_by_elapsed_time(self, root):
+        """Test that a late step covers the distance of the missed frames."""
+        canvas = GraphCanvas(root)
+        canvas.scroll_velocity = 0.01
+
+        canvas._cur_top, canvas._viewport_h = 0.2, 0.5
+        canvas._tk_call = MagicMock()
+        canvas._update_column_separators = MagicMock()
+
+        # Two frames elapsed since last step
+        canvas._last_tick = 1.0
+        with patch('gui.graph_canvas.time.perf_counter', return_value=1.032):
+            canvas._perform_momentum_step()
+
+        canvas._tk_call.assert_any_call(canvas._canvas_path, 'scan', 'dragto', 0, 20, -1)
+        assert canvas._cur_top == pytest.approx(0.22, abs=0.001)
+        assert canvas.scroll_velocity == pytest.approx(0.01 * 0.85 ** 2, abs=0.0001)
+        # Next step scheduled for the remainder of the frame via the registered command
+        canvas._tk_call.assert_called_with('after', 16, canvas._momentum_step_cmd)
+
+    def test_perform_momentum_step_drags_relative_to_scan_mark(self, root):
+        """Test that steps pan by pixel offset from a single scan mark."""
+        canvas = GraphCanvas(root)
+        canvas.scroll_velocity = 0.01
+        canvas._cur_top, canvas._viewport_h = 0.2, 0.5
+
+        canvas.canvas.scan_mark = MagicMock()
+        canvas._tk_call = MagicMock()
+        canvas._shift_column_separators = MagicMock()
+
+        canvas._last_tick = 1.0
+        with patch('gui.graph_canvas.time.perf_counter', return_value=1.016):
+            canvas._perform_momentum_step()
+        canvas.scroll_velocity = 0.01
+        with patch('gui.graph_canvas.time.perf_counter', return_value=1.032):
+            canvas._perform_momentum_step()
+
+        # Mark set once, offsets accumulate from it
+        canvas.canvas.scan_mark.assert_called_once_with(0, 0)
+        drags = [c[0] for c in canvas._tk_call.call_args_list if c[0][1] == 'scan']
+        assert [d[4] for d in drags] == [10, 20]
+        assert [c[0][0] for c in canvas._shift_column_separators.call_args_list] == [10, 10]
+
+    def test_perform_momentum_step_tracks_position_without_yview(self, root):
+        """Test that momentum steps use the cached position instead of querying yview."""
+        canvas = GraphCanvas(root)
+        canvas.scroll_velocity = 0.01
+        canvas._cur_top, canvas._viewport_h = 0.2, 0.5
+
+        canvas.canvas.yview = MagicMock(return_value=(0.0, 0.5))
+        canvas._tk_call = MagicMock()
+        canvas._update_column_separators = MagicMock()
+
+        canvas._last_tick = 1.0
+        with patch('gui.graph_canvas.time.perf_counter', return_value=1.016):
+            canvas._perform_momentum_step()
+
+        canvas.canvas.yview.assert_not_called()
+        assert canvas._cur_top == pytest.approx(0.21, abs=0.001)
+
+    def test_start_momentum_scroll_syncs_position(self, root):
+        """Test that starting the animation reads the view position once."""
+        canvas = GraphCanvas(root)
+        canvas.canvas.yview = MagicMock(return_value=(0.3, 0.6))
+        canvas._perform_momentum_step = MagicMock()
+
+        canvas._start_momentum_scroll()
+
+        canvas.canvas.yview.assert_called_once()
+        assert canvas._cur_top == pytest.approx(0.3)
+        assert canvas._viewport_h == pytest.approx(0.3)
+
     def test_perform_momentum_step_stops_at_zero(self, root):
         """Test that momentum stops when velocity is near zero."""
         canvas = GraphCanvas(root)
@@ -422,8 +588,8 @@ class TestMomentumScroll:
         canvas.scroll_velocity = 0.0001
 
         # Mock canvas methods
-        canvas.canvas.yview = MagicMock(return_value=(0.2, 0.7))
-        canvas.canvas.yview_moveto = MagicMock()
+        canvas._cur_top, canvas._viewport_h = 0.2, 0.5
+        canvas._tk_call = MagicMock()
 
         # Perform step
         canvas._perform_momentum_step()
@@ -433,6 +599,48 @@ class TestMomentumScroll:
         # Animation should be stopped
         assert canvas.scroll_animation_id is None
 
+    def test_perform_momentum_step_stops_below_one_pixel(self, root):
+        """Test that momentum stops once a step would move less than a pixel."""
+        canvas = GraphCanvas(root)
+        canvas._scroll_bounds = (0, 0, 500, 1000)
+
+        # 0.0008 * 1000 px = 0.8 px per frame
+        canvas.scroll_velocity = 0.0008
+        canvas._cur_top, canvas._viewport_h = 0.2, 0.5
+        canvas._tk_call = MagicMock()
+        canvas._update_column_separators = MagicMock()
+
+        canvas._perform_momentum_step()
+
+        assert canvas.scroll_velocity == 0
+        assert canvas.scroll_animation_id is None
+        canvas._tk_call.assert_not_called()
+
+    def test_perform_momentum_step_shifts_separators_until_settled(self, root):
+        """Test that separators are only translated during momentum and placed on settle."""
+        canvas = GraphCanvas(root)
+        canvas._scroll_bounds = (0, 0, 500, 2000)
+        canvas.scroll_velocity = 0.01
+
+        canvas._cur_top, canvas._viewport_h = 0.2, 0.5
+        canvas._tk_call = MagicMock()
+        canvas.graph_drawer._current_commits = [MagicMock()]
+        canvas.graph_drawer.shift_column_separators = MagicMock()
+        canvas._update_column_separators = MagicMock()
+
+        # Intermediate step - relative shift only
+        canvas._last_tick = 1.0
+        with patch('gui.graph_canvas.time.perf_counter', return_value=1.016):
+            canvas._perform_momentum_step()
+        canvas.graph_drawer.shift_column_separators.assert_called_once()
+        assert canvas.graph_drawer.shift_column_separators.call_args[0][1] == pytest.approx(20)
+        canvas._update_column_separators.assert_not_called()
+
+        # Final step - exact placement
+        canvas.scroll_velocity = 0.0001
+        canvas._perform_momentum_step()
+        canvas._update_column_separators.assert_called_once()
+
     def test_reset_scroll_velocity(self, root):
         """Test that velocity is reset."""
         canvas = GraphCanvas(root)
@@ -457,7 +665,7 @@ class TestUpdateGraph:
         canvas = GraphCanvas(root)
 
         # Mock graph drawer
-        canvas.graph_drawer.draw_graph = MagicMock()
+        canvas.graph_drawer.draw_graph = MagicMock(return_value=(25, 42, 800, 600))
         canvas.graph_drawer.setup_column_resize_events = MagicMock()
         canvas._update_scrollbars_visibility = MagicMock()
 
@@ -474,7 +682,7 @@ class TestUpdateGraph:
 
         # Mock canvas.delete
         canvas.canvas.delete = MagicMock()
-        canvas.graph_drawer.draw_graph = MagicMock()
+        canvas.graph_drawer.draw_graph = MagicMock(return_value=(25, 42, 800, 600))
         canvas.graph_drawer.setup_column_resize_events = MagicMock()
 
         # Update graph
@@ -488,7 +696,7 @@ class TestUpdateGraph:
         canvas = GraphCanvas(root)
 
         canvas.canvas.delete = MagicMock()
-        canvas.graph_drawer.draw_graph = MagicMock()
+        canvas.graph_drawer.draw_graph = MagicMock(return_value=(25, 42, 800, 600))
         canvas._update_scrollbars_visibility = MagicMock()
 
         # Update with empty list
@@ -501,6 +709,27 @@ class TestUpdateGraph:
         # Scrollbars should be updated
         canvas._update_scrollbars_visibility.assert_called_once()
 
+    def test_update_graph_stops_momentum_scroll(self, root, mock_commits):
+        """Test that update_graph cancels a running momentum animation and scan state."""
+        canvas = GraphCanvas(root)
+        canvas.graph_drawer.draw_graph = MagicMock(return_value=(25, 42, 800, 600))
+        canvas.graph_drawer.setup_column_resize_events = MagicMock()
+
+        canvas.scroll_velocity = 0.5
+        canvas.scroll_animation_id = canvas._tk_call('after', 10000, canvas._momentum_step_cmd)
+        animation_id = canvas.scroll_animation_id
+        canvas._scan_origin_top = 0.3
+        canvas._scan_offset = 120
+
+        canvas.update_graph(mock_commits)
+
+        assert canvas.scroll_animation_id is None
+        assert canvas.scroll_velocity == 0
+        assert canvas._scan_origin_top is None
+        assert canvas._scan_offset == 0
+        pending = canvas._tk_call('after', 'info')
+        assert animation_id not in canvas.tk.splitlist(pending)
+
     def test_update_graph_resets_scroll_position(self, root, mock_commits):
         """Test that update_graph resets scroll to top."""
         canvas = GraphCanvas(root)
@@ -508,7 +737,7 @@ class TestUpdateGraph:
         # Mock canvas methods
         canvas.canvas.yview_moveto = MagicMock()
         canvas.canvas.xview_moveto = MagicMock()
-        canvas.graph_drawer.draw_graph = MagicMock()
+        canvas.graph_drawer.draw_graph = MagicMock(return_value=(25, 42, 800, 600))
         canvas.graph_drawer.setup_column_resize_events = MagicMock()
 
         # Update graph
@@ -518,6 +747,62 @@ class TestUpdateGraph:
         canvas.canvas.yview_moveto.assert_called_with(0)
         canvas.canvas.xview_moveto.assert_called_with(0)
 
+    def test_update_graph_does_not_flush_idle_tasks(self, root, mock_commits):
+        """Test that view writes happen before reads without a forced idle-task flush."""
+        canvas = GraphCanvas(root)
+
+        calls = []
+        canvas.graph_drawer.draw_graph = MagicMock(return_value=(25, 42, 800, 600))
+        canvas.graph_drawer.setup_column_resize_events = MagicMock()
+        canvas.canvas.yview_moveto = MagicMock(side_effect=lambda *a: calls.append('yview_moveto'))
+        canvas.canvas.xview_moveto = MagicMock(side_effect=lambda *a: calls.append('xview_moveto'))
+        canvas.canvas.update_idletasks = MagicMock(side_effect=lambda: calls.append('update_idletasks'))
+        canvas._update_scrollbars_visibility = MagicMock(side_effect=lambda: calls.append('visibility'))
+
+        canvas.update_graph(mock_commits)
+
+        assert calls == ['yview_moveto', 'xview_moveto', 'visibility']
+
+    def test_update_graph_uses_drawn_extent_for_scrollregion(self, root, mock_commits):
+        """Test that scrollregion comes from draw_graph extent, not a bbox walk."""
+        canvas = GraphCanvas(root)
+
+        canvas.graph_drawer.draw_graph = MagicMock(return_value=(25, 42, 800, 600))
+        canvas.graph_drawer.setup_column_resize_events = MagicMock()
+        canvas._get_content_bbox_without_header = MagicMock()
+
+        canvas.update_graph(mock_commits)
+
+        canvas._get_content_bbox_without_header.assert_not_called()
+        assert canvas._scroll_bounds == (5, 22, 820, 620)
+
+
+
+class TestContentBbox:
+    """Test content bounding box without header."""
+
+    def test_content_bbox_excludes_header(self, root):
+        """Test that header items do not contribute to content bbox."""
+        canvas = GraphCanvas(root)
+        canvas.canvas.delete('all')
+
+        canvas.canvas.create_rectangle(10, 20, 110, 220, outline='')
+        canvas.canvas.create_rectangle(50, 40, 300, 100, outline='')
+        canvas.canvas.create_rectangle(0, 0, 2000, 25, outline='', tags=("column_header",))
+
+        x1, y1, x2, y2 = canvas._get_content_bbox_without_header()
+
+        assert x1 <= 10 and y1 <= 20
+        assert 300 <= x2 < 2000 and y2 >= 220
+
+    def test_content_bbox_only_header(self, root):
+        """Test that bbox is None when only header is drawn."""
+        canvas = GraphCanvas(root)
+        canvas.canvas.delete('all')
+        canvas.canvas.create_rectangle(0, 0, 2000, 25, tags=("column_header",))
+
+        assert canvas._get_content_bbox_without_header() is None
+
 
 class TestOnDrop:
     """Test drag & drop functionality."""
@@ -603,7 +888,7 @@ class TestOnCanvasResize:
         """Test that canvas resize updates column separators."""
         canvas = GraphCanvas(root)
 
-        canvas._update_column_separators = MagicMock()
+        canvas._schedule_separator_redraw = MagicMock()
         canvas._update_scrollbars_visibility = MagicMock()
 
         # Mock event
@@ -613,9 +898,24 @@ class TestOnCanvasResize:
         canvas.on_canvas_resize(event)
 
         # Should update separators and scrollbars
-        canvas._update_column_separators.assert_called_once()
+        canvas._schedule_separator_redraw.assert_called_once()
         canvas._update_scrollbars_visibility.assert_called_once()
 
+    def test_on_canvas_resize_caches_size(self, root):
+        """Test that canvas resize caches the new canvas size."""
+        canvas = GraphCanvas(root)
+
+        canvas._update_column_separators = MagicMock()
+        canvas._update_scrollbars_visibility = MagicMock()
+
+        event = MagicMock()
+        event.width = 640
+        event.height = 480
+
+        canvas.on_canvas_resize(event)
+
+        assert (canvas._canvas_width, canvas._canvas_height) == (640, 480)
+
 
 class TestGraphCanvasIntegration:
     """Integration tests for GraphCanvas."""
@@ -625,7 +925,7 @@ class TestGraphCanvasIntegration:
         canvas = GraphCanvas(root)
 
         # Mock necessary methods
-        canvas.graph_drawer.draw_graph = MagicMock()
+        canvas.graph_drawer.draw_graph = MagicMock(return_value=(25, 42, 800, 600))
         canvas.graph_drawer.setup_column_resize_events = MagicMock()
         canvas._can_scroll_vertically = MagicMock(return_value=True)
 
@@ -643,15 +943,15 @@ class TestGraphCanvasIntegration:
         canvas = GraphCanvas(root)
 
         # Mock canvas size
-        canvas.canvas.winfo_width = MagicMock(return_value=600)
-        canvas.canvas.winfo_height = MagicMock(return_value=500)
+        canvas._canvas_width = 600
+        canvas._canvas_height = 500
 
         # Initially small content - scrollbars hidden
-        canvas.canvas.cget = MagicMock(return_value="0 0 500 400")
+        canvas._scroll_bounds = (0, 0, 500, 400)
         canvas._update_scrollbars_visibility()
 
         # Now large content - scrollbars should show
-        canvas.canvas.cget = MagicMock(return_value="0 0 800 1000")
+        canvas._scroll_bounds = (0, 0, 800, 1000)
         canvas._update_scrollbars_visibility()
 
         # Scrollbars should have been shown (grid called)
@@ -120,12 +120,14 @@ class TestBuildFullHashMap:
 
     def test_build_full_hash_map(self, mock_git_repo, mock_git_commits):
         """Test building short-to-full hash map."""
-        # Setup mock iteration
-        mock_git_repo.iter_commits.return_value = mock_git_commits
+        # Setup mock rev-list output
+        mock_git_repo.git.rev_list.return_value = "\n".join(c.hexsha for c in mock_git_commits)
 
         detector = MergeDetector(mock_git_repo, [])
         hash_map = detector.build_full_hash_map()
 
+        mock_git_repo.git.rev_list.assert_called_once_with('--branches', '--remotes=origin')
+
         assert isinstance(hash_map, dict)
         # Should map short hash to full hash
         for commit in mock_git_commits:
@@ -218,20 +220,16 @@ class TestGetCommitsInBranchesWithHead:
 
     def test_get_main_line_commits(self, mock_git_repo, mock_git_commits):
         """Test getting commits in first-parent path."""
-        # Setup mock to return commits
-        def iter_commits_side_effect(branch):
-            if branch.name == "main":
-                return mock_git_commits[:3]
-            return []
-
-        mock_git_repo.iter_commits.side_effect = iter_commits_side_effect
+        # Setup mock first-parent rev-list output
+        mock_git_repo.git.rev_list.return_value = "\n".join(c.hexsha for c in mock_git_commits[:3])
 
         detector = MergeDetector(mock_git_repo, [])
         main_line = detector.get_commits_in_branches_with_head()
 
         assert isinstance(main_line, set)
-        # Should include commits from main branch
-        assert len(main_line) > 0
+        mock_git_repo.git.rev_list.assert_called_once_with('--first-parent', '--branches')
+        # Should include short hashes of main line commits
+        assert main_line == {c.hexsha[:8] for c in mock_git_commits[:3]}
 
 
 class TestExtractBranchNameFromMerge:
@@ -7,9 +7,13 @@ import pytest
 import os
 import tempfile
 import shutil
+import subprocess
+import sys
+import threading
+import time
 from unittest.mock import MagicMock, patch, call
 from pathlib import Path
-from gui.repo_manager import RepositoryManager
+from gui.repo_manager import RepositoryManager, _LoaderThread
 
 
 class TestRepositoryManagerInitialization:
@@ -506,6 +510,38 @@ class TestRepositoryLoading:
         mock_repo.load_repository.assert_called_once()
         mock_repo.parse_commits.assert_called_once()
 
+    @patch('gui.repo_manager.GraphLayout')
+    def test_layout_commits_reports_progress(self, mock_layout, mock_parent_window):
+        """Test that layout phase posts a status update before computing positions."""
+        manager = RepositoryManager(mock_parent_window)
+        manager.root.after = MagicMock()
+        manager.git_repo = MagicMock()
+        manager.git_repo.get_merge_branches.return_value = []
+        mock_layout.return_value.calculate_positions.return_value = ['positioned']
+
+        result = manager._layout_commits([MagicMock(), MagicMock()])
+
+        assert result == ['positioned']
+        status_calls = [c for c in manager.root.after.call_args_list
+                        if len(c[0]) >= 2 and c[0][1] == manager.parent.update_status]
+        assert len(status_calls) == 1
+        assert '2' in status_calls[0][0][2]
+
+    @patch('gui.repo_manager.GraphLayout')
+    def test_refresh_local_repository_passes_stats(self, mock_layout, mock_parent_window):
+        """Test that repository stats are computed on the worker and handed to show_graph."""
+        manager = RepositoryManager(mock_parent_window)
+        manager.root.after = MagicMock()
+        manager.git_repo = MagicMock()
+        manager.git_repo.parse_commits.return_value = [MagicMock()]
+        manager.git_repo.get_merge_branches.return_value = []
+        manager.git_repo.get_repository_stats.return_value = {'commits': 1}
+        mock_layout.return_value.calculate_positions.return_value = ['positioned']
+
+        manager.refresh_local_repository()
+
+        manager.root.after.assert_called_with(0, manager.parent.show_graph, ['positioned'], {'commits': 1})
+
     @patch('gui.repo_manager.GitRepository')
     def test_load_repository_failure(self, mock_git_repo_class, mock_parent_window):
         """Test repository loading failure."""
@@ -536,12 +572,26 @@ class TestRepositoryLoading:
         manager.is_remote_loaded = False
 
         with patch.object(manager, 'refresh_local_repository') as mock_refresh:
-            with patch('gui.repo_manager.threading.Thread') as mock_thread:
+            with patch.object(manager, '_loader') as mock_loader:
                 manager.refresh_repository()
 
-                # Should start local refresh thread
-                mock_thread.assert_called_once()
-                mock_thread.return_value.start.assert_called_once()
+                # Should submit local refresh to the loader thread
+                mock_loader.submit.assert_called_once_with(mock_refresh)
+
+    def test_submit_load_cancels_pending_load(self, mock_parent_window):
+        """Test that a new load cancels the one still waiting in the loader."""
+        manager = RepositoryManager(mock_parent_window)
+
+        with patch.object(manager, '_loader') as mock_loader:
+            first, second = MagicMock(), MagicMock()
+            mock_loader.submit.side_effect = [first, second]
+
+            manager._submit_load(manager.load_repository, "/repo/a")
+            manager._submit_load(manager.load_repository, "/repo/b")
+
+            first.cancel.assert_called_once()
+            second.cancel.assert_not_called()
+            assert manager._pending_load is second
 
     def test_refresh_repository_remote(self, mock_parent_window):
         """Test refreshing remote repository."""
@@ -596,3 +646,58 @@ class TestCloseRepository:
         # Should have closed GitPython repo
         mock_repo_object.close.assert_called_once()
         assert manager.git_repo is None
+
+
+class TestLoaderShutdown:
+    """Tests for the loader thread and shutting it down on window close."""
+
+    def test_loader_cancels_pending_on_shutdown(self):
+        """Test that shutdown cancels queued loads and returns without waiting."""
+        loader = _LoaderThread('test-loader')
+        release = threading.Event()
+        started = threading.Event()
+
+        running = loader.submit(lambda: (started.set(), release.wait(10)))
+        pending = loader.submit(lambda: None)
+        assert started.wait(5)
+
+        start = time.monotonic()
+        loader.shutdown()
+        assert time.monotonic() - start < 1.0
+
+        assert pending.cancelled()
+        assert not running.cancelled()
+        release.set()
+        running.result(timeout=5)
+
+    def test_shutdown_delegates_to_loader(self):
+        """Test that RepositoryManager.shutdown stops the loader and forgets the pending load."""
+        manager = RepositoryManager.__new__(RepositoryManager)
+        manager._loader = MagicMock()
+        manager._pending_load = MagicMock()
+
+        manager.shutdown()
+
+        manager._loader.shutdown.assert_called_once()
+        assert manager._pending_load is None
+
+    def test_process_exits_promptly_with_load_pending(self):
+        """Test that the process exits while a load is still running and another is queued."""
+        src_path = Path(__file__).parent.parent.parent / "src"
+        code = (
+            "import sys, threading\n"
+            f"sys.path.insert(0, {str(src_path)!r})\n"
+            "from gui.repo_manager import _LoaderThread\n"
+            "loader = _LoaderThread('gitvys-loader')\n"
+            "started = threading.Event()\n"
+            "loader.submit(lambda: (started.set(), threading.Event().wait(60)))\n"
+            "loader.submit(lambda: None)\n"
+            "started.wait(5)\n"
+            "loader.shutdown()\n"
+        )
+
+        start = time.monotonic()
+        result = subprocess.run([sys.executable, "-c", code], timeout=30)
+
+        assert result.returncode == 0
+        assert time.monotonic() - start < 15
@@ -202,6 +202,47 @@ class TestStatsUpdate:
         assert "3" in stats_text
         assert "123" in stats_text
 
+    def test_format_stats_skips_tags_when_none(self, mock_parent_window):
+        """Test that tags are omitted from stats text when repo has none."""
+        display = StatsDisplay(mock_parent_window)
+        display.tm.get_plural = MagicMock(side_effect=lambda count, form: f"{form}")
+
+        stats_text = display._format_stats({
+            'authors': 2,
+            'branches': 1,
+            'tags': 0,
+            'local_tags': 0,
+            'remote_tags': 0,
+            'commits': 7
+        })
+
+        assert stats_text == "2 author, 1 branch, 7 commit"
+
+
+    def test_update_stats_uses_precomputed_stats(self, mock_parent_window):
+        """Test that precomputed stats skip the repository scan."""
+        display = StatsDisplay(mock_parent_window)
+        parent_frame = ttk.Frame(mock_parent_window.root)
+        info_frame, repo_label, stats_label = display.create_stats_ui(parent_frame)
+
+        display.tm.get_plural = MagicMock(side_effect=lambda count, form: f"{form}")
+
+        mock_repo = MagicMock()
+        mock_repo.repo_path = "/test"
+        stats = {
+            'authors': 4,
+            'branches': 2,
+            'tags': 0,
+            'local_tags': 0,
+            'remote_tags': 0,
+            'commits': 42
+        }
+
+        display.update_stats(mock_repo, display_name=None, stats=stats)
+
+        mock_repo.get_repository_stats.assert_not_called()
+        assert "42" in stats_label.cget('text')
+
 
 class TestTooltip:
     """Tests for repository path tooltip."""